@@ -11,6 +11,12 @@ import random
 from typing import List, Tuple, Dict
 from dataclasses import dataclass, field
 from scipy.spatial import KDTree
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.lod import lod_count
+from scenes.templates.static_layer import StaticLayerMixin
 
 # 数字仿生系列颜色主题 - 保持与前两集一致
 BIO_CYAN = ManimColor("#00FFE5")      # 生命青
@@ -231,7 +237,7 @@ class SwarmSystem:
         return force
 
 
-class DigitalBiomimeticsEP03(Scene):
+class DigitalBiomimeticsEP03(StaticLayerMixin, Scene):
     """数字仿生系列 第3集"""
     
     def construct(self):
@@ -271,6 +277,8 @@ class DigitalBiomimeticsEP03(Scene):
         swarm_bg = self.create_swarm_background()
         swarm_bg.set_opacity(0.2)
         self.play(Create(swarm_bg), run_time=2)
+        # 背景此后保持不变，冻结为缓存位图
+        self.freeze_layer(swarm_bg)
         
         # 系列标题
         series_title = Text(
@@ -478,8 +486,9 @@ class DigitalBiomimeticsEP03(Scene):
         title.to_edge(UP, buff=0.5)
         
         # 显示参数
+        num_boids = lod_count(500, minimum=60)
         params = VGroup(
-            MathTex(r"N = 500", font_size=20, color=BIO_WHITE),
+            MathTex(rf"N = {num_boids}", font_size=20, color=BIO_WHITE),
             MathTex(r"v_{max} = 2.0", font_size=20, color=BIO_WHITE),
             MathTex(r"r_{perception} = 1.5", font_size=20, color=BIO_WHITE)
         ).arrange(RIGHT, buff=1)
@@ -491,7 +500,7 @@ class DigitalBiomimeticsEP03(Scene):
         t_tracker = ValueTracker(0)
         
         # 创建鱼群系统
-        swarm = SwarmSystem(num_boids=500, boundary=7)
+        swarm = SwarmSystem(num_boids=num_boids, boundary=7)
         
         def create_fish_swarm():
             t = t_tracker.get_value()
@@ -9,6 +9,12 @@ from manim import *
 import numpy as np
 import random
 from typing import List, Tuple
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.lod import lod_count
+from scenes.templates.static_layer import StaticLayerMixin
 
 
 # 复用系列通用色彩（与EP01-EP03保持一致）
@@ -35,7 +41,7 @@ NORMAL_SIZE = 24
 SMALL_SIZE = 20
 
 
-class DigitalBiomimeticsEP04(Scene):
+class DigitalBiomimeticsEP04(StaticLayerMixin, Scene):
     """数字仿生系列 第4集"""
 
     def construct(self):
@@ -55,6 +61,8 @@ class DigitalBiomimeticsEP04(Scene):
         heart_bg = self.create_heart_background()
         heart_bg.set_opacity(0.18)
         self.play(Create(heart_bg), run_time=2)
+        # 背景此后保持不变，冻结为缓存位图
+        self.freeze_layer(heart_bg)
 
         series_title = Text(
             "数字仿生",
@@ -253,10 +261,11 @@ class DigitalBiomimeticsEP04(Scene):
 
         def create_spiral_wave():
             t = t_tracker.get_value()
-            num_points = 1400
+            num_points = lod_count(1400, minimum=280)
             cx, cy = -1.0, -0.2
             particles = VGroup()
-            for i in range(num_points):
+            # 抽样时保持原始的 i 取值范围，螺旋形状不随点数变化
+            for i in np.arange(num_points) * (1400 / num_points):
                 a = 2*np.pi * (i / 280) + 0.3 * np.sin(i * 0.013)
                 r = 0.15 * (i / 30) + 0.2 * np.sin(i * 0.021)
                 x = cx + r * np.cos(a + 0.5*t)
@@ -9,6 +9,12 @@ from manim import *
 import numpy as np
 import random
 from typing import List, Tuple, Dict
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.phyllotaxis import PhyllotaxisHead
+from scenes.templates.static_layer import StaticLayerMixin
 
 
 # 系列通用色彩
@@ -34,7 +40,7 @@ NORMAL_SIZE = 24
 SMALL_SIZE = 20
 
 
-class DigitalBiomimeticsEP05(Scene):
+class DigitalBiomimeticsEP05(StaticLayerMixin, Scene):
     """数字仿生系列 第5集"""
 
     def construct(self):
@@ -53,6 +59,8 @@ class DigitalBiomimeticsEP05(Scene):
         bg = self.create_leaf_background()
         bg.set_opacity(0.18)
         self.play(Create(bg), run_time=2)
+        # 背景此后保持不变，冻结为缓存位图
+        self.freeze_layer(bg)
 
         series_title = Text("数字仿生", font_size=60, color=BIO_CYAN, weight=BOLD).move_to([0, 1, 0])
         subtitle = Text("DIGITAL BIOMIMETICS", font_size=24, color=BIO_WHITE, font="Arial").next_to(series_title, DOWN, buff=0.3)
@@ -219,29 +227,27 @@ class DigitalBiomimeticsEP05(Scene):
 
         t_tracker = ValueTracker(0.0)
 
-        def create_phyllotaxis():
+        # 整个花盘只有几十个按颜色分组的子对象，每帧只重算种子位置和半径
+        n_points = 1600
+        c = 0.06
+        k = np.arange(n_points)
+        head = PhyllotaxisHead(n_points, scale=c, colors=[LEAF_GREEN, FLOWER_GOLD], color_bins=32,
+                               fill_opacity=0.85)
+
+        def update_phyllotaxis(mob):
             t = t_tracker.get_value()
-            n_points = 1600
-            alpha = np.deg2rad(137.5 + 3.0*np.sin(0.3*t))  # 微调角度，展现鲁棒性
-            c = 0.06
-            vg = VGroup()
-            for k in range(n_points):
-                theta = k * alpha
-                r = c * np.sqrt(k)
-                x = r * np.cos(theta)
-                y = r * np.sin(theta)
-                depth = np.clip(k / n_points, 0, 1)
-                color = interpolate_color(LEAF_GREEN, FLOWER_GOLD, depth)
-                radius = 0.018 + 0.012*np.sin(0.8*t + k*0.03)
-                dot = Dot(point=[x, y, 0], radius=radius, color=color, fill_opacity=0.85)
-                vg.add(dot)
-            # 外层花托柔光
-            halo = Circle(radius=c*np.sqrt(n_points)+0.15, color=FLOWER_GOLD, stroke_width=2)
-            halo.set_opacity(0.15)
-            vg.add(halo)
-            return vg
-
-        phyl = always_redraw(create_phyllotaxis)
+            mob.set_state(
+                angle=np.deg2rad(137.5 + 3.0*np.sin(0.3*t)),  # 微调角度，展现鲁棒性
+                radius=0.018 + 0.012*np.sin(0.8*t + k*0.03),
+            )
+
+        update_phyllotaxis(head)
+        head.add_updater(update_phyllotaxis)
+        # 外层花托柔光
+        halo = Circle(radius=c*np.sqrt(n_points)+0.15, color=FLOWER_GOLD, stroke_width=2)
+        halo.set_opacity(0.15)
+        phyl = VGroup(head, halo)
+
         subtitle = Text("鲁棒最优填充：角度扰动下依然均匀", font_size=SMALL_SIZE, color=BIO_WHITE)
         subtitle.to_edge(DOWN, buff=0.5)
 
@@ -8,6 +8,11 @@ Digital Biomimetics EP06: Visualization of the Butterfly Effect
 from manim import *
 import numpy as np
 from typing import List, Tuple
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.lod import lod_subsample
 
 
 # 系列通用色彩
@@ -157,9 +162,9 @@ class DigitalBiomimeticsEP06(Scene):
         points = self._generate_lorenz_points(num_steps=3500, dt=0.01,
                                               sigma=10.0, rho=28.0, beta=8/3,
                                               start=np.array([0.1, 0.0, 0.0]))
-        # 以 (x,z) 作二维相图
+        # 以 (x,z) 作二维相图；积分步长不变，只按细节层级抽稀显示点
         scale = 0.08
-        points2d = [axes.c2p(p[0]*scale, p[2]*scale) for p in points]
+        points2d = [axes.c2p(p[0]*scale, p[2]*scale) for p in lod_subsample(points)]
 
         t_tracker = ValueTracker(0.0)
 
@@ -216,8 +221,8 @@ class DigitalBiomimeticsEP06(Scene):
         p2 = self._generate_lorenz_points(2200, 0.01, 10.0, 28.0, 8/3, base + eps)
         scale = 0.08
         # 使用 (x,z) 作二维相图
-        p1v = [axes.c2p(px*scale, pz*scale) for (px, py, pz) in p1]
-        p2v = [axes.c2p(px*scale, pz*scale) for (px, py, pz) in p2]
+        p1v = [axes.c2p(px*scale, pz*scale) for (px, py, pz) in lod_subsample(p1)]
+        p2v = [axes.c2p(px*scale, pz*scale) for (px, py, pz) in lod_subsample(p2)]
 
         t_tracker = ValueTracker(0.0)
 
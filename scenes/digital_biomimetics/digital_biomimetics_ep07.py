@@ -9,6 +9,12 @@ from manim import *
 import numpy as np
 import random
 from typing import List, Tuple
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.neural_network import NeuralNetworkGraph
+from scenes.templates.static_layer import StaticLayerMixin
 
 
 # 系列通用色彩
@@ -33,7 +39,7 @@ NORMAL_SIZE = 24
 SMALL_SIZE = 20
 
 
-class DigitalBiomimeticsEP07(Scene):
+class DigitalBiomimeticsEP07(StaticLayerMixin, Scene):
     """数字仿生系列 第7集"""
 
     def construct(self):
@@ -63,6 +69,8 @@ class DigitalBiomimeticsEP07(Scene):
         bg = self.create_brain_spark_background()
         bg.set_opacity(0.2)
         self.play(Create(bg), run_time=2)
+        # 背景此后保持不变，冻结为缓存位图
+        self.freeze_layer(bg)
 
         series_title = Text("数字仿生", font_size=60, color=BIO_CYAN, weight=BOLD).move_to([0, 1, 0])
         subtitle = Text("DIGITAL BIOMIMETICS", font_size=24, color=BIO_WHITE, font="Arial").next_to(series_title, DOWN, buff=0.3)
@@ -282,90 +290,41 @@ class DigitalBiomimeticsEP07(Scene):
 
         # 时间追踪器
         t_tracker = ValueTracker(0)
-        
-        # 创建神经网络
-        def create_network():
+
+        # 网络结构只建一次：4 层 × 5 个神经元，层间全连接的边是静态的
+        positions = [
+            [[-4 + layer * 2.5, -2 + node * 1, 0] for node in range(5)]
+            for layer in range(4)
+        ]
+        network = NeuralNetworkGraph(
+            positions=positions,
+            node_radius=0.15,
+            node_colors=NEURAL_GREEN,
+            node_fill_opacity=0.5,
+            edge_color=ELECTRIC_BLUE,
+            edge_width=2,
+            edge_opacity=0.35,
+            active_color=SPARK_YELLOW,
+            glow_radius=0.25,
+            pulse_radius=0.05,
+            pulse_color=SPARK_YELLOW,
+        )
+
+        # 逐帧只重算激活高亮和传播粒子
+        layer_of = np.repeat(np.arange(4), 5)
+        node_of = np.tile(np.arange(5), 4)
+        particle_layer, particle_id = np.divmod(np.arange(3 * 8), 8)
+        particle_edges = network.edge_index(particle_layer, particle_id % 5, (particle_id + 1) % 5)
+
+        def update_signals(mob):
             t = t_tracker.get_value()
-            network = VGroup()
-            
-            # 创建神经元节点
-            neurons = []
-            for layer in range(4):
-                layer_neurons = []
-                for node in range(5):
-                    x = -4 + layer * 2.5
-                    y = -2 + node * 1
-                    neuron = Circle(
-                        radius=0.15,
-                        color=NEURAL_GREEN,
-                        fill_opacity=0.5
-                    )
-                    neuron.move_to([x, y, 0])
-                    
-                    # 添加激活效果
-                    activation_time = t + layer * 0.5 + node * 0.2
-                    if np.sin(activation_time * 2) > 0.5:
-                        neuron.set_fill_color(SPARK_YELLOW)
-                        neuron.set_fill_opacity(0.9)
-                        # 添加发光效果
-                        glow = Circle(
-                            radius=0.25,
-                            color=SPARK_YELLOW,
-                            fill_opacity=0.2,
-                            stroke_opacity=0
-                        )
-                        glow.move_to([x, y, 0])
-                        network.add(glow)
-                    
-                    network.add(neuron)
-                    layer_neurons.append([x, y, 0])
-                neurons.append(layer_neurons)
-            
-            # 创建连接线（使用确定性模式，避免random）
-            for layer in range(3):
-                for from_node in range(5):
-                    for to_node in range(5):
-                        from_pos = neurons[layer][from_node]
-                        to_pos = neurons[layer + 1][to_node]
-                        
-                        # 使用确定性条件激活连接
-                        connection_id = layer * 25 + from_node * 5 + to_node
-                        signal_time = t + layer * 0.3 + connection_id * 0.1
-                        
-                        # 用sin函数代替random，使某些连接周期性激活
-                        if np.sin(signal_time * 2 + connection_id) > 0.3:
-                            connection = Line(
-                                from_pos,
-                                to_pos,
-                                color=ELECTRIC_BLUE,
-                                stroke_width=2,
-                                stroke_opacity=0.3 + 0.4 * np.sin(signal_time * 3)
-                            )
-                            network.add(connection)
-            
-            # 添加传播粒子
-            for layer in range(3):
-                for particle_id in range(8):
-                    # 粒子在连接间移动
-                    progress = (t * 0.5 + particle_id * 0.2) % 2
-                    if progress < 1:
-                        from_pos = neurons[layer][particle_id % 5]
-                        to_pos = neurons[layer + 1][(particle_id + 1) % 5]
-                        
-                        particle_x = from_pos[0] + progress * (to_pos[0] - from_pos[0])
-                        particle_y = from_pos[1] + progress * (to_pos[1] - from_pos[1])
-                        
-                        particle = Dot(
-                            [particle_x, particle_y, 0],
-                            radius=0.05,
-                            color=SPARK_YELLOW,
-                            fill_opacity=0.8
-                        )
-                        network.add(particle)
-            
-            return network
-        
-        network = always_redraw(create_network)
+            network.set_active(np.sin((t + layer_of * 0.5 + node_of * 0.2) * 2) > 0.5)
+            # 进度落在 [1, 2) 的粒子处于间歇期，不显示
+            progress = (t * 0.5 + particle_id * 0.2) % 2
+            network.set_pulses(particle_edges, np.where(progress < 1, progress, -1))
+
+        update_signals(network.signals)
+        network.signals.add_updater(update_signals)
         
         # 说明文字
         description = Text("信息像波浪一样在神经网络中传播", font_size=SMALL_SIZE, color=BIO_WHITE)
@@ -381,6 +340,7 @@ class DigitalBiomimeticsEP07(Scene):
             rate_func=linear
         )
         
+        network.signals.clear_updaters()
         self.wait(2)
         self.play(
             FadeOut(title),
@@ -1,5 +1,10 @@
 from manim import *
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.phyllotaxis import PhyllotaxisHead, SeedReveal
 
 class SunflowerGoldenSpiralChinese(Scene):
     """向日葵中的螺旋密码 - 中文版"""
@@ -239,53 +244,28 @@ class SunflowerGoldenSpiralChinese(Scene):
         center = Dot(ORIGIN, radius=0.05, color=ORANGE)
         self.play(Create(center))
         
-        # 种子容器
-        seeds = VGroup()
-        clockwise_spirals = []  # 顺时针螺旋
-        counter_spirals = []    # 逆时针螺旋
-        
-        # 创建种子
-        for i in range(1, n_seeds + 1):
-            angle = i * golden_angle
-            radius = scale_factor * np.sqrt(i)
-            
-            x = radius * np.cos(angle)
-            y = radius * np.sin(angle)
-            
-            # 根据斐波那契数标记特殊螺旋
-            if i % 21 == 0:  # 21条顺时针螺旋
-                color = RED
-                seed = Dot([x, y, 0], radius=0.03, color=color)
-                clockwise_spirals.append(seed)
-            elif i % 34 == 0:  # 34条逆时针螺旋
-                color = BLUE
-                seed = Dot([x, y, 0], radius=0.03, color=color)
-                counter_spirals.append(seed)
-            else:
-                color = YELLOW
-                seed = Dot([x, y, 0], radius=0.015, color=color)
-            
-            seeds.add(seed)
-        
+        # 种子：序号 1..n，21 的倍数标红（顺时针螺旋）、其余 34 的倍数标蓝（逆时针螺旋）
+        index = np.arange(1, n_seeds + 1)
+        groups = np.where(index % 21 == 0, 1, np.where(index % 34 == 0, 2, 0))
+        seeds = PhyllotaxisHead(
+            n_seeds, angle=golden_angle, scale=scale_factor, start=1,
+            radius=np.where(groups > 0, 0.03, 0.015),
+            colors=[YELLOW, RED, BLUE], groups=groups
+        )
+
         # 分阶段动画
         # 第一阶段：展示前100个种子
         info_text = Text("每个种子旋转137.5°", font_size=24, color=WHITE).to_corner(UR)
         self.play(Write(info_text))
         
-        self.play(
-            LaggedStart(*[Create(seed) for seed in seeds[:100]], lag_ratio=0.02),
-            run_time=3
-        )
+        self.play(SeedReveal(seeds, 0, 100), run_time=3)
         
         # 第二阶段：加速展示剩余种子
         self.play(FadeOut(info_text))
         info_text2 = Text("螺旋图案自然形成", font_size=24, color=WHITE).to_corner(UR)
         self.play(Write(info_text2))
         
-        self.play(
-            LaggedStart(*[Create(seed) for seed in seeds[100:]], lag_ratio=0.001),
-            run_time=3
-        )
+        self.play(SeedReveal(seeds, 100, n_seeds), run_time=3)
         
         self.wait(1)
         
@@ -301,22 +281,21 @@ class SunflowerGoldenSpiralChinese(Scene):
         
         # 高亮螺旋
         self.play(
-            *[seed.animate.scale(2) for seed in clockwise_spirals],
+            Transform(seeds, seeds.highlighted({1: 2})),
             Write(spiral_info[0]),
             run_time=1.5
         )
         self.wait(1)
         
         self.play(
-            *[seed.animate.scale(0.5) for seed in clockwise_spirals],
-            *[seed.animate.scale(2) for seed in counter_spirals],
+            Transform(seeds, seeds.highlighted({2: 2})),
             Write(spiral_info[1]),
             run_time=1.5
         )
         self.wait(1)
         
         self.play(
-            *[seed.animate.scale(0.5) for seed in counter_spirals],
+            Transform(seeds, seeds.highlighted({})),
             Write(spiral_info[2]),
             run_time=1
         )
@@ -9,6 +9,14 @@ from manim import *
 import numpy as np
 import random
 from typing import List, Dict, Tuple
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scipy import sparse
+from scenes.templates.network_graph import (
+    NetworkGraph, barabasi_albert, degrees, erdos_renyi, force_layout, friendship_stats, place
+)
 
 # 品牌色彩系统
 BRAND_PURPLE = "#8B5CF6"
@@ -126,17 +134,15 @@ class FriendshipParadoxEP05(Scene):
         network = self.create_simple_network()
         network.shift(LEFT * 3)
         
-        # 统计信息 - 右侧
+        # 统计信息 - 右侧（由示例网络直接算出）
+        friends = degrees(network.adjacency)
+        summary = friendship_stats(network.adjacency)
         stats = VGroup(
             Text("节点统计", font_size=28, color=BRAND_YELLOW, weight=BOLD),
-            Text("A: 4个朋友", font_size=24),
-            Text("B: 2个朋友", font_size=24),
-            Text("C: 2个朋友", font_size=24),
-            Text("D: 1个朋友", font_size=24),
-            Text("E: 1个朋友", font_size=24),
+            *[Text(f"{label}: {d}个朋友", font_size=24) for label, d in zip(network.labels, friends)],
             Text("─────────", font_size=24),
-            Text("平均: 2.0", font_size=26, color=WHITE),
-            Text("朋友的平均: 2.5", font_size=26, color=BRAND_PINK, weight=BOLD)
+            Text(f"平均: {summary.mean_degree:.1f}", font_size=26, color=WHITE),
+            Text(f"朋友的平均: {summary.mean_friend_degree:.1f}", font_size=26, color=BRAND_PINK, weight=BOLD)
         ).arrange(DOWN, buff=0.2, aligned_edge=LEFT)
         stats.shift(RIGHT * 3.5)
         
@@ -153,48 +159,33 @@ class FriendshipParadoxEP05(Scene):
     
     def create_simple_network(self):
         """创建一个简单的社交网络示例"""
-        network = VGroup()
-        
-        # 节点位置 - 缩小间距
-        positions = [
-            [0, 1.2, 0],      # A (中心)
-            [-1.5, 0, 0],     # B
-            [1.5, 0, 0],      # C
-            [-0.8, -1.2, 0],  # D
-            [0.8, -1.2, 0],   # E
-        ]
-        
-        # 创建节点
-        nodes = []
         labels = ["A", "B", "C", "D", "E"]
-        colors = [BRAND_YELLOW, BRAND_BLUE, BRAND_BLUE, BRAND_GRAY, BRAND_GRAY]
-        
-        for i, (pos, label, color) in enumerate(zip(positions, labels, colors)):
-            node = VGroup(
-                Circle(radius=0.35, fill_color=color, fill_opacity=0.7, stroke_width=2),
-                Text(label, font_size=22, color=WHITE)
-            )
-            node.move_to(pos)
-            nodes.append(node)
-            network.add(node)
-        
-        # 创建边
         edges = [
             (0, 1), (0, 2), (0, 3), (0, 4),  # A的连接
-            (1, 3),  # B-D
-            (2, 4),  # C-E
+            (1, 2),  # B-C
         ]
-        
-        for i, j in edges:
-            edge = Line(
-                nodes[i].get_center(),
-                nodes[j].get_center(),
-                stroke_width=2,
-                color=WHITE
-            )
-            network.add(edge)
-            edge.set_z_index(-1)
-        
+        rows, cols = zip(*edges)
+        adjacency = sparse.csr_matrix((np.ones(len(edges)), (rows, cols)), shape=(5, 5))
+        adjacency = adjacency + adjacency.T
+
+        # 力导向布局代替手写坐标；同一张图、同一种子的布局会被缓存
+        positions = place(force_layout(adjacency, seed=42), radius=1.5)
+        network = NetworkGraph(
+            adjacency,
+            positions,
+            node_radius=0.35,
+            colors=[BRAND_YELLOW, BRAND_BLUE, BRAND_GRAY],
+            groups=[0, 1, 1, 2, 2],
+            node_fill_opacity=0.7,
+            node_stroke_width=2,
+            edge_width=2,
+            edge_opacity=1,
+        )
+        network.labels = labels
+        network.add(*[
+            Text(label, font_size=22, color=WHITE).move_to(pos)
+            for label, pos in zip(labels, positions)
+        ])
         return network
     
     def prove_paradox(self):
@@ -390,17 +381,19 @@ class FriendshipParadoxEP05(Scene):
         
         right_group.add(right_title, right_axes, power_curve)
         
-        # 右侧文字说明
+        # 右侧文字说明：在 10 万人的模拟网络上实际统计
+        normal_world = friendship_stats(erdos_renyi(100_000, 50, seed=42))
+        power_world = friendship_stats(barabasi_albert(100_000, 10, seed=42))
         stats_comparison = VGroup(
             Text("正态分布", font_size=26, color=BRAND_GRAY, weight=BOLD),
-            Text("平均: 50", font_size=22),
-            Text("朋友平均: 52", font_size=22),
-            Text("差异: 4%", font_size=24, color=BRAND_GREEN),
+            Text(f"平均: {normal_world.mean_degree:.0f}", font_size=22),
+            Text(f"朋友平均: {normal_world.mean_friend_degree:.0f}", font_size=22),
+            Text(f"差异: {normal_world.ratio - 1:.0%}", font_size=24, color=BRAND_GREEN),
             Text("─────────", font_size=22),
             Text("幂律分布", font_size=26, color=BRAND_PINK, weight=BOLD),
-            Text("平均: 20", font_size=22),
-            Text("朋友平均: 85", font_size=22),
-            Text("差异: 325%!", font_size=24, color=BRAND_PINK, weight=BOLD)
+            Text(f"平均: {power_world.mean_degree:.0f}", font_size=22),
+            Text(f"朋友平均: {power_world.mean_friend_degree:.0f}", font_size=22),
+            Text(f"差异: {power_world.ratio - 1:.0%}!", font_size=24, color=BRAND_PINK, weight=BOLD)
         ).arrange(DOWN, buff=0.2, aligned_edge=LEFT)
         stats_comparison.shift(RIGHT * 3.5)
         
@@ -8,6 +8,13 @@ from manim import *
 import numpy as np
 import random
 from typing import List, Dict, Tuple
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.network_graph import (
+    NetworkGraph, barabasi_albert, degrees, erdos_renyi, force_layout, place
+)
 
 # 品牌色彩系统
 BRAND_PURPLE = "#8B5CF6"
@@ -502,72 +509,37 @@ class RumorSIRModelEP06(Scene):
         return network
     
     def create_random_network(self):
-        """创建随机网络"""
-        network = VGroup()
-        nodes = []
-        
-        # 9个随机分布的节点
-        np.random.seed(42)
-        positions = []
-        for _ in range(9):
-            angle = np.random.uniform(0, TAU)
-            radius = np.random.uniform(0.2, 0.7)
-            pos = [radius * np.cos(angle), radius * np.sin(angle), 0]
-            positions.append(pos)
-            
-            node = Circle(radius=0.12, fill_color=BRAND_YELLOW, fill_opacity=0.7)
-            node.move_to(pos)
-            nodes.append(node)
-            network.add(node)
-        
-        # 随机连接
-        for i in range(9):
-            for j in range(i + 1, 9):
-                if np.random.random() < 0.3:  # 30%概率连接
-                    edge = Line(nodes[i].get_center(), nodes[j].get_center(),
-                              stroke_width=1, color=BRAND_GRAY)
-                    network.add(edge)
-                    edge.set_z_index(-1)
-        
-        return network
+        """创建随机网络（Erdős–Rényi，每对节点独立连边）"""
+        adjacency = erdos_renyi(24, 2.4, seed=42)
+        positions = place(force_layout(adjacency, seed=42), radius=0.8)
+        return NetworkGraph(
+            adjacency,
+            positions,
+            node_radius=0.05,
+            colors=[BRAND_YELLOW],
+            node_fill_opacity=0.7,
+            edge_color=BRAND_GRAY,
+            edge_width=1,
+            edge_opacity=1,
+        )
     
     def create_scale_free_network(self):
-        """创建无标度网络（hub结构）"""
-        network = VGroup()
-        
-        # 中心节点（超级传播者）
-        hub = Circle(radius=0.2, fill_color=BRAND_RED, fill_opacity=0.9)
-        hub.move_to(ORIGIN)
-        network.add(hub)
-        
-        # 周围节点
-        nodes = []
-        for i in range(8):
-            angle = i * TAU / 8
-            radius = 0.7
-            pos = [radius * np.cos(angle), radius * np.sin(angle), 0]
-            
-            node = Circle(radius=0.12, fill_color=BRAND_PINK, fill_opacity=0.7)
-            node.move_to(pos)
-            nodes.append(node)
-            network.add(node)
-            
-            # 连接到中心
-            edge = Line(hub.get_center(), node.get_center(),
-                       stroke_width=2, color=BRAND_RED)
-            network.add(edge)
-            edge.set_z_index(-1)
-        
-        # 少量节点间连接
-        for i in range(8):
-            if np.random.random() < 0.2:  # 20%概率
-                j = (i + 1) % 8
-                edge = Line(nodes[i].get_center(), nodes[j].get_center(),
-                          stroke_width=1, color=BRAND_GRAY)
-                network.add(edge)
-                edge.set_z_index(-1)
-        
-        return network
+        """创建无标度网络（Barabási–Albert 优先连接，自然长出超级传播者）"""
+        adjacency = barabasi_albert(24, 1, seed=42)
+        positions = place(force_layout(adjacency, seed=42), radius=0.8)
+        friends = degrees(adjacency)
+        hubs = (friends >= np.sort(friends)[-2]).astype(int)  # 度最大的几个节点
+        return NetworkGraph(
+            adjacency,
+            positions,
+            node_radius=0.04 + 0.08 * np.sqrt(friends / friends.max()),
+            colors=[BRAND_PINK, BRAND_RED],
+            groups=hubs,
+            node_fill_opacity=0.8,
+            edge_color=BRAND_RED,
+            edge_width=1.5,
+            edge_opacity=0.7,
+        )
     
     def simulate_spread_on_networks(self, regular, random_net, scale_free):
         """模拟在不同网络上的传播"""
@@ -582,13 +554,13 @@ class RumorSIRModelEP06(Scene):
         
         # 随机网络：中速传播
         random_infection = Circle(radius=0.12, fill_color=BRAND_RED, fill_opacity=0.8)
-        random_infection.move_to(random_net[4].get_center())
+        random_infection.move_to(random_net.node_position(4))
         self.play(Create(random_infection), run_time=0.2)
         self.play(random_infection.animate.scale(5).set_opacity(0), run_time=0.5)
         
         # 无标度网络：爆炸式传播
         scale_infection = Circle(radius=0.2, fill_color=BRAND_RED, fill_opacity=0.8)
-        scale_infection.move_to(scale_free[0].get_center())
+        scale_infection.move_to(scale_free.node_position(scale_free.hub()))
         self.play(Create(scale_infection), run_time=0.2)
         self.play(scale_infection.animate.scale(8).set_opacity(0), run_time=0.5)
     
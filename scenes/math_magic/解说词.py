@@ -1,13 +1,32 @@
 # 保存文件名：generate_voice.py
 # 功能：把 EP06 信息熵解说稿生成语音 mp3
+# 默认逐句合成到 media/tts/NN_section_K.mp3（带缓存，改稿只重合成改动的句子），不覆盖已提交的 audio/；
+# --out audio 写回 audio/；--single 生成整篇一个文件
 
+import argparse
 import asyncio
-import edge_tts
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
 
 # 选择语音（微软支持很多，这里用中文普通话女声）
 VOICE = "zh-CN-XiaoxiaoNeural"
 OUTPUT_FILE = "EP06_voice.mp3"
 
+# 段标题 → 音频文件里的段名（audio/01_opening_1.mp3 …）
+SECTIONS = {
+    "开场": "opening",
+    "什么是信息量？": "information",
+    "香农熵：平均信息量": "entropy",
+    "熵与文件压缩": "compression",
+    "密码强度": "password",
+    "AI 的核心：交叉熵": "ai",
+    "总结": "conclusion",
+}
+
 # 旁白稿（带时间轴，可直接用）
 SCRIPT = """
 开场
@@ -70,10 +89,32 @@ AI 的核心：交叉熵
 它让我们看到，世界的混乱中，其实隐藏着一种精确的秩序。
 """
 
-async def main():
+async def single_file():
+    import edge_tts
+
     communicate = edge_tts.Communicate(SCRIPT, VOICE)
     await communicate.save(OUTPUT_FILE)
     print(f"✅ 语音已生成：{OUTPUT_FILE}")
 
+def main():
+    parser = argparse.ArgumentParser(description="EP06 解说配音")
+    parser.add_argument("--single", action="store_true", help="整篇合成一个文件")
+    parser.add_argument("--backend", default="edge", help="edge / offline（离线替身，静音占位）")
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--out", default=None, help="输出目录，默认 media/tts（audio/ 需显式指定）")
+    args = parser.parse_args()
+
+    if args.single:
+        asyncio.run(single_file())
+        return
+
+    from scenes.templates.narration import DEFAULT_OUT_DIR, build_narration
+
+    out_dir = Path(args.out) if args.out else DEFAULT_OUT_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest = build_narration(__file__, out_dir, backend=args.backend, concurrency=args.jobs)
+    print(f"✅ 语音已生成：{len(manifest['segments'])} 句，"
+          f"新合成 {manifest['synthesized']}，缓存 {manifest['cached']}")
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
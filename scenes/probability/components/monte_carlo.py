@@ -0,0 +1,161 @@
+"""
+蒙特卡洛估计组件
+投点求 π、布丰投针：按批向量化生成上千万个样本，在对数间隔的检查点记录命中数和 π 的估计，
+命中位置累积成密度栅格（而不是一个样本一个 Dot），场景里以图片形式显示
+"""
+
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+
+def log_checkpoints(n_samples: int, start: int = 10, per_decade: int = 3) -> np.ndarray:
+    """从 start 到 n_samples 的对数间隔样本数（去重、含终点），如 10, 22, 46, 100, ..."""
+    if n_samples < 1:
+        raise ValueError("n_samples must be positive")
+    start = max(1, min(start, n_samples))
+    decades = np.log10(n_samples / start)
+    count = max(int(np.ceil(decades * per_decade)), 0) + 1
+    points = np.round(start * np.logspace(0, decades, count)).astype(np.int64)
+    return np.unique(np.append(points, n_samples))
+
+
+class CirclePi:
+    """在 [-r, r]² 的正方形内均匀投点，落在内切圆内的比例 ≈ π/4"""
+
+    def __init__(self, radius: float = 1.0):
+        self.radius = radius
+        self.extent = (-radius, radius, -radius, radius)
+
+    def sample(self, rng: np.random.Generator, m: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """m 个样本 → (x, y, 是否命中)"""
+        xy = rng.uniform(-self.radius, self.radius, size=(2, m))
+        hit = np.einsum("im,im->m", xy, xy) <= self.radius * self.radius
+        return xy[0], xy[1], hit
+
+    def estimate(self, hits: np.ndarray, n: np.ndarray) -> np.ndarray:
+        return 4.0 * hits / n
+
+
+class BuffonNeedle:
+    """间距 d 的水平平行线（y = k·d），长 l (l ≤ d) 的针随机落下；与线相交的概率为 2l / (πd)
+
+    针的中点在 extent 内均匀分布；y 方向的范围取 d 的整数倍，估计才是无偏的。
+    命中位置记录针的中点，相交的针在密度图里会集中在线附近。
+    """
+
+    def __init__(self, needle_length: float = 1.0, line_spacing: float = 1.5,
+                 extent: Tuple[float, float, float, float] = (-3.0, 3.0, -3.0, 3.0)):
+        if needle_length > line_spacing:
+            raise ValueError("needle_length must not exceed line_spacing")
+        self.needle_length = needle_length
+        self.line_spacing = line_spacing
+        self.extent = extent
+
+    def sample(self, rng: np.random.Generator, m: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        x0, x1, y0, y1 = self.extent
+        x = rng.uniform(x0, x1, size=m)
+        y = rng.uniform(y0, y1, size=m)
+        half_dy = 0.5 * self.needle_length * np.sin(rng.uniform(0.0, np.pi, size=m))
+        d = self.line_spacing
+        hit = np.floor((y - half_dy) / d) != np.floor((y + half_dy) / d)
+        return x, y, hit
+
+    def estimate(self, hits: np.ndarray, n: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(hits > 0, 2.0 * self.needle_length * n / (self.line_spacing * hits), np.nan)
+
+    def needle_segments(self, rng: np.random.Generator, m: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """少量可单独画出的针：(起点 (m, 3), 终点 (m, 3), 是否相交)"""
+        x0, x1, y0, y1 = self.extent
+        center = np.column_stack([rng.uniform(x0, x1, m), rng.uniform(y0, y1, m), np.zeros(m)])
+        angle = rng.uniform(0.0, np.pi, m)
+        half = 0.5 * self.needle_length * np.column_stack([np.cos(angle), np.sin(angle), np.zeros(m)])
+        start, end = center - half, center + half
+        d = self.line_spacing
+        hit = np.floor(start[:, 1] / d) != np.floor(end[:, 1] / d)
+        return start, end, hit
+
+
+@dataclass
+class MonteCarloRun:
+    """一次模拟的结果；各数组按检查点对齐"""
+    checkpoints: np.ndarray
+    hits: np.ndarray
+    estimates: np.ndarray
+    extent: Tuple[float, float, float, float]
+    # 每个检查点的累积直方图 (命中, 未命中)，形状 (resolution, resolution)，第 0 行在上
+    snapshots: List[Tuple[np.ndarray, np.ndarray]] = field(default_factory=list, repr=False)
+
+    @property
+    def errors(self) -> np.ndarray:
+        return np.abs(self.estimates - np.pi)
+
+    def density_image(self, k: int = -1,
+                      hit_color: Sequence[int] = (5, 150, 105),
+                      miss_color: Sequence[int] = (220, 38, 38),
+                      opacity: float = 1.0) -> np.ndarray:
+        """第 k 个检查点的密度图，RGBA uint8
+
+        每个像素的不透明度为 1 - exp(-计数 / 尺度)，尺度取当前的平均每像素样本数（至少 1）：
+        样本少时有点的像素就清晰可见，样本多时保留密度差异而不是一片饱和。
+        """
+        hit_hist, miss_hist = self.snapshots[k]
+        total = hit_hist + miss_hist
+        scale = max(float(self.checkpoints[k]) / total.size, 1.0)
+        alpha = 1.0 - np.exp(-2.0 * total / scale)
+        share = np.divide(hit_hist, total, out=np.zeros(total.shape), where=total > 0)[..., None]
+        rgb = share * np.asarray(hit_color, dtype=float) + (1.0 - share) * np.asarray(miss_color, dtype=float)
+        image = np.empty(total.shape + (4,), dtype=np.uint8)
+        image[..., :3] = np.clip(rgb, 0, 255)
+        image[..., 3] = np.clip(alpha * opacity * 255, 0, 255)
+        return image
+
+
+def simulate(experiment,
+             n_samples: int,
+             checkpoints: Optional[Sequence[int]] = None,
+             resolution: int = 256,
+             seed: Optional[int] = None,
+             batch_size: int = 1 << 20) -> MonteCarloRun:
+    """按批生成样本、累计命中数与密度直方图，在每个检查点记录估计值和直方图快照
+
+    批次在检查点处切开，快照对应的正好是前 checkpoints[k] 个样本。
+    seed 为 None 时从 np.random 的全局状态取种子，场景里的 np.random.seed 依然有效。
+    """
+    cps = log_checkpoints(n_samples) if checkpoints is None else np.unique(np.asarray(checkpoints, dtype=np.int64))
+    cps = cps[(cps > 0) & (cps <= n_samples)]
+    seed = int(np.random.randint(2**31 - 1)) if seed is None else seed
+    rng = np.random.default_rng(seed)
+
+    x0, x1, y0, y1 = experiment.extent
+    sx, sy = resolution / (x1 - x0), resolution / (y1 - y0)
+    cells = resolution * resolution
+    hit_hist = np.zeros(cells, dtype=np.int64)
+    miss_hist = np.zeros(cells, dtype=np.int64)
+
+    hits_at = np.empty(len(cps), dtype=np.int64)
+    snapshots = []
+    done, hits = 0, 0
+    for k, target in enumerate(cps):
+        while done < target:
+            m = min(batch_size, int(target) - done)
+            x, y, hit = experiment.sample(rng, m)
+            col = np.clip(((x - x0) * sx).astype(np.int64), 0, resolution - 1)
+            row = np.clip(((y1 - y) * sy).astype(np.int64), 0, resolution - 1)
+            idx = row * resolution + col
+            hit_hist += np.bincount(idx[hit], minlength=cells)
+            miss_hist += np.bincount(idx[~hit], minlength=cells)
+            hits += int(np.count_nonzero(hit))
+            done += m
+        hits_at[k] = hits
+        snapshots.append((hit_hist.reshape(resolution, resolution).astype(np.int32),
+                          miss_hist.reshape(resolution, resolution).astype(np.int32)))
+
+    return MonteCarloRun(
+        checkpoints=cps,
+        hits=hits_at,
+        estimates=experiment.estimate(hits_at.astype(float), cps.astype(float)),
+        extent=experiment.extent,
+        snapshots=snapshots,
+    )
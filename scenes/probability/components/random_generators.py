@@ -8,6 +8,9 @@ import random
 from typing import List, Tuple, Callable
 from manim import *
 
+from .markov import MarkovChain
+from .random_walk import WalkEnsemble
+
 
 class RandomGenerators:
     """随机数生成器集合"""
@@ -53,24 +56,19 @@ class RandomGenerators:
             x = np.cumsum(dx)
             y = np.cumsum(dy)
             return np.column_stack([x, y])
+        elif dim >= 3:
+            ensemble = WalkEnsemble(1, steps, dim=dim, lattice=False, step_size=step_size)
+            return ensemble.generate()[0, 1:].astype(float)
         else:
-            raise ValueError("Only 1D and 2D random walks are supported")
+            raise ValueError(f"Invalid random walk dimension: {dim}")
     
     @staticmethod
     def generate_markov_chain(transition_matrix: np.ndarray,
                             initial_state: int,
                             steps: int) -> List[int]:
         """生成马尔可夫链"""
-        states = [initial_state]
-        current_state = initial_state
-        
-        for _ in range(steps - 1):
-            probs = transition_matrix[current_state]
-            next_state = np.random.choice(len(probs), p=probs)
-            states.append(next_state)
-            current_state = next_state
-        
-        return states
+        path = MarkovChain(transition_matrix).sample(steps, initial_states=initial_state)
+        return path[0].tolist()
     
     @staticmethod
     def generate_brownian_motion(n_points: int,
@@ -0,0 +1,182 @@
+"""
+随机漫步集合组件
+N 个漫步者、D 维、格点或连续步长、可选漂移；
+按块生成并写入 float32 内存映射文件，首达 / 回到原点统计全部向量化
+"""
+
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
+
+
+class WalkEnsemble:
+    """随机漫步集合
+
+    lattice=True 时每步沿随机一个坐标轴走 ±step_size（格点漫步），
+    否则朝球面上均匀随机的方向走 step_size（连续漫步）。
+    bound 为格点漫步的"墙"：越界的那一步原地不动（与场景里的演示规则一致）。
+    seed 为 None 时从 np.random 的全局状态取种子，场景里的 np.random.seed 依然有效。
+    """
+
+    def __init__(self,
+                 n_walkers: int,
+                 steps: int,
+                 dim: int = 2,
+                 lattice: bool = True,
+                 step_size: float = 1.0,
+                 drift: Optional[Sequence[float]] = None,
+                 bound: Optional[float] = None,
+                 seed: Optional[int] = None,
+                 chunk_size: int = 4096):
+        if dim < 1:
+            raise ValueError(f"dim must be >= 1, got {dim}")
+        if n_walkers < 1 or steps < 1:
+            raise ValueError("n_walkers and steps must be positive")
+
+        self.n_walkers = n_walkers
+        self.steps = steps
+        self.dim = dim
+        self.lattice = lattice
+        self.step_size = step_size
+        self.drift = np.zeros(dim) if drift is None else np.asarray(drift, dtype=float)
+        if self.drift.shape != (dim,):
+            raise ValueError(f"drift must have {dim} components")
+        self.bound = bound
+        self.seed = int(np.random.randint(2**31 - 1)) if seed is None else seed
+        self.chunk_size = chunk_size
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """完整轨迹的形状 (漫步者数, 步数 + 1, 维数)"""
+        return self.n_walkers, self.steps + 1, self.dim
+
+    def _increments(self, m: int, rng: np.random.Generator) -> np.ndarray:
+        """m 个漫步者的全部步增量，形状 (m, steps, dim)"""
+        if self.lattice:
+            axis = rng.integers(0, self.dim, size=(m, self.steps))
+            sign = rng.integers(0, 2, size=(m, self.steps)) * 2 - 1
+            inc = np.zeros((m, self.steps, self.dim), dtype=np.float32)
+            np.put_along_axis(inc, axis[..., None], sign[..., None].astype(np.float32), axis=2)
+            inc *= self.step_size
+        else:
+            inc = rng.standard_normal((m, self.steps, self.dim)).astype(np.float32)
+            norm = np.linalg.norm(inc, axis=2, keepdims=True)
+            inc *= self.step_size / np.maximum(norm, 1e-12)
+        if np.any(self.drift):
+            inc += self.drift.astype(np.float32)
+        return inc
+
+    def _integrate(self, inc: np.ndarray) -> np.ndarray:
+        """把增量累加成轨迹（含起点），有墙时逐步处理、仍对漫步者向量化"""
+        m = inc.shape[0]
+        pos = np.zeros((m, self.steps + 1, self.dim), dtype=np.float32)
+        if self.bound is None:
+            np.cumsum(inc, axis=1, out=pos[:, 1:])
+            return pos
+        for t in range(self.steps):
+            nxt = pos[:, t] + inc[:, t]
+            blocked = np.any(np.abs(nxt) > self.bound + 1e-6, axis=1)
+            pos[:, t + 1] = np.where(blocked[:, None], pos[:, t], nxt)
+        return pos
+
+    def iter_chunks(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """逐块产出 (起始序号, 该块轨迹)，每块的随机流独立且可复现"""
+        n_chunks = (self.n_walkers + self.chunk_size - 1) // self.chunk_size
+        streams = np.random.SeedSequence(self.seed).spawn(n_chunks)
+        for k, stream in enumerate(streams):
+            start = k * self.chunk_size
+            m = min(self.chunk_size, self.n_walkers - start)
+            rng = np.random.default_rng(stream)
+            yield start, self._integrate(self._increments(m, rng))
+
+    def generate(self, path: Optional[Union[str, Path]] = None) -> np.ndarray:
+        """生成全部轨迹
+
+        给定 path 时按块写入 .npy 格式的 float32 内存映射文件并返回 memmap，
+        之后可用 np.load(path, mmap_mode="r") 重新打开；否则返回内存数组。
+        """
+        if path is None:
+            out = np.empty(self.shape, dtype=np.float32)
+        else:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=self.shape)
+        for start, chunk in self.iter_chunks():
+            out[start:start + chunk.shape[0]] = chunk
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
+    def return_statistics(self, tol: Optional[float] = None) -> Dict:
+        """流式统计回到原点的情况（不保存轨迹，内存只占一个块）"""
+        first = np.empty(self.n_walkers, dtype=np.int64)
+        final_dist = np.empty(self.n_walkers, dtype=np.float32)
+        for start, chunk in self.iter_chunks():
+            end = start + chunk.shape[0]
+            first[start:end] = first_return_times(chunk, tol=self._tol(tol))
+            final_dist[start:end] = np.linalg.norm(chunk[:, -1], axis=1)
+        return summarize_returns(first, self.steps, final_dist)
+
+    def first_passage_statistics(self, level: float, axis: int = 0) -> Dict:
+        """流式统计首次到达 坐标[axis] >= level 的时间"""
+        first = np.empty(self.n_walkers, dtype=np.int64)
+        for start, chunk in self.iter_chunks():
+            first[start:start + chunk.shape[0]] = first_passage_times(chunk, level, axis=axis)
+        reached = first >= 0
+        return {
+            "level": level,
+            "fraction_reached": float(reached.mean()),
+            "median_time": float(np.median(first[reached])) if reached.any() else None,
+            "first_times": first,
+        }
+
+    def _tol(self, tol: Optional[float]) -> float:
+        # 格点漫步坐标是精确整数倍，连续漫步则以半步长为"到家"半径
+        if tol is not None:
+            return tol
+        return 1e-6 if self.lattice else self.step_size / 2
+
+
+def first_return_times(positions: np.ndarray, tol: float = 1e-6, chunk_size: int = 4096) -> np.ndarray:
+    """每个漫步者第一次（t >= 1）回到原点 tol 范围内的步数，从未回到则为 -1
+
+    positions 形状 (漫步者数, 步数 + 1, 维数)，可以是 memmap，会按块读取。
+    """
+    n = positions.shape[0]
+    out = np.full(n, -1, dtype=np.int64)
+    for start in range(0, n, chunk_size):
+        block = np.asarray(positions[start:start + chunk_size, 1:], dtype=np.float32)
+        hit = np.einsum("mtd,mtd->mt", block, block) <= tol * tol
+        any_hit = hit.any(axis=1)
+        out[start:start + block.shape[0]] = np.where(any_hit, hit.argmax(axis=1) + 1, -1)
+    return out
+
+
+def first_passage_times(positions: np.ndarray, level: float, axis: int = 0, chunk_size: int = 4096) -> np.ndarray:
+    """每个漫步者第一次满足 坐标[axis] >= level 的步数（level < 0 时为 <=），未到达为 -1"""
+    n = positions.shape[0]
+    out = np.full(n, -1, dtype=np.int64)
+    for start in range(0, n, chunk_size):
+        coord = np.asarray(positions[start:start + chunk_size, :, axis], dtype=np.float32)
+        hit = coord >= level if level >= 0 else coord <= level
+        any_hit = hit.any(axis=1)
+        out[start:start + coord.shape[0]] = np.where(any_hit, hit.argmax(axis=1), -1)
+    return out
+
+
+def summarize_returns(first_times: np.ndarray, steps: int, final_dist: Optional[np.ndarray] = None) -> Dict:
+    """由首次返回时间得到"到第 t 步为止已回家比例"的曲线和汇总数字"""
+    returned = first_times >= 0
+    counts = np.bincount(first_times[returned], minlength=steps + 1)[:steps + 1]
+    curve = np.cumsum(counts) / max(first_times.shape[0], 1)
+    stats = {
+        "n_walkers": int(first_times.shape[0]),
+        "steps": steps,
+        "return_fraction": float(returned.mean()),
+        "median_return_time": float(np.median(first_times[returned])) if returned.any() else None,
+        "return_curve": curve,
+        "first_return_times": first_times,
+    }
+    if final_dist is not None:
+        stats["mean_final_distance"] = float(final_dist.mean())
+    return stats
@@ -6,7 +6,16 @@ EP16: 马尔可夫链
 from manim import *
 import numpy as np
 import random
+import sys
+from pathlib import Path
 from typing import List, Dict, Tuple
+from scipy import sparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.path_animation import KeyframePaths, stack_keyframes
+from scenes.probability.components.markov import (
+    MarkovChain, pagerank, random_web_graph, simulate_surfers
+)
 
 # 概率系列颜色主题
 PROB_PURPLE = "#8B5CF6"    # 主色：概率紫
@@ -22,6 +31,13 @@ SUBTITLE_SIZE = 30
 NORMAL_SIZE = 24
 SMALL_SIZE = 20
 
+# 天气转移矩阵（晴 / 云 / 雨）
+WEATHER_P = np.array([
+    [0.7, 0.2, 0.1],  # 晴
+    [0.3, 0.4, 0.3],  # 云
+    [0.2, 0.3, 0.5]   # 雨
+])
+
 
 class MarkovChainEP16(Scene):
     """马尔可夫链 - 概率论系列 EP16"""
@@ -202,7 +218,7 @@ class MarkovChainEP16(Scene):
         ).scale(1.2)
         markov_formula.shift(DOWN * 0.8)
         
-        self.play(Write""" """  """ """(markov_formula))
+        self.play(Write(markov_formula))
         
         # 通俗解释
         explanation = VGroup(
@@ -489,13 +505,6 @@ class MarkovChainEP16(Scene):
     
     def simulate_week_weather(self, week_grid):
         """模拟一周天气"""
-        # 转移矩阵
-        P = np.array([
-            [0.7, 0.2, 0.1],  # 晴
-            [0.3, 0.4, 0.3],  # 云
-            [0.2, 0.3, 0.5]   # 雨
-        ])
-        
         # 天气图标（简化版）
         weather_icons = {
             0: ("☀", PROB_YELLOW, "晴"),
@@ -503,12 +512,12 @@ class MarkovChainEP16(Scene):
             2: ("🌧", PROB_BLUE, "雨")
         }
         
-        # 初始状态（周一晴天）
-        current_state = 0
+        # 初始状态（周一晴天），一次采样整周
+        week = MarkovChain(WEATHER_P).sample(7, initial_states=0)[0]
         
         for i in range(7):
             # 获取图标和颜色
-            icon, color, name = weather_icons[current_state]
+            icon, color, name = weather_icons[int(week[i])]
             
             # 创建天气图标
             weather = Text(name, font_size=SUBTITLE_SIZE, color=color)
@@ -516,12 +525,8 @@ class MarkovChainEP16(Scene):
             
             self.play(Write(weather), run_time=0.5)
             
-            # 如果不是最后一天，计算下一天
+            # 如果不是最后一天，显示转移
             if i < 6:
-                # 根据概率选择下一个状态
-                probs = P[current_state]
-                current_state = np.random.choice(3, p=probs)
-                
                 # 显示转移箭头
                 arrow = Arrow(
                     week_grid[i][0].get_right(),
@@ -552,10 +557,14 @@ class MarkovChainEP16(Scene):
         self.play(Create(convergence_plot))
         
         # 结论
+        pi = MarkovChain(WEATHER_P).stationary()
         conclusion = VGroup(
             Text("无论从哪个状态开始", font_size=NORMAL_SIZE),
             Text("最终都会收敛到同一个分布", font_size=NORMAL_SIZE, color=PROB_GREEN),
-            Text("晴:40%  云:35%  雨:25%", font_size=SUBTITLE_SIZE, color=PROB_PURPLE, weight=BOLD)
+            Text(
+                f"晴:{pi[0]:.0%}  云:{pi[1]:.0%}  雨:{pi[2]:.0%}",
+                font_size=SUBTITLE_SIZE, color=PROB_PURPLE, weight=BOLD
+            )
         ).arrange(DOWN, buff=0.3)
         conclusion.shift(DOWN * 2.5)
         
@@ -576,6 +585,10 @@ class MarkovChainEP16(Scene):
         title = Text("概率分布演化", font_size=NORMAL_SIZE, color=PROB_YELLOW)
         title.shift(UP * 2)
         
+        history = MarkovChain(WEATHER_P).distribution_after([1, 0, 0], 10)
+        pi = MarkovChain(WEATHER_P).stationary()
+        fmt = lambda v: "[" + ", ".join(f"{x:.2f}" for x in v) + "]"
+        
         # 初始分布
         initial = VGroup(
             Text("初始:", font_size=SMALL_SIZE),
@@ -586,18 +599,18 @@ class MarkovChainEP16(Scene):
         # 几次迭代后
         iter5 = VGroup(
             Text("5天后:", font_size=SMALL_SIZE),
-            Text("[0.5, 0.3, 0.2]", font_size=SMALL_SIZE, color=PROB_BLUE)
+            Text(fmt(history[5]), font_size=SMALL_SIZE, color=PROB_BLUE)
         ).arrange(RIGHT, buff=0.3)
         
         iter10 = VGroup(
             Text("10天后:", font_size=SMALL_SIZE),
-            Text("[0.42, 0.34, 0.24]", font_size=SMALL_SIZE, color=PROB_BLUE)
+            Text(fmt(history[10]), font_size=SMALL_SIZE, color=PROB_BLUE)
         ).arrange(RIGHT, buff=0.3)
         iter10.shift(DOWN * 1)
         
         iter_inf = VGroup(
             Text("∞天后:", font_size=SMALL_SIZE),
-            Text("[0.4, 0.35, 0.25]", font_size=SMALL_SIZE, color=PROB_GREEN)
+            Text(fmt(pi), font_size=SMALL_SIZE, color=PROB_GREEN)
         ).arrange(RIGHT, buff=0.3)
         iter_inf.shift(DOWN * 2)
         
@@ -633,51 +646,31 @@ class MarkovChainEP16(Scene):
         x_label = Text("天数", font_size=16).next_to(axes.x_axis, DOWN, buff=0.2)
         y_label = Text("概率", font_size=16).next_to(axes.y_axis, LEFT, buff=0.2).rotate(PI/2)
         
-        # 三条收敛曲线
-        t = np.linspace(0, 20, 100)
-        
-        # 晴天概率曲线（从1开始，收敛到0.4）
-        sunny_curve = axes.plot_line_graph(
-            x_values=t,
-            y_values=0.4 + 0.6 * np.exp(-t/5),
-            line_color=PROB_YELLOW,
-            stroke_width=2,
-            add_vertex_dots=False
-        )
-        
-        # 多云概率曲线（从0开始，收敛到0.35）
-        cloudy_curve = axes.plot_line_graph(
-            x_values=t,
-            y_values=0.35 * (1 - np.exp(-t/5)),
-            line_color=GRAY,
-            stroke_width=2,
-            add_vertex_dots=False
-        )
-        
-        # 雨天概率曲线（从0开始，收敛到0.25）
-        rainy_curve = axes.plot_line_graph(
-            x_values=t,
-            y_values=0.25 * (1 - np.exp(-t/5)),
-            line_color=PROB_BLUE,
-            stroke_width=2,
-            add_vertex_dots=False
-        )
+        # 三条收敛曲线：从晴天出发的真实迭代结果
+        days = np.arange(21)
+        history = MarkovChain(WEATHER_P).distribution_after([1, 0, 0], 20)
+        pi = MarkovChain(WEATHER_P).stationary()
+        curve_colors = [PROB_YELLOW, GRAY, PROB_BLUE]
+        
+        sunny_curve, cloudy_curve, rainy_curve = [
+            axes.plot_line_graph(
+                x_values=days,
+                y_values=history[:, k],
+                line_color=curve_colors[k],
+                stroke_width=2,
+                add_vertex_dots=False
+            )
+            for k in range(3)
+        ]
         
         # 稳态线
-        steady_lines = VGroup(
-            DashedLine(
-                axes.c2p(0, 0.4), axes.c2p(20, 0.4),
-                color=PROB_YELLOW, stroke_width=1
-            ),
-            DashedLine(
-                axes.c2p(0, 0.35), axes.c2p(20, 0.35),
-                color=GRAY, stroke_width=1
-            ),
+        steady_lines = VGroup(*[
             DashedLine(
-                axes.c2p(0, 0.25), axes.c2p(20, 0.25),
-                color=PROB_BLUE, stroke_width=1
+                axes.c2p(0, pi[k]), axes.c2p(20, pi[k]),
+                color=curve_colors[k], stroke_width=1
             )
-        )
+            for k in range(3)
+        ])
         
         return VGroup(axes, x_label, y_label, sunny_curve, cloudy_curve, rainy_curve, steady_lines)
     
@@ -710,9 +703,11 @@ class MarkovChainEP16(Scene):
         # 模拟随机冲浪者
         self.simulate_random_surfer(web_graph)
         
-        # 显示PageRank值
+        # 显示PageRank值（稀疏幂迭代求得）
+        scores = pagerank(self.web_links())
+        ranking = " > ".join("ABCD"[i] for i in np.argsort(-scores))
         pagerank_values = Text(
-            "最终排名：A > C > B > D",
+            f"最终排名：{ranking}",
             font_size=NORMAL_SIZE,
             color=PROB_GREEN,
             weight=BOLD
@@ -722,9 +717,58 @@ class MarkovChainEP16(Scene):
         
         self.wait(2)
         self.play(
-            FadeOut(title), FadeOut(web_graph),
+            FadeOut(web_graph),
             FadeOut(algorithm_explanation), FadeOut(pagerank_values)
         )
+        
+        # 真实规模：10万个网页
+        self.show_large_web_pagerank()
+        self.play(FadeOut(title))
+    
+    def web_links(self):
+        """四个网页的链接关系（稀疏邻接矩阵）"""
+        links = [(0, 1), (0, 2), (1, 2), (2, 0), (2, 3), (3, 0), (3, 2)]
+        rows, cols = zip(*links)
+        return sparse.csr_matrix((np.ones(len(links)), (rows, cols)), shape=(4, 4))
+    
+    def show_large_web_pagerank(self, n_pages: int = 100_000, top_k: int = 10):
+        """在10万节点的随机网页图上运行 PageRank，展示重要性的集中程度"""
+        graph = random_web_graph(n_pages, seed=42)
+        scores = np.sort(pagerank(graph))[::-1]
+        
+        header = Text(
+            f"真实规模：{n_pages:,} 个网页，{graph.nnz:,} 条链接",
+            font_size=NORMAL_SIZE,
+            color=PROB_YELLOW
+        )
+        header.shift(UP * 2)
+        
+        # 前 top_k 个网页的得分柱状图（相对第一名）
+        bars = VGroup(*[
+            Rectangle(
+                width=0.5,
+                height=3 * score / scores[0],
+                fill_color=PROB_BLUE,
+                fill_opacity=0.8,
+                stroke_width=0
+            )
+            for score in scores[:top_k]
+        ]).arrange(RIGHT, buff=0.15, aligned_edge=DOWN)
+        bars.move_to(DOWN * 0.3)
+        
+        top_share = scores[:n_pages // 100].sum()
+        summary = Text(
+            f"排名前1%的网页占据了{top_share:.0%}的重要性",
+            font_size=NORMAL_SIZE,
+            color=PROB_GREEN
+        )
+        summary.next_to(bars, DOWN, buff=0.5)
+        
+        self.play(Write(header))
+        self.play(LaggedStartMap(GrowFromEdge, bars, edge=DOWN), run_time=1.5)
+        self.play(Write(summary))
+        self.wait(2)
+        self.play(FadeOut(header), FadeOut(bars), FadeOut(summary))
     
     def create_web_graph(self):
         """创建网页链接图"""
@@ -791,34 +835,19 @@ class MarkovChainEP16(Scene):
         )
         self.play(Create(surfer))
         
-        # 访问计数
-        visit_counts = [0, 0, 0, 0]
+        # 模拟20步：只沿链接跳转（不传送），整条路径一次采样
+        pages = simulate_surfers(self.web_links(), steps=21, damping=1.0)[0]
         
-        # 模拟20步
-        current_page = 0
+        # 访问计数
+        visit_counts = np.bincount(pages[:-1], minlength=4)
         
-        # 链接关系字典
-        links = {
-            0: [1, 2],     # A可以去B和C
-            1: [2],        # B可以去C
-            2: [0, 3],     # C可以去A和D
-            3: [0, 2]      # D可以去A和C
-        }
+        keyframes = [[web_graph[int(page)].get_center()] for page in pages]
         
-        for _ in range(20):
-            visit_counts[current_page] += 1
-            
-            # 选择下一个页面
-            next_pages = links[current_page]
-            next_page = random.choice(next_pages)
-            
-            # 移动冲浪者
-            self.play(
-                surfer.animate.move_to(web_graph[next_page].get_center()),
-                run_time=0.3
-            )
-            
-            current_page = next_page
+        # 移动冲浪者：20 步合并为一次 play
+        self.play(
+            KeyframePaths([surfer], stack_keyframes(keyframes)),
+            run_time=0.3 * 20
+        )
         
         self.play(FadeOut(surfer))
     
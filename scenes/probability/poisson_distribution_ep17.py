@@ -6,9 +6,14 @@ EP17: 泊松分布
 from manim import *
 import numpy as np
 import random
+import sys
+from pathlib import Path
 from typing import List, Dict, Tuple
 from scipy.stats import poisson
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.path_animation import KeyframePaths, stack_keyframes
+
 # 概率系列颜色主题
 PROB_PURPLE = "#8B5CF6"    # 主色：概率紫
 PROB_GREEN = "#10B981"     # 成功绿
@@ -435,38 +440,61 @@ class PoissonDistributionEP17(Scene):
     
     def simulate_queue_system(self, bank_scene):
         """模拟排队系统 - 调整动画位置"""
-        customers = VGroup()
-        
         # 模拟6个顾客（减少数量以避免拥挤）
-        for i in range(6):
-            # 顾客到达
-            customer = Circle(
+        n_customers = 6
+        entry_pos = LEFT * 3.5 + DOWN * 0.8
+        customers = [
+            Circle(
                 radius=0.18,
                 fill_color=PROB_GREEN,
                 fill_opacity=0.8
-            )
-            
-            # 初始位置
-            customer.move_to(LEFT * 3.5 + DOWN * 0.8)
-            self.play(FadeIn(customer), run_time=0.2)
+            ).move_to(entry_pos)
+            for _ in range(n_customers)
+        ]
+        
+        # 先推演整段过程，记录每一步的位置和不透明度，最后一次 play 播完
+        positions = np.array([entry_pos] * n_customers, dtype=float)
+        opacity = np.zeros(n_customers)
+        frames, opacities, key_times = [positions.copy()], [opacity.copy()], [0.0]
+        
+        def step(run_time: float):
+            frames.append(positions.copy())
+            opacities.append(opacity.copy())
+            key_times.append(key_times[-1] + run_time)
+        
+        queue = []
+        for i in range(n_customers):
+            # 顾客到达
+            opacity[i] = 1
+            step(0.2)
             
             # 移动到队列
-            queue_pos = LEFT * 2.5 + RIGHT * (i % 6) * 1 + DOWN * 0.8
-            self.play(customer.animate.move_to(queue_pos), run_time=0.4)
-            customers.add(customer)
+            positions[i] = LEFT * 2.5 + RIGHT * (i % 6) * 1 + DOWN * 0.8
+            step(0.4)
+            queue.append(i)
             
             # 随机服务顾客
-            if i > 2 and random.random() < 0.4 and len(customers) > 0:
-                served = customers[0]
-                window_pos = UP * 0.8 + RIGHT * random.choice([-2, 0, 2])
-                self.play(served.animate.move_to(window_pos), run_time=0.4)
-                self.play(FadeOut(served), run_time=0.2)
-                customers.remove(served)
+            if i > 2 and random.random() < 0.4 and len(queue) > 0:
+                served = queue.pop(0)
+                positions[served] = UP * 0.8 + RIGHT * random.choice([-2, 0, 2])
+                step(0.4)
+                opacity[served] = 0
+                step(0.2)
                 
                 # 队列前移
-                for j, c in enumerate(customers):
-                    new_pos = LEFT * 2.5 + RIGHT * j * 1 + DOWN * 0.8
-                    self.play(c.animate.move_to(new_pos), run_time=0.2)
+                for j, c in enumerate(queue):
+                    positions[c] = LEFT * 2.5 + RIGHT * j * 1 + DOWN * 0.8
+                    step(0.2)
+        
+        self.play(
+            KeyframePaths(
+                customers,
+                stack_keyframes(frames),
+                opacities=np.array(opacities).T,
+                key_times=key_times
+            ),
+            run_time=key_times[-1]
+        )
     
     def lambda_parameter_meaning(self):
         """参数λ的意义"""
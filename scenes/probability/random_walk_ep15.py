@@ -6,8 +6,14 @@ EP15: 随机漫步
 from manim import *
 import numpy as np
 import random
+import sys
+from pathlib import Path
 from typing import List, Dict, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.path_animation import KeyframePaths, stack_keyframes
+from scenes.probability.components.random_walk import WalkEnsemble
+
 # 概率系列颜色主题
 PROB_PURPLE = "#8B5CF6"    # 主色：概率紫
 PROB_GREEN = "#10B981"     # 成功绿
@@ -273,27 +279,29 @@ class RandomWalkEP15(ThreeDScene):
         )
         explanation.to_edge(DOWN, buff=0.5)
         
-        for i in range(50):
-            # 抛硬币决定方向
-            direction = random.choice([-1, 1])
-            position += direction
-            new_point = number_line.n2p(position)
-            path_points.append(new_point)
+        # 每10步合并为一次 play，避免 50 个零碎的片段文件
+        for chunk in range(5):
+            chunk_points = [path_points[-1]]
+            for _ in range(10):
+                # 抛硬币决定方向
+                direction = random.choice([-1, 1])
+                position += direction
+                chunk_points.append(number_line.n2p(position))
+            path_points.extend(chunk_points[1:])
             
             # 更新位置
             self.play(
-                walker.animate.move_to(new_point),
-                run_time=0.1
+                KeyframePaths([walker], stack_keyframes([[p] for p in chunk_points])),
+                run_time=0.1 * 10
             )
             
             # 更新文字
-            if i % 10 == 0:
-                new_text = Text(f"当前位置：{position}", font_size=NORMAL_SIZE, color=WHITE)
-                new_text.move_to([0, -1.5, 0])
-                self.play(Transform(position_text, new_text), run_time=0.1)
+            new_text = Text(f"当前位置：{position}", font_size=NORMAL_SIZE, color=WHITE)
+            new_text.move_to([0, -1.5, 0])
+            self.play(Transform(position_text, new_text), run_time=0.1)
             
-            # 在第30步时显示解释
-            if i == 30:
+            # 走过30步时显示解释
+            if chunk == 2:
                 self.play(Write(explanation))
         
         # 画出路径
@@ -413,25 +421,14 @@ class RandomWalkEP15(ThreeDScene):
             self.play(FadeIn(d, scale=1.5), run_time=0.3)
             self.play(FadeOut(d), run_time=0.3)
         
-        # 模拟行走
-        x, y = 0, 0
-        path_points = [grid.c2p(x, y)]
-        
-        for _ in range(60):
-            direction = random.choice(['up', 'down', 'left', 'right'])
-            if direction == 'up' and y < 4:
-                y += 1
-            elif direction == 'down' and y > -4:
-                y -= 1
-            elif direction == 'left' and x > -4:
-                x -= 1
-            elif direction == 'right' and x < 4:
-                x += 1
-            
-            new_point = grid.c2p(x, y)
-            path_points.append(new_point)
-            
-            self.play(walker.animate.move_to(new_point), run_time=0.1)
+        # 模拟行走：60步一次生成（网格边界 ±4 处原地不动），一次 play 走完
+        walk = WalkEnsemble(1, 60, dim=2, bound=4).generate()[0]
+        path_points = [grid.c2p(x, y) for x, y in walk]
+        
+        self.play(
+            KeyframePaths([walker], stack_keyframes([[p] for p in path_points])),
+            run_time=0.1 * 60
+        )
         
         # 画出路径
         path = VMobject()
@@ -439,10 +436,11 @@ class RandomWalkEP15(ThreeDScene):
         path.set_stroke(color=PROB_BLUE, width=2, opacity=0.6)
         self.play(Create(path))
         
-        # 结论
+        # 结论：10万个醉汉的统计
+        stats_2d = WalkEnsemble(100_000, 1000, dim=2).return_statistics()
         conclusion = Text(
-            "二维随机漫步也会回家！",
-            font_size=SUBTITLE_SIZE,
+            f"二维随机漫步也会回家！10万醉汉走1000步，{stats_2d['return_fraction']:.0%}已到家",
+            font_size=NORMAL_SIZE,
             color=PROB_GREEN
         )
         conclusion.to_edge(DOWN, buff=0.5)
@@ -508,60 +506,42 @@ class RandomWalkEP15(ThreeDScene):
         directions_text.to_edge(DOWN, buff=0.8)
         self.play(Write(directions_text))
         
-        # 开始随机飞行
-        x, y, z = 0, 0, 0
-        path_points = [axes.c2p(x, y, z)]
+        # 开始随机飞行：40步一次生成（边界 ±3 处原地不动）
+        walk = WalkEnsemble(1, 40, dim=3, bound=3).generate()[0]
+        path_points = [axes.c2p(*p) for p in walk]
         
         # 记录路径
         path_lines = VGroup()
         
-        for i in range(40):
-            # 随机选择方向
-            direction = random.choice(['x+', 'x-', 'y+', 'y-', 'z+', 'z-'])
-            
-            old_pos = axes.c2p(x, y, z)
-            
-            if direction == 'x+' and x < 3:
-                x += 1
-            elif direction == 'x-' and x > -3:
-                x -= 1
-            elif direction == 'y+' and y < 3:
-                y += 1
-            elif direction == 'y-' and y > -3:
-                y -= 1
-            elif direction == 'z+' and z < 3:
-                z += 1
-            elif direction == 'z-' and z > -3:
-                z -= 1
-            
-            new_pos = axes.c2p(x, y, z)
-            path_points.append(new_pos)
-            
-            # 创建路径线段
-            path_segment = Line(
-                old_pos, new_pos,
-                color=PROB_BLUE,
-                stroke_width=2,
-                stroke_opacity=0.6
-            )
-            path_lines.add(path_segment)
+        # 每10步合并为一次 play
+        for i in range(0, 40, 10):
+            segments = [
+                Line(
+                    path_points[k], path_points[k + 1],
+                    color=PROB_BLUE,
+                    stroke_width=2,
+                    stroke_opacity=0.6
+                )
+                for k in range(i, i + 10)
+            ]
+            path_lines.add(*segments)
             
             # 动画
             self.play(
-                bird.animate.move_to(new_pos),
-                Create(path_segment),
-                run_time=0.2
+                KeyframePaths([bird], stack_keyframes([[p] for p in path_points[i:i + 11]])),
+                Succession(*[Create(seg) for seg in segments]),
+                run_time=0.2 * 10
             )
             
             # 旋转相机以更好地展示3D效果
-            if i % 10 == 0:
-                self.move_camera(
-                    phi=60 * DEGREES,
-                    theta=(self.camera.theta + 30 * DEGREES) % (360 * DEGREES),
-                    run_time=1
-                )
+            self.move_camera(
+                phi=60 * DEGREES,
+                theta=(self.camera.theta + 30 * DEGREES) % (360 * DEGREES),
+                run_time=1
+            )
         
         # 计算距离
+        x, y, z = walk[-1]
         distance = np.sqrt(x**2 + y**2 + z**2)
         distance_text = Text(
             f"离巢距离：{distance:.1f}",
@@ -574,9 +554,14 @@ class RandomWalkEP15(ThreeDScene):
         # 结论
         self.play(FadeOut(directions_text))
         
+        stats_3d = WalkEnsemble(100_000, 1000, dim=3).return_statistics()
         conclusion = VGroup(
             Text("三维随机漫步的残酷真相：", font_size=NORMAL_SIZE, color=PROB_RED),
             Text("回家概率 < 35%", font_size=SUBTITLE_SIZE, color=PROB_RED, weight=BOLD),
+            Text(
+                f"10万只醉鸟飞1000步，只有{stats_3d['return_fraction']:.0%}回到鸟巢",
+                font_size=SMALL_SIZE, color=PROB_RED
+            ),
             Text("醉鸟可能永远找不到家！", font_size=NORMAL_SIZE, color=PROB_YELLOW)
         ).arrange(DOWN, buff=0.3)
         conclusion.to_edge(DOWN, buff=0.5)
@@ -0,0 +1 @@
+"""通用基类与工具（跨系列复用）"""
@@ -0,0 +1,251 @@
+"""
+旁白驱动的场景时长
+从 mp3 帧头读出每段旁白的时长（不解码音频），场景里可以"等到某段旁白结束"或
+"把这次 play 拉伸到某段旁白的长度"；渲染时记下每段旁白在时间线上的位置（cue 表），
+最后由 ffmpeg 按位置把音频混进成片，改配音不必重新渲染画面。
+
+    class InformationTheoryEP06(NarrationTimingMixin, ITSceneBase):
+        def construct(self):
+            self.play_for_segment(Write(title), segment="01_opening_1")
+            self.start_segment("01_opening_2")
+            self.play(FadeIn(panel), run_time=0.8)
+            self.wait_for_segment("01_opening_2")
+
+    python -m scenes.templates.audio_timing durations audio
+    python -m scenes.templates.audio_timing mux media/videos/.../EP06.mp4 media/narration/EP06.json --out EP06_voiced.mp4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_AUDIO_DIR = REPO_ROOT / "audio"
+DEFAULT_CUE_DIR = REPO_ROOT / "media" / "narration"
+
+# 位率表 [版本][层] -> kbps（版本 0: MPEG-1，1: MPEG-2/2.5；层 1..3）
+_BITRATES = {
+    (0, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (0, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (0, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (1, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (1, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (1, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def _id3_size(data: bytes) -> int:
+    if data[:3] == b"ID3" and len(data) >= 10:
+        return 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9])
+    return 0
+
+
+def _parse_header(h: bytes):
+    """4 字节帧头 → (帧长, 每帧采样数, 采样率)；不是合法帧头返回 None"""
+    if h[0] != 0xFF or (h[1] & 0xE0) != 0xE0:
+        return None
+    version_bits = (h[1] >> 3) & 0x3      # 3: MPEG-1, 2: MPEG-2, 0: MPEG-2.5
+    layer = 4 - ((h[1] >> 1) & 0x3)       # 1..3
+    bitrate_idx = h[2] >> 4
+    sr_idx = (h[2] >> 2) & 0x3
+    padding = (h[2] >> 1) & 0x1
+    if version_bits == 1 or layer == 4 or bitrate_idx in (0, 15) or sr_idx == 3:
+        return None
+    v = 0 if version_bits == 3 else 1
+    bitrate = _BITRATES[(v, layer)][bitrate_idx] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][sr_idx]
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+    samples = 1152 if (layer == 2 or v == 0) else 576
+    return samples // 8 * bitrate // sample_rate + padding, samples, sample_rate
+
+
+def mp3_duration(path: Union[str, Path]) -> float:
+    """按帧头计算 mp3 时长（秒），不解码
+
+    第一帧带 Xing / Info 头（VBR）时直接用其中的总帧数；否则逐帧跳读帧头累加采样数。
+    """
+    data = Path(path).read_bytes()
+    pos = _id3_size(data)
+    # 找到第一个合法帧头（跳过可能的填充字节）
+    while pos + 4 <= len(data) and _parse_header(data[pos:pos + 4]) is None:
+        pos += 1
+    first = _parse_header(data[pos:pos + 4]) if pos + 4 <= len(data) else None
+    if first is None:
+        return 0.0
+
+    frame_len, samples, sample_rate = first
+    for tag in (b"Xing", b"Info"):
+        at = data.find(tag, pos, pos + min(frame_len, 64))
+        if at >= 0 and data[at + 7] & 0x1:
+            frames = int.from_bytes(data[at + 8:at + 12], "big")
+            if frames:
+                return frames * samples / sample_rate
+
+    total = 0
+    while pos + 4 <= len(data):
+        header = _parse_header(data[pos:pos + 4])
+        if header is None:
+            break
+        frame_len, samples, sample_rate = header
+        total += samples
+        pos += frame_len
+    return total / sample_rate
+
+
+def segment_durations(audio_dir: Union[str, Path] = DEFAULT_AUDIO_DIR) -> Dict[str, float]:
+    """audio/ 下全部旁白片段的时长，键为文件名（不含扩展名），如 "03_entropy_2" """
+    return {p.stem: mp3_duration(p) for p in sorted(Path(audio_dir).glob("*.mp3"))}
+
+
+@dataclass
+class Cue:
+    segment: str
+    file: str
+    offset: float
+    duration: float
+
+
+class NarrationTimingMixin:
+    """按旁白片段时长安排动画时间，并记录每段旁白在时间线上的位置
+
+    narration_dir：旁白目录（默认仓库 audio/）
+    narration_embed：为 True 时同时用 add_sound 把旁白写进渲染结果；
+                     默认只记 cue 表，由 mux 步骤混音
+    cue 表在 tear_down 时写到 media/narration/<场景类名>.json
+    """
+
+    narration_dir: Union[str, Path] = DEFAULT_AUDIO_DIR
+    narration_embed: bool = False
+    narration_cue_dir: Union[str, Path] = DEFAULT_CUE_DIR
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._segment_durations = segment_durations(self.narration_dir)
+        self.narration_cues: List[Cue] = []
+
+    @property
+    def _now(self) -> float:
+        return float(self.renderer.time)
+
+    def segment_duration(self, name: str) -> float:
+        try:
+            return self._segment_durations[name]
+        except KeyError:
+            raise KeyError(f"narration segment not found: {name} in {self.narration_dir}") from None
+
+    def start_segment(self, name: str) -> Cue:
+        """旁白片段从当前时刻开始"""
+        path = Path(self.narration_dir) / f"{name}.mp3"
+        cue = Cue(segment=name, file=str(path), offset=round(self._now, 4),
+                  duration=round(self.segment_duration(name), 4))
+        self.narration_cues.append(cue)
+        if self.narration_embed:
+            self.add_sound(str(path))
+        return cue
+
+    def segment_end(self, name: str) -> float:
+        for cue in reversed(self.narration_cues):
+            if cue.segment == name:
+                return cue.offset + cue.duration
+        raise KeyError(f"segment {name} was not started; call start_segment first")
+
+    def wait_for_segment(self, name: str, pad: float = 0.0) -> float:
+        """等到该片段读完（再留 pad 秒）；已经读完则不等，返回实际等待的秒数"""
+        remaining = self.segment_end(name) + pad - self._now
+        if remaining > 1e-3:
+            self.wait(remaining)
+            return remaining
+        return 0.0
+
+    def play_for_segment(self, *animations, segment: str, start: bool = True, **kwargs):
+        """把这次 play 拉伸到片段长度；start=True 时片段同时开始"""
+        if start:
+            self.start_segment(segment)
+            kwargs["run_time"] = self.segment_duration(segment)
+        else:
+            kwargs["run_time"] = max(self.segment_end(segment) - self._now, 1 / 60)
+        return self.play(*animations, **kwargs)
+
+    def tear_down(self):
+        super().tear_down()
+        if self.narration_cues:
+            save_cues(self.narration_cues, Path(self.narration_cue_dir) / f"{type(self).__name__}.json")
+
+
+def save_cues(cues: List[Cue], path: Union[str, Path]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps([asdict(c) for c in cues], ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def load_cues(path: Union[str, Path]) -> List[Cue]:
+    return [Cue(**c) for c in json.loads(Path(path).read_text(encoding="utf-8"))]
+
+
+def mux_command(video: Union[str, Path], cues: List[Cue], out: Union[str, Path],
+                audio_bitrate: str = "192k") -> List[str]:
+    """ffmpeg 命令：每段旁白 adelay 到各自偏移后 amix，视频流直接复制"""
+    ffmpeg = shutil.which("ffmpeg") or "ffmpeg"
+    cmd = [ffmpeg, "-y", "-v", "error", "-i", str(video)]
+    for cue in cues:
+        cmd += ["-i", cue.file]
+    chains = []
+    for i, cue in enumerate(cues, start=1):
+        ms = int(round(cue.offset * 1000))
+        chains.append(f"[{i}:a]adelay={ms}|{ms}[a{i}]")
+    mix = "".join(f"[a{i}]" for i in range(1, len(cues) + 1))
+    chains.append(f"{mix}amix=inputs={len(cues)}:dropout_transition=0:normalize=0[aout]")
+    cmd += [
+        "-filter_complex", ";".join(chains),
+        "-map", "0:v", "-map", "[aout]",
+        "-c:v", "copy", "-c:a", "aac", "-b:a", audio_bitrate,
+        str(out),
+    ]
+    return cmd
+
+
+def mux_narration(video: Union[str, Path], cues: List[Cue], out: Union[str, Path]) -> Path:
+    if not cues:
+        raise ValueError("no narration cues to mux")
+    subprocess.run(mux_command(video, cues, out), check=True)
+    return Path(out)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="旁白时长与混音")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("durations", help="print mp3 durations read from frame headers")
+    p.add_argument("audio_dir", nargs="?", default=str(DEFAULT_AUDIO_DIR))
+    p = sub.add_parser("mux", help="place narration clips at their cue offsets")
+    p.add_argument("video")
+    p.add_argument("cues", help="cue JSON written by NarrationTimingMixin")
+    p.add_argument("--out", required=True)
+    p.add_argument("--dry-run", action="store_true", help="print the ffmpeg command only")
+    args = parser.parse_args()
+
+    if args.cmd == "durations":
+        durations = segment_durations(args.audio_dir)
+        for name, sec in durations.items():
+            print(f"{name:28s} {sec:7.3f}s")
+        print(f"{len(durations)} files, {sum(durations.values()):.2f}s total")
+        return 0
+
+    cues = load_cues(args.cues)
+    if args.dry_run:
+        print(" ".join(mux_command(args.video, cues, args.out)))
+        return 0
+    print(f"[MUX] {mux_narration(args.video, cues, args.out)} ({len(cues)} clips)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
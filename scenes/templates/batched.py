@@ -0,0 +1,85 @@
+"""
+批量几何
+把成百上千个圆点 / 线段写成一个 VMobject 的子路径：点坐标一次向量化算出，
+Cairo 每种样式只画一条路径，而不是每个 Dot / Line 各建一个对象。
+同一个 VMobject 内只能有一种颜色和不透明度，需要多种样式时按样式分组，每组一个 VMobject。
+批量对象按基准坐标重算子路径时，用 PlacementMixin 换算到当前的位置 / 大小 / 朝向。
+"""
+
+import numpy as np
+
+
+def circle_template(segments: int = 8) -> np.ndarray:
+    """单位圆的三次贝塞尔控制点 (segments * 4, 3)，与 manim 的 Dot 同样分 8 段"""
+    phi = 2 * np.pi / segments
+    h = 4 / 3 * np.tan(phi / 4)
+    a0 = np.arange(segments) * phi
+    a1 = a0 + phi
+    p0 = np.stack([np.cos(a0), np.sin(a0)], axis=1)
+    p3 = np.stack([np.cos(a1), np.sin(a1)], axis=1)
+    p1 = p0 + h * np.stack([-np.sin(a0), np.cos(a0)], axis=1)
+    p2 = p3 - h * np.stack([-np.sin(a1), np.cos(a1)], axis=1)
+    ctrl = np.stack([p0, p1, p2, p3], axis=1).reshape(-1, 2)
+    return np.column_stack([ctrl, np.zeros(len(ctrl))])
+
+
+_UNIT_CIRCLE = circle_template()
+
+
+def circle_points(centers: np.ndarray, radii) -> np.ndarray:
+    """m 个圆的控制点 (m * 32, 3)；radii 为标量或长度 m 的数组"""
+    centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), (len(centers),))
+    return (centers[:, None, :] + radii[:, None, None] * _UNIT_CIRCLE[None]).reshape(-1, 3)
+
+
+def segment_points(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """m 条直线段的控制点 (m * 4, 3)：每段一条退化的三次贝塞尔曲线，与 Line 相同"""
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+    w = np.array([0.0, 1 / 3, 2 / 3, 1.0])[None, :, None]
+    return (starts[:, None, :] + w * (ends - starts)[:, None, :]).reshape(-1, 3)
+
+
+# 锚点线段长度：远小于一个像素，即使被外层 set_stroke 加粗也画不出东西
+ANCHOR_LENGTH = 1e-3
+
+
+class PlacementMixin:
+    """从对象自身的点推出它当前被平移 / 缩放 / 旋转到了哪里
+
+    对象自己（不是子对象）持有一条极短、不可见的线段作锚点：基准坐标里从 anchor 指向 +x。
+    shift / scale / rotate 不论作用在对象本身、外层 VGroup 还是 .animate 上，最终都是改家族里所有的点，
+    锚点跟着一起动，所以不必覆写这些方法去记账。place() 把基准坐标换算成当前场景坐标。
+    anchor 应落在图形内部（如节点坐标的均值），以免锚点撑大外框、改变 get_center()。
+    只支持等比缩放和绕 z 轴旋转；stretch 等非等比变换之后重算的结果不对。
+    """
+
+    def _init_placement(self, anchor, offset=(0.0, 0.0, 0.0)) -> None:
+        """基准坐标 p 初始摆在 p + offset"""
+        self._anchor = np.asarray(anchor, dtype=float).reshape(3)
+        start = self._anchor + np.asarray(offset, dtype=float)
+        self.set_points(segment_points(start, start + [ANCHOR_LENGTH, 0.0, 0.0]))
+        self.set_fill(opacity=0, family=False)
+        self.set_stroke(width=0, opacity=0, family=False)
+
+    def _placement(self):
+        start = self.points[0]
+        # (cos θ, sin θ) · zoom
+        axis = (self.points[-1] - start) / ANCHOR_LENGTH
+        return start, axis
+
+    @property
+    def zoom(self) -> float:
+        _, axis = self._placement()
+        return float(np.hypot(axis[0], axis[1]))
+
+    def place(self, base: np.ndarray) -> np.ndarray:
+        """基准坐标 (..., 3) → 当前场景坐标"""
+        start, axis = self._placement()
+        rel = np.asarray(base, dtype=float) - self._anchor
+        out = np.empty(rel.shape)
+        out[..., 0] = axis[0] * rel[..., 0] - axis[1] * rel[..., 1]
+        out[..., 1] = axis[1] * rel[..., 0] + axis[0] * rel[..., 1]
+        out[..., 2] = np.hypot(axis[0], axis[1]) * rel[..., 2]
+        return start + out
@@ -0,0 +1,209 @@
+"""
+无编码试运行
+在跳过动画、不写视频的模式下执行场景的 construct，
+供帧采样、布局检查、时长估算等工具复用。
+
+    scene_cls = load_scene_class("scenes/信息论/information_theory_ep20.py", "InformationTheoryEP20")
+    scene = run_dry(scene_cls)
+    print(scene.timeline_time, scene.sections)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from manim import Scene, Wait, tempconfig
+
+# 这些方法由 manim 调度，不算作"分段"
+_NON_SECTION_METHODS = {"construct", "setup", "tear_down", "setup_scene"}
+
+_TEMPLATES_PACKAGE = __name__.rsplit(".", 1)[0]
+
+
+def load_scene_module(script: Union[str, Path]):
+    """按文件路径加载场景脚本；与 manim 命令行一样把脚本所在目录加入 sys.path"""
+    path = Path(script).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"missing script: {path}")
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+
+    digest = hashlib.md5(str(path).encode("utf-8")).hexdigest()[:8]
+    module_name = f"_dry_run_{path.stem}_{digest}"
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return module
+
+
+def scene_classes(module) -> List[type]:
+    """模块里自己定义的场景类（不含 import 进来的）"""
+    return [
+        obj for obj in vars(module).values()
+        if inspect.isclass(obj) and issubclass(obj, Scene) and obj.__module__ == module.__name__
+    ]
+
+
+def load_scene_class(script: Union[str, Path], class_name: Optional[str] = None) -> type:
+    """按文件路径加载场景类；不给类名时脚本里必须恰好有一个场景"""
+    module = load_scene_module(script)
+    if class_name:
+        try:
+            return getattr(module, class_name)
+        except AttributeError:
+            raise ValueError(f"{class_name} not found in {Path(script).name}") from None
+
+    candidates = scene_classes(module)
+    if len(candidates) != 1:
+        names = [c.__name__ for c in candidates]
+        raise ValueError(f"expected exactly one scene in {Path(script).name}, found {names}; pass class_name")
+    return candidates[0]
+
+
+class TimelineMixin:
+    """记录时间线：每次 play/wait 的起止时间、所属分段，以及各分段的时间跨度
+
+    分段优先取 next_section 的名称，否则取 construct 直接调用的方法名
+    （本仓库各集都按"一个方法一段"组织）。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.play_log: List[Dict[str, Any]] = []
+        self.sections: List[Dict[str, Any]] = []
+        self._method_stack: List[str] = []
+        self._manual_section: Optional[str] = None
+        # run_dry 会把渲染器的 update_frame 换成空操作，这里保留原始光栅化入口
+        self.rasterize_frame: Callable = self.renderer.update_frame
+        self._wrap_section_methods()
+
+    def _wrap_section_methods(self) -> None:
+        skip = {"play", "wait", "play_internal"}
+        seen = set()
+        for cls in type(self).__mro__:
+            module = getattr(cls, "__module__", "")
+            # manim 自身和本目录的各个混入类都不算分段
+            if module.startswith("manim") or module.startswith(_TEMPLATES_PACKAGE):
+                continue
+            for name, attr in vars(cls).items():
+                if name in seen or name in skip or name.startswith("__"):
+                    continue
+                seen.add(name)
+                if inspect.isfunction(attr):
+                    setattr(self, name, self._track_method(name, getattr(self, name)))
+
+    def _track_method(self, name: str, bound: Callable) -> Callable:
+        stack = self._method_stack
+
+        def wrapper(*args, **kwargs):
+            stack.append(name)
+            try:
+                return bound(*args, **kwargs)
+            finally:
+                stack.pop()
+
+        wrapper.__wrapped__ = bound
+        return wrapper
+
+    @property
+    def timeline_time(self) -> float:
+        return float(self.renderer.time)
+
+    @property
+    def current_section(self) -> str:
+        if self._manual_section:
+            return self._manual_section
+        for name in self._method_stack:
+            if name not in _NON_SECTION_METHODS:
+                return name
+        return "construct"
+
+    def next_section(self, name: str = "unnamed", *args, **kwargs):
+        self._manual_section = name
+        return super().next_section(name, *args, **kwargs)
+
+    def play(self, *args, **kwargs):
+        section = self.current_section
+        start = self.timeline_time
+        self._play_start = start
+        result = super().play(*args, **kwargs)
+        end = self.timeline_time
+        is_wait = len(args) == 1 and isinstance(args[0], Wait)
+        entry = {
+            "index": len(self.play_log),
+            "section": section,
+            "start": round(start, 4),
+            "run_time": round(end - start, 4),
+            "kind": "wait" if is_wait else "play",
+            "animations": [type(a).__name__ for a in args],
+        }
+        self.play_log.append(entry)
+
+        if self.sections and self.sections[-1]["name"] == section:
+            self.sections[-1]["end"] = round(end, 4)
+            self.sections[-1]["plays"] += 1
+        else:
+            self.sections.append({"name": section, "start": round(start, 4), "end": round(end, 4), "plays": 1})
+        return result
+
+    def timeline_summary(self) -> Dict[str, Any]:
+        return {
+            "scene": type(self).__name__,
+            "duration": round(self.timeline_time, 4),
+            "n_plays": sum(1 for p in self.play_log if p["kind"] == "play"),
+            "n_waits": sum(1 for p in self.play_log if p["kind"] == "wait"),
+            "sections": [
+                dict(s, duration=round(s["end"] - s["start"], 4)) for s in self.sections
+            ],
+            "plays": self.play_log,
+        }
+
+
+def compose_scene(scene_cls: type, mixins: Sequence[type], attrs: Optional[Dict[str, Any]] = None) -> type:
+    """在原场景类前面叠加混入类，类名保持不变（输出文件名不受影响）"""
+    bases = tuple(m for m in mixins if not issubclass(scene_cls, m)) + (scene_cls,)
+    namespace = dict(attrs or {})
+    namespace.setdefault("__module__", scene_cls.__module__)
+    return type(scene_cls.__name__, bases, namespace)
+
+
+def run_dry(scene_cls: type,
+            mixins: Sequence[type] = (TimelineMixin,),
+            attrs: Optional[Dict[str, Any]] = None,
+            rasterize: bool = False,
+            config_overrides: Optional[Dict[str, Any]] = None) -> Scene:
+    """跳过全部动画执行场景，不写视频；rasterize=False 时连静态帧也不光栅化
+
+    返回执行完毕的场景实例，时间线等信息挂在实例上。
+    """
+    overrides = {
+        "dry_run": True,
+        "disable_caching": True,
+        "preview": False,
+        "progress_bar": "none",
+        "verbosity": "ERROR",
+    }
+    overrides.update(config_overrides or {})
+
+    klass = compose_scene(scene_cls, mixins, attrs)
+    with tempconfig(overrides):
+        scene = klass()
+        renderer = scene.renderer
+        renderer._original_skipping_status = True
+        renderer.skip_animations = True
+        if not rasterize:
+            renderer.update_frame = lambda *args, **kwargs: None
+        scene.render()
+    return scene
@@ -0,0 +1,236 @@
+"""
+采样帧渲染
+在跳过模式下跑完整条时间线，只在指定时刻光栅化并保存 PNG，不编码视频。
+用于布局 / OCR 质检：几秒钟拿到和成片同一时刻的画面，而不必等完整渲染。
+
+    python -m scenes.templates.frame_sampler scenes/信息论/information_theory_ep20.py \\
+        InformationTheoryEP20 --count 8 --out media/qa_frames/ep20
+    python -m scenes.templates.frame_sampler ... --sections   # 每段结束前的最满画面
+
+采样时刻与 it_qa 对视频取帧的方式一致：在 [0, 总帧数 - 1] 上均匀取 count 帧。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from PIL import Image
+from manim import config
+
+from scenes.templates.dry_run import TimelineMixin, load_scene_class, run_dry
+
+MANIFEST_NAME = "manifest.json"
+
+QUALITY_ALIASES = {
+    "low": "low_quality",
+    "medium": "medium_quality",
+    "high": "high_quality",
+    "production": "production_quality",
+    "fourk": "fourk_quality",
+}
+
+
+class FrameSamplerMixin(TimelineMixin):
+    """在 sample_times 指定的时刻截取画面；sample_section_plays 给出的第几次 play 开始前另截一帧
+
+    分段画面取每段最后一个动画开始前的状态，哪一次 play 是段内最后一次由先跑一遍的试运行得出
+    （见 section_last_plays），这样只在这几次 play 前光栅化，而不是每次都截。
+    """
+
+    sample_times: Sequence[float] = ()
+    sample_section_plays: Sequence[int] = ()
+    sample_dir: Union[str, Path] = "media/qa_frames"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sampled_frames: List[Dict[str, Any]] = []
+        self._pending_times = sorted(float(t) for t in self.sample_times)
+        self._section_plays = set(int(i) for i in self.sample_section_plays)
+        self._section_frames: List[tuple] = []
+        Path(self.sample_dir).mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # 截帧
+    # ------------------------------------------------------------------
+    def _grab(self) -> np.ndarray:
+        renderer = self.renderer
+        # 静态底图在跳过模式下可能残留上一次截帧的内容，截帧时一律重画全部对象
+        saved_static = renderer.static_image
+        renderer.static_image = None
+        try:
+            self.rasterize_frame(self)
+            return renderer.get_frame()
+        finally:
+            renderer.static_image = saved_static
+
+    def _save(self, frame: np.ndarray, t: float, section: str, kind: str) -> None:
+        index = len(self.sampled_frames)
+        frame_no = int(round(t * config.frame_rate))
+        path = Path(self.sample_dir) / f"{index:03d}_{kind}_f{frame_no:05d}.png"
+        Image.fromarray(frame[..., :3]).save(path)
+        self.sampled_frames.append({
+            "index": index,
+            "kind": kind,
+            "time": round(t, 4),
+            "frame": frame_no,
+            "section": section,
+            "path": str(path),
+        })
+
+    def _take_pending(self, start: float, end: float, inclusive: bool) -> List[float]:
+        taken = []
+        while self._pending_times:
+            t = self._pending_times[0]
+            if t < end or (inclusive and t <= end + 1e-9):
+                taken.append(max(t, start))
+                self._pending_times.pop(0)
+            else:
+                break
+        return taken
+
+    # ------------------------------------------------------------------
+    # 场景接口
+    # ------------------------------------------------------------------
+    def play(self, *args, **kwargs):
+        if len(self.play_log) in self._section_plays:
+            # 段内最后一个动画开始前：此时就是这一段的完整布局
+            self._section_frames.append((self.current_section, self.timeline_time, self._grab()))
+
+        section = self.current_section
+        result = super().play(*args, **kwargs)
+        # 冻结帧的 wait 不会进入 play_internal，剩余时刻直接截当前画面
+        for t in self._take_pending(self._play_start, self.timeline_time, inclusive=False):
+            self._save(self._grab(), t, section, "time")
+        return result
+
+    def play_internal(self, skip_rendering: bool = False):
+        if self.renderer.skip_animations:
+            start = self._play_start
+            run_time = self.get_run_time(self.animations)
+            for t in self._take_pending(start, start + run_time, inclusive=False):
+                self.update_to_time(t - start)
+                self._save(self._grab(), t, self.current_section, "time")
+        return super().play_internal(skip_rendering)
+
+    def tear_down(self):
+        super().tear_down()
+        end = self.timeline_time
+        for t in self._take_pending(end, end, inclusive=True):
+            self._save(self._grab(), t, self.current_section, "time")
+        for section, t, frame in self._section_frames:
+            self._save(frame, t, section, "section")
+
+
+def section_last_plays(play_log: Sequence[Dict[str, Any]]) -> List[int]:
+    """每一段（连续属于同一分段的 play/wait）里最后一次的序号"""
+    return [
+        p["index"] for i, p in enumerate(play_log)
+        if i + 1 == len(play_log) or play_log[i + 1]["section"] != p["section"]
+    ]
+
+
+def evenly_spaced_times(duration: float, count: int, fps: float) -> List[float]:
+    """与 it_qa 对视频取帧一致：在 [0, 总帧数 - 1] 上均匀取 count 帧，返回对应时刻"""
+    total = int(round(duration * fps))
+    idxs = np.linspace(0, max(total - 1, 1), count, dtype=int)
+    return [float(i) / fps for i in idxs]
+
+
+def render_sample_frames(script: Union[str, Path],
+                         class_name: Optional[str] = None,
+                         out_dir: Union[str, Path] = "media/qa_frames",
+                         count: Optional[int] = None,
+                         times: Optional[Sequence[float]] = None,
+                         sections: bool = False,
+                         quality: str = "low",
+                         resolution: Optional[Sequence[int]] = None,
+                         fps: Optional[float] = None) -> Dict[str, Any]:
+    """渲染采样帧，返回清单（同时写入 out_dir/manifest.json）
+
+    count 或 sections 给定时先做一次不光栅化的试运行，拿到总时长与每段最后一次 play 的序号。
+    """
+    scene_cls = load_scene_class(script, class_name)
+    overrides: Dict[str, Any] = {"quality": QUALITY_ALIASES.get(quality, quality)}
+    if resolution:
+        overrides["pixel_width"], overrides["pixel_height"] = int(resolution[0]), int(resolution[1])
+    if fps:
+        overrides["frame_rate"] = float(fps)
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for old in out_dir.glob("*.png"):
+        old.unlink()
+
+    sample_times = list(times or [])
+    section_plays: List[int] = []
+    if count or sections:
+        probe = run_dry(scene_cls, config_overrides=overrides)
+        if count:
+            frame_rate = fps or _frame_rate_for(overrides)
+            sample_times += evenly_spaced_times(probe.timeline_time, count, frame_rate)
+        if sections:
+            section_plays = section_last_plays(probe.play_log)
+
+    attrs = {
+        "sample_times": tuple(sample_times),
+        "sample_section_plays": tuple(section_plays),
+        "sample_dir": str(out_dir),
+    }
+    scene = run_dry(scene_cls, mixins=(FrameSamplerMixin,), attrs=attrs, config_overrides=overrides)
+
+    manifest = {
+        "script": str(script),
+        "scene": scene_cls.__name__,
+        "duration": round(scene.timeline_time, 4),
+        "fps": _frame_rate_for(overrides),
+        "resolution": [scene.camera.pixel_width, scene.camera.pixel_height],
+        "sections": scene.timeline_summary()["sections"],
+        "frames": scene.sampled_frames,
+    }
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return manifest
+
+
+def _frame_rate_for(overrides: Dict[str, Any]) -> float:
+    from manim import tempconfig
+
+    with tempconfig(overrides):
+        return float(config.frame_rate)
+
+
+def load_manifest(frames_dir: Union[str, Path]) -> Dict[str, Any]:
+    return json.loads((Path(frames_dir) / MANIFEST_NAME).read_text(encoding="utf-8"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="跳过编码，只渲染指定时刻的画面")
+    parser.add_argument("script")
+    parser.add_argument("scene", nargs="?", default=None)
+    parser.add_argument("--out", default="media/qa_frames")
+    parser.add_argument("--count", type=int, default=None, help="evenly spaced frames over the timeline")
+    parser.add_argument("--times", type=float, nargs="*", default=None, help="explicit timestamps in seconds")
+    parser.add_argument("--sections", action="store_true", help="one frame per section, before its last animation")
+    parser.add_argument("--quality", default="low", help="low / medium / high / production / fourk")
+    parser.add_argument("-r", "--resolution", default=None, help="W,H")
+    parser.add_argument("--fps", type=float, default=None)
+    args = parser.parse_args()
+
+    if not (args.count or args.times or args.sections):
+        args.count = 8
+    resolution = [int(v) for v in args.resolution.split(",")] if args.resolution else None
+
+    manifest = render_sample_frames(
+        args.script, args.scene, out_dir=args.out, count=args.count, times=args.times,
+        sections=args.sections, quality=args.quality, resolution=resolution, fps=args.fps,
+    )
+    print(f"[FRAMES] {manifest['scene']} duration={manifest['duration']:.2f}s "
+          f"frames={len(manifest['frames'])} -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
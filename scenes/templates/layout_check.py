@@ -0,0 +1,372 @@
+"""
+布局校验
+每次 play 结束时把画面上所有文字类对象的包围盒取成数组，
+用排序扫描（sort-and-sweep）找重叠，并检查安全区边距。
+
+    class MyScene(LayoutValidatorMixin, Scene): ...     # 或用 run_dry 在试运行中叠加
+    allow_overlap(label_group)                          # 组内有意重叠，不报
+
+整个目录批量检查（跳过模式、不光栅化，多进程）：
+
+    python -m scenes.templates.layout_check scenes --jobs 4 --out media/layout_reports
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from manim import (
+    DecimalNumber, MarkupText, MathTex, Mobject, Paragraph, Scene, SingleStringMathTex,
+    Tex, Text, VMobject, config,
+)
+
+from scenes.templates.dry_run import (
+    TimelineMixin, load_scene_class, load_scene_module, run_dry, scene_classes,
+)
+
+# 作为一个整体参与重叠检查的对象类型
+TEXT_TYPES = (Text, MarkupText, Paragraph, MathTex, Tex, SingleStringMathTex, DecimalNumber)
+
+# 默认安全区：距画面上、下、左、右边缘的最小距离（场景坐标单位）
+DEFAULT_SAFE_MARGINS = {"top": 0.4, "bottom": 0.5, "left": 0.3, "right": 0.3}
+
+# 目录批量检查时跳过的非场景脚本
+SKIP_DIRS = {"templates", "components", "__pycache__"}
+SKIP_FILES = {"__init__.py", "it_common.py", "it_qa.py", "run_episode_pipeline.py"}
+
+
+def allow_overlap(*mobjects: Mobject, safe_area: bool = False) -> Mobject:
+    """标记有意重叠的组：组内文字之间的重叠不报；safe_area=True 时连安全区也不查
+
+    只在对象上打标记，没有叠加校验混入类的正常渲染不受影响。
+    """
+    for mob in mobjects:
+        mob.layout_exempt = True
+        if safe_area:
+            mob.layout_exempt_safe_area = True
+    return mobjects[0] if len(mobjects) == 1 else mobjects
+
+
+# ----------------------------------------------------------------------
+# 数组化的包围盒与重叠检测
+# ----------------------------------------------------------------------
+def bounding_boxes(mobjects: Sequence[Mobject]) -> np.ndarray:
+    """一次性求多个对象的轴对齐包围盒，形状 (n, 4)：x1, y1, x2, y2；没有点的对象为 nan"""
+    boxes = np.full((len(mobjects), 4), np.nan)
+    points, owners = [], []
+    for i, mob in enumerate(mobjects):
+        pts = mob.get_all_points()
+        if len(pts):
+            points.append(pts[:, :2])
+            owners.append(i)
+    if not points:
+        return boxes
+    lengths = np.array([len(p) for p in points])
+    stacked = np.concatenate(points)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    owners = np.array(owners)
+    boxes[owners, 0:2] = np.minimum.reduceat(stacked, starts, axis=0)
+    boxes[owners, 2:4] = np.maximum.reduceat(stacked, starts, axis=0)
+    return boxes
+
+
+def overlap_ratios(boxes: np.ndarray, i: int, js: np.ndarray) -> np.ndarray:
+    """盒 i 与一批盒 js 的交集面积 / 较小者面积，与 it_qa 的 OCR 重叠口径一致"""
+    b = boxes[i]
+    others = boxes[js]
+    w = np.minimum(b[2], others[:, 2]) - np.maximum(b[0], others[:, 0])
+    h = np.minimum(b[3], others[:, 3]) - np.maximum(b[1], others[:, 1])
+    inter = np.clip(w, 0, None) * np.clip(h, 0, None)
+    area_i = max((b[2] - b[0]) * (b[3] - b[1]), 1e-9)
+    area_js = np.maximum((others[:, 2] - others[:, 0]) * (others[:, 3] - others[:, 1]), 1e-9)
+    return inter / np.minimum(area_i, area_js)
+
+
+def sweep_overlaps(boxes: np.ndarray,
+                   min_ratio: float = 0.0,
+                   groups: Optional[np.ndarray] = None,
+                   inclusive: bool = False) -> List[Tuple[int, int, float]]:
+    """排序扫描找出所有重叠对 (i, j, ratio)
+
+    按左边界排序后，每个盒只需和左边界落在自己 [x1, x2) 内的后续盒比较；
+    groups 相同且非负的两个盒属于同一豁免组，不计。
+    inclusive=True 时按闭区间判断相交（忽略 min_ratio）：贴边的盒、零高度的水平线也算。
+    """
+    valid = np.flatnonzero(~np.isnan(boxes).any(axis=1))
+    if len(valid) < 2:
+        return []
+    order = valid[np.argsort(boxes[valid, 0], kind="stable")]
+    x1_sorted = boxes[order, 0]
+    ends = np.searchsorted(x1_sorted, boxes[order, 2], side="right" if inclusive else "left")
+
+    pairs = []
+    for k in range(len(order)):
+        if ends[k] <= k + 1:
+            continue
+        i = order[k]
+        js = order[k + 1:ends[k]]
+        ratios = overlap_ratios(boxes, i, js)
+        if inclusive:
+            others = boxes[js]
+            hit = (others[:, 0] <= boxes[i, 2]) & (others[:, 2] >= boxes[i, 0]) \
+                & (others[:, 1] <= boxes[i, 3]) & (others[:, 3] >= boxes[i, 1])
+        else:
+            hit = ratios > min_ratio
+        if groups is not None and groups[i] >= 0:
+            hit &= groups[js] != groups[i]
+        for j, r in zip(js[hit], ratios[hit]):
+            pairs.append((int(min(i, j)), int(max(i, j)), float(r)))
+    return pairs
+
+
+def safe_area_violations(boxes: np.ndarray, margins: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """返回越过安全区的盒的下标；完全在画面外的对象（如等待滑入）不算"""
+    m = dict(DEFAULT_SAFE_MARGINS, **(margins or {}))
+    half_w, half_h = config.frame_width / 2, config.frame_height / 2
+    x1, y1, x2, y2 = boxes.T
+    with np.errstate(invalid="ignore"):
+        on_screen = (x2 > -half_w) & (x1 < half_w) & (y2 > -half_h) & (y1 < half_h)
+        outside = (
+            (y2 > half_h - m["top"]) | (y1 < -half_h + m["bottom"])
+            | (x1 < -half_w + m["left"]) | (x2 > half_w - m["right"])
+        )
+    return np.flatnonzero(on_screen & outside)
+
+
+def _is_visible(mob: Mobject) -> bool:
+    for sub in mob.get_family():
+        if isinstance(sub, VMobject) and len(sub.points):
+            if np.any(sub.get_fill_opacities() > 0.01) or np.any(sub.get_stroke_opacities() > 0.01):
+                return True
+    return False
+
+
+def text_content(mob: Mobject) -> str:
+    """文字对象的原始字符串（Text 的 text、MathTex 的 tex_string、数字的当前值）"""
+    text = getattr(mob, "text", None) or getattr(mob, "tex_string", None) or getattr(mob, "original_text", None)
+    if text is None and isinstance(mob, DecimalNumber):
+        text = str(mob.get_value())
+    return str(text) if text else ""
+
+
+def _label(mob: Mobject) -> str:
+    text = text_content(mob)
+    return f"{type(mob).__name__}({text[:30]!r})" if text else type(mob).__name__
+
+
+def collect_units(mobjects: Iterable[Mobject],
+                  restrict_to: Optional[set] = None) -> Tuple[List[Mobject], np.ndarray, np.ndarray]:
+    """从场景顶层对象向下找文字单元，返回 (单元, 豁免组号, 是否跳过安全区)"""
+    units: List[Mobject] = []
+    groups: List[int] = []
+    skip_safe: List[bool] = []
+    group_ids: Dict[int, int] = {}
+
+    def walk(mob: Mobject, group: int, no_safe: bool, allowed: bool) -> None:
+        if getattr(mob, "layout_exempt", False):
+            group = group_ids.setdefault(id(mob), len(group_ids))
+        no_safe = no_safe or getattr(mob, "layout_exempt_safe_area", False)
+        allowed = allowed or restrict_to is None or id(mob) in restrict_to
+        if isinstance(mob, TEXT_TYPES):
+            if allowed and _is_visible(mob):
+                units.append(mob)
+                groups.append(group)
+                skip_safe.append(no_safe)
+            return
+        for sub in mob.submobjects:
+            walk(sub, group, no_safe, allowed)
+
+    for mob in mobjects:
+        walk(mob, -1, False, False)
+    return units, np.array(groups, dtype=int), np.array(skip_safe, dtype=bool)
+
+
+def scene_text_units(scene: Scene) -> Tuple[List[Mobject], np.ndarray, np.ndarray]:
+    """场景当前画面上的文字单元；三维视角下只取固定在画面上的对象（只有它们能按平面坐标判断）"""
+    fixed = getattr(scene.camera, "fixed_in_frame_mobjects", None)
+    restrict = None
+    if fixed is not None and (scene.camera.get_phi() or scene.camera.get_theta() + np.pi / 2):
+        restrict = {id(m) for m in fixed}
+    return collect_units(scene.mobjects, restrict)
+
+
+# ----------------------------------------------------------------------
+# 场景混入类
+# ----------------------------------------------------------------------
+class LayoutValidatorMixin(TimelineMixin):
+    """每次 play 结束时校验布局，结果累积在 layout_issues（同一问题跨多次 play 只记一次）
+
+    可在场景类上覆盖 layout_safe_margins / layout_overlap_ratio，
+    layout_exempt_sections 中的分段不检查。
+    """
+
+    layout_safe_margins: Dict[str, float] = {}
+    layout_overlap_ratio: float = 0.1
+    layout_exempt_sections: Sequence[str] = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.layout_issues: List[Dict[str, Any]] = []
+        self._open_issues: Dict[tuple, Dict[str, Any]] = {}
+
+    def play(self, *args, **kwargs):
+        result = super().play(*args, **kwargs)
+        self.check_layout()
+        return result
+
+    def check_layout(self) -> List[Dict[str, Any]]:
+        section = self.current_section
+        if section in self.layout_exempt_sections:
+            return []
+        units, groups, skip_safe = scene_text_units(self)
+        if not units:
+            return []
+        boxes = bounding_boxes(units)
+
+        found = []
+        for i, j, ratio in sweep_overlaps(boxes, self.layout_overlap_ratio, groups):
+            found.append(((("overlap", id(units[i]), id(units[j]))), {
+                "type": "overlap",
+                "a": _label(units[i]),
+                "b": _label(units[j]),
+                "ratio": round(ratio, 2),
+                "boxes": [np.round(boxes[i], 2).tolist(), np.round(boxes[j], 2).tolist()],
+            }))
+        for i in safe_area_violations(boxes, self.layout_safe_margins):
+            if skip_safe[i]:
+                continue
+            found.append(((("safe_area", id(units[i]))), {
+                "type": "safe_area",
+                "a": _label(units[i]),
+                "boxes": [np.round(boxes[i], 2).tolist()],
+            }))
+
+        now = round(self.timeline_time, 3)
+        current = {}
+        for key, issue in found:
+            record = self._open_issues.get(key)
+            if record is None:
+                record = dict(issue, section=section, first_time=now, last_time=now,
+                              play_index=len(self.play_log) - 1)
+                self.layout_issues.append(record)
+            record["last_time"] = now
+            current[key] = record
+        self._open_issues = current
+        return [issue for _, issue in found]
+
+    def layout_report(self) -> Dict[str, Any]:
+        return {
+            "scene": type(self).__name__,
+            "duration": round(self.timeline_time, 3),
+            "ok": not self.layout_issues,
+            "overlaps": sum(1 for i in self.layout_issues if i["type"] == "overlap"),
+            "safe_area": sum(1 for i in self.layout_issues if i["type"] == "safe_area"),
+            "issues": self.layout_issues,
+        }
+
+
+def validate_scene(script: Union[str, Path], class_name: Optional[str] = None,
+                   margins: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """对单个场景做一次跳过模式试运行并返回布局报告"""
+    scene_cls = load_scene_class(script, class_name)
+    attrs = {"layout_safe_margins": margins} if margins else None
+    scene = run_dry(scene_cls, mixins=(LayoutValidatorMixin,), attrs=attrs)
+    report = scene.layout_report()
+    report["script"] = str(script)
+    return report
+
+
+# ----------------------------------------------------------------------
+# 目录批量检查
+# ----------------------------------------------------------------------
+def discover_scenes(root: Union[str, Path]) -> List[Tuple[Path, str]]:
+    """找出目录下每个脚本里定义了 construct 的场景类；加载失败的脚本类名记为空串"""
+    found = []
+    for path in sorted(Path(root).rglob("*.py")):
+        if SKIP_DIRS & set(path.parts) or path.name in SKIP_FILES:
+            continue
+        try:
+            module = load_scene_module(path)
+        except Exception:
+            found.append((path, ""))
+            continue
+        for cls in scene_classes(module):
+            if _has_own_construct(cls):
+                found.append((path, cls.__name__))
+    return found
+
+
+def _has_own_construct(cls: type) -> bool:
+    for klass in cls.__mro__:
+        if "construct" in vars(klass):
+            return not klass.__module__.startswith("manim")
+    return False
+
+
+def _validate_job(script: str, class_name: str) -> Dict[str, Any]:
+    if not class_name:
+        return {"script": script, "scene": None, "ok": False, "error": "failed to load script"}
+    try:
+        return validate_scene(script, class_name)
+    except Exception as exc:
+        return {
+            "script": script, "scene": class_name, "ok": False,
+            "error": f"{type(exc).__name__}: {exc}",
+            "traceback": traceback.format_exc(limit=5),
+        }
+
+
+def validate_catalogue(root: Union[str, Path], jobs: int = 1) -> List[Dict[str, Any]]:
+    targets = discover_scenes(root)
+    if jobs <= 1:
+        return [_validate_job(str(p), c) for p, c in targets]
+    reports = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_validate_job, str(p), c) for p, c in targets]
+        for fut in as_completed(futures):
+            reports.append(fut.result())
+    return sorted(reports, key=lambda r: (r["script"], r.get("scene") or ""))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="跳过模式下批量检查文字重叠与安全区")
+    parser.add_argument("paths", nargs="+", help="scene scripts or directories")
+    parser.add_argument("--scene", default=None, help="scene class (single script only)")
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--out", default=None, help="directory for per-scene JSON reports")
+    args = parser.parse_args()
+
+    reports: List[Dict[str, Any]] = []
+    for p in args.paths:
+        if Path(p).is_dir():
+            reports += validate_catalogue(p, jobs=args.jobs)
+        else:
+            reports.append(_validate_job(p, args.scene or load_scene_class(p, args.scene).__name__))
+
+    if args.out:
+        out_dir = Path(args.out)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for r in reports:
+            name = r.get("scene") or Path(r["script"]).stem
+            (out_dir / f"{name}.json").write_text(json.dumps(r, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    failed = 0
+    for r in reports:
+        if r.get("error"):
+            status = f"ERROR {r['error']}"
+        else:
+            status = "ok" if r["ok"] else f"{r['overlaps']} overlaps, {r['safe_area']} safe-area"
+        failed += not r["ok"]
+        print(f"[LAYOUT] {r['script']} {r.get('scene') or '-'}: {status}")
+    print(f"[LAYOUT] {len(reports) - failed}/{len(reports)} scenes clean")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,184 @@
+"""
+文字布局导出
+渲染器本来就知道每个 Text / MathTex 的字符串和精确包围盒，不必再靠 OCR 从画面里猜。
+本模块在渲染（逐帧）或跳过模式试运行（逐次 play）时记录所有文字对象的
+像素坐标包围盒、内容和颜色，按列存成一个 .npz 文件，质检时直接读数组。
+
+    # 跳过模式，每次 play 结束记录一次（几秒钟）
+    python -m scenes.templates.layout_export scenes/信息论/information_theory_ep20.py \\
+        InformationTheoryEP20 --out media/layout/ep20.npz -r 1920,1080
+
+    # 正常渲染时顺带逐帧导出：场景继承 LayoutExportMixin 并设置环境变量
+    MANIM_LAYOUT_EXPORT=media/layout/ep20.npz manim -qh ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from manim import config
+
+from scenes.templates.dry_run import TimelineMixin, load_scene_class, run_dry
+from scenes.templates.layout_check import bounding_boxes, scene_text_units, text_content
+from scenes.templates.layout_table import COLUMNS, load_layout_table, save_layout_table
+
+LAYOUT_EXPORT_ENV_VAR = "MANIM_LAYOUT_EXPORT"
+
+
+def _color_hex(mob) -> str:
+    try:
+        color = mob.get_color()
+        return color.to_hex() if hasattr(color, "to_hex") else str(color)
+    except Exception:
+        return ""
+
+
+class LayoutExportMixin(TimelineMixin):
+    """记录文字对象的像素包围盒
+
+    layout_export_mode = "play"：每次 play / wait 结束记录一次（跳过模式下唯一可用的粒度）
+    layout_export_mode = "frame"：正常渲染时每个写出的帧都记录
+    layout_export_path 为空时读取环境变量 MANIM_LAYOUT_EXPORT；都为空则不写文件。
+    """
+
+    layout_export_mode: str = "play"
+    layout_export_path: Optional[Union[str, Path]] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._layout_rows: Dict[str, List[Any]] = {name: [] for name in COLUMNS}
+        self._layout_snapshots = 0
+
+    # ------------------------------------------------------------------
+    # 记录
+    # ------------------------------------------------------------------
+    def record_layout(self, t: Optional[float] = None) -> int:
+        """记录当前画面上全部文字对象，返回本次记录的条数"""
+        t = self.timeline_time if t is None else t
+        units, _, _ = scene_text_units(self)
+        self._layout_snapshots += 1
+        if not units:
+            return 0
+        boxes = bounding_boxes(units)
+        keep = ~np.isnan(boxes).any(axis=1)
+        px = self._to_pixels(boxes[keep])
+
+        rows = self._layout_rows
+        n = int(keep.sum())
+        rows["time"].extend([t] * n)
+        rows["frame"].extend([int(round(t * config.frame_rate))] * n)
+        rows["play"].extend([len(self.play_log)] * n)
+        rows["section"].extend([self.current_section] * n)
+        for k, name in enumerate(("x1", "y1", "x2", "y2")):
+            rows[name].extend(px[:, k].tolist())
+        for mob, ok in zip(units, keep):
+            if ok:
+                rows["text"].append(text_content(mob))
+                rows["color"].append(_color_hex(mob))
+                rows["kind"].append(type(mob).__name__)
+        return n
+
+    @staticmethod
+    def _to_pixels(boxes: np.ndarray) -> np.ndarray:
+        """场景坐标 → 像素坐标（原点在左上角，y 向下），返回 x1, y1(上), x2, y2(下)"""
+        sx = config.pixel_width / config.frame_width
+        sy = config.pixel_height / config.frame_height
+        cx, cy = config.frame_width / 2, config.frame_height / 2
+        out = np.empty_like(boxes)
+        out[:, 0] = (boxes[:, 0] + cx) * sx
+        out[:, 2] = (boxes[:, 2] + cx) * sx
+        out[:, 1] = (cy - boxes[:, 3]) * sy
+        out[:, 3] = (cy - boxes[:, 1]) * sy
+        return out
+
+    # ------------------------------------------------------------------
+    # 场景接口
+    # ------------------------------------------------------------------
+    def play(self, *args, **kwargs):
+        result = super().play(*args, **kwargs)
+        # play 之间新加的对象会在下一次 play 结束时一起记下
+        self.record_layout()
+        return result
+
+    def update_to_time(self, t):
+        super().update_to_time(t)
+        if self.layout_export_mode == "frame" and not self.renderer.skip_animations:
+            self.record_layout(self.timeline_time)
+
+    def tear_down(self):
+        super().tear_down()
+        path = self.layout_export_path or os.environ.get(LAYOUT_EXPORT_ENV_VAR)
+        if path:
+            self.save_layout_export(path)
+
+    # ------------------------------------------------------------------
+    # 输出
+    # ------------------------------------------------------------------
+    def layout_table(self) -> Dict[str, np.ndarray]:
+        rows = self._layout_rows
+        return {
+            "time": np.asarray(rows["time"], dtype=np.float32),
+            "frame": np.asarray(rows["frame"], dtype=np.int32),
+            "play": np.asarray(rows["play"], dtype=np.int32),
+            "section": np.asarray(rows["section"], dtype=str),
+            "x1": np.asarray(rows["x1"], dtype=np.float32),
+            "y1": np.asarray(rows["y1"], dtype=np.float32),
+            "x2": np.asarray(rows["x2"], dtype=np.float32),
+            "y2": np.asarray(rows["y2"], dtype=np.float32),
+            "text": np.asarray(rows["text"], dtype=str),
+            "color": np.asarray(rows["color"], dtype=str),
+            "kind": np.asarray(rows["kind"], dtype=str),
+        }
+
+    def save_layout_export(self, path: Union[str, Path]) -> Path:
+        meta = {
+            "scene": type(self).__name__,
+            "mode": self.layout_export_mode,
+            "width": config.pixel_width,
+            "height": config.pixel_height,
+            "fps": config.frame_rate,
+            "duration": f"{self.timeline_time:.4f}",
+        }
+        return save_layout_table(path, self.layout_table(), meta)
+
+
+def export_scene_layout(script: Union[str, Path],
+                        class_name: Optional[str],
+                        out: Union[str, Path],
+                        resolution: Optional[Sequence[int]] = None,
+                        fps: Optional[float] = None,
+                        mixins: Sequence[type] = ()) -> Any:
+    """跳过模式试运行并导出逐次 play 的布局；mixins 可叠加其他校验（同一趟试运行完成），返回场景实例"""
+    overrides: Dict[str, Any] = {}
+    if resolution:
+        overrides["pixel_width"], overrides["pixel_height"] = int(resolution[0]), int(resolution[1])
+    if fps:
+        overrides["frame_rate"] = float(fps)
+    scene_cls = load_scene_class(script, class_name)
+    attrs = {"layout_export_path": str(out), "layout_export_mode": "play"}
+    return run_dry(scene_cls, mixins=tuple(mixins) + (LayoutExportMixin,), attrs=attrs, config_overrides=overrides)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="导出文字对象的像素包围盒（跳过模式，逐次 play）")
+    parser.add_argument("script")
+    parser.add_argument("scene", nargs="?", default=None)
+    parser.add_argument("--out", required=True, help="output .npz path")
+    parser.add_argument("-r", "--resolution", default="1920,1080", help="W,H")
+    parser.add_argument("--fps", type=float, default=None)
+    args = parser.parse_args()
+
+    resolution = [int(v) for v in args.resolution.split(",")]
+    scene = export_scene_layout(args.script, args.scene, args.out, resolution=resolution, fps=args.fps)
+    table = load_layout_table(args.out)
+    print(f"[LAYOUT] {type(scene).__name__}: {len(table['text'])} boxes over "
+          f"{scene._layout_snapshots} snapshots -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
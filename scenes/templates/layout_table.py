@@ -0,0 +1,107 @@
+"""
+文字布局表（layout_export 的文件格式与检查）
+只依赖 numpy，质检脚本读取和检查时不必导入 manim。
+
+每行是某一时刻画面上的一个文字对象，列见 COLUMNS；
+坐标为像素，原点在左上角，y1 为上边、y2 为下边。
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+COLUMNS = ("time", "frame", "play", "section", "x1", "y1", "x2", "y2", "text", "color", "kind")
+META_FIELDS = ("scene", "mode", "width", "height", "fps", "duration")
+
+
+def save_layout_table(path: Union[str, Path], table: Dict[str, np.ndarray], meta: Dict[str, Any]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    meta_arr = np.array([str(meta[name]) for name in META_FIELDS])
+    np.savez_compressed(path, meta=meta_arr, **{name: table[name] for name in COLUMNS})
+    return path
+
+
+def load_layout_table(path: Union[str, Path]) -> Dict[str, Any]:
+    """读回导出文件：列数组 + scene / mode / width / height / fps / duration"""
+    with np.load(path, allow_pickle=False) as data:
+        table: Dict[str, Any] = {name: data[name] for name in COLUMNS}
+        scene, mode, width, height, fps, duration = data["meta"].tolist()
+    table.update({
+        "scene": scene,
+        "mode": mode,
+        "width": int(width),
+        "height": int(height),
+        "fps": float(fps),
+        "duration": float(duration),
+    })
+    return table
+
+
+def _pair_ratios(x1, y1, x2, y2) -> np.ndarray:
+    """一组盒两两之间的 交集 / 较小面积，与 OCR 重叠检查口径一致"""
+    w = np.minimum(x2[:, None], x2[None, :]) - np.maximum(x1[:, None], x1[None, :])
+    h = np.minimum(y2[:, None], y2[None, :]) - np.maximum(y1[:, None], y1[None, :])
+    inter = np.clip(w, 0, None) * np.clip(h, 0, None)
+    area = np.maximum((x2 - x1) * (y2 - y1), 1.0)
+    return inter / np.minimum(area[:, None], area[None, :])
+
+
+def check_layout_table(table: Dict[str, Any],
+                       top_margin: float = 20,
+                       bottom_margin: float = 40,
+                       overlap_th: float = 0.25) -> Dict[str, List[Dict[str, Any]]]:
+    """按快照（逐帧模式按帧、逐次 play 模式按 play）检查越界与重叠
+
+    同一对文字（或同一文字越界）在多个快照里重复出现只报一次，记首次出现的时间。
+    """
+    h = table["height"]
+    snap = table["frame"] if table["mode"] == "frame" else table["play"]
+    x1, y1, x2, y2 = (table[k].astype(np.float64) for k in ("x1", "y1", "x2", "y2"))
+    # 完全在画面外的对象（等待滑入 / 已滑出）不看
+    on_screen = (x2 > 0) & (x1 < table["width"]) & (y2 > 0) & (y1 < h)
+
+    out_of_bounds: List[Dict[str, Any]] = []
+    overlaps: List[Dict[str, Any]] = []
+    seen_oob, seen_overlap = set(), set()
+
+    bad = on_screen & ((y1 < top_margin) | (y2 > h - bottom_margin))
+    for i in np.flatnonzero(bad):
+        key = (str(table["text"][i]), round(float(y1[i])), round(float(y2[i])))
+        if key in seen_oob:
+            continue
+        seen_oob.add(key)
+        out_of_bounds.append({
+            "frame": int(table["frame"][i]),
+            "time": round(float(table["time"][i]), 2),
+            "section": str(table["section"][i]),
+            "box": [round(float(v), 1) for v in (x1[i], y1[i], x2[i], y2[i])],
+            "text": str(table["text"][i]),
+        })
+
+    order = np.argsort(snap, kind="stable")
+    bounds = np.flatnonzero(np.diff(snap[order])) + 1
+    for group in np.split(order, bounds):
+        group = group[on_screen[group]]
+        if len(group) < 2:
+            continue
+        ratios = _pair_ratios(x1[group], y1[group], x2[group], y2[group])
+        ii, jj = np.nonzero(np.triu(ratios > overlap_th, k=1))
+        for li, lj in zip(ii, jj):
+            a, b = group[li], group[lj]
+            key = tuple(sorted((str(table["text"][a]), str(table["text"][b]))))
+            if key in seen_overlap:
+                continue
+            seen_overlap.add(key)
+            overlaps.append({
+                "frame": int(table["frame"][a]),
+                "time": round(float(table["time"][a]), 2),
+                "section": str(table["section"][a]),
+                "ratio": round(float(ratios[li, lj]), 2),
+                "text_a": str(table["text"][a]),
+                "text_b": str(table["text"][b]),
+            })
+    return {"out_of_bounds": out_of_bounds, "overlaps": overlaps}
@@ -0,0 +1,83 @@
+"""
+细节层级（LOD）
+粒子数、采样密度、曲线分辨率统一按渲染质量缩放：
+-ql 草稿只算一小部分，-qh / -qk 成片保持原始数值。
+"""
+
+import os
+from typing import Optional, Sequence, Union
+
+from manim import config
+
+# 预设档位（相对完整细节的比例）
+LOD_PRESETS = {
+    "draft": 0.25,
+    "preview": 0.5,
+    "final": 1.0,
+}
+
+# 环境变量可强制指定档位，例如 MANIM_LOD=draft 或 MANIM_LOD=0.3
+LOD_ENV_VAR = "MANIM_LOD"
+
+_explicit_lod: Optional[float] = None
+
+
+def _parse_lod(value: Union[str, float]) -> float:
+    if isinstance(value, str):
+        key = value.strip().lower()
+        if key in LOD_PRESETS:
+            return LOD_PRESETS[key]
+        value = float(key)
+    value = float(value)
+    if not 0 < value <= 1:
+        raise ValueError(f"LOD factor must be in (0, 1], got {value}")
+    return value
+
+
+def set_lod(value: Optional[Union[str, float]]) -> None:
+    """显式设置细节层级；传 None 恢复为按渲染质量自动推断"""
+    global _explicit_lod
+    _explicit_lod = None if value is None else _parse_lod(value)
+
+
+def lod_from_quality() -> float:
+    """按当前渲染分辨率推断：480p 草稿、720p 预览、1080p 及以上为成片"""
+    height = config.pixel_height
+    if height <= 480:
+        return LOD_PRESETS["draft"]
+    if height <= 720:
+        return LOD_PRESETS["preview"]
+    return LOD_PRESETS["final"]
+
+
+def get_lod() -> float:
+    """当前细节层级：显式设置 > 环境变量 > 渲染质量"""
+    if _explicit_lod is not None:
+        return _explicit_lod
+    env = os.environ.get(LOD_ENV_VAR)
+    if env:
+        return _parse_lod(env)
+    return lod_from_quality()
+
+
+def lod_count(full: int, minimum: int = 1) -> int:
+    """粒子数 / 实体数：按比例线性缩放"""
+    return max(minimum, min(full, int(round(full * get_lod()))))
+
+
+def lod_resolution(full: int, minimum: int = 8) -> int:
+    """曲线采样点数 / 网格分辨率：按比例的平方根缩放，避免草稿里曲线明显折线化"""
+    return max(minimum, min(full, int(round(full * get_lod() ** 0.5))))
+
+
+def lod_subsample(points: Sequence, minimum: int = 8) -> list:
+    """把预先算好的长序列（如积分轨迹）按分辨率抽稀，保留首尾"""
+    n = len(points)
+    target = lod_resolution(n, minimum=min(minimum, n))
+    if target >= n:
+        return list(points)
+    stride = n / target
+    idx = [int(i * stride) for i in range(target)]
+    if idx[-1] != n - 1:
+        idx.append(n - 1)
+    return [points[i] for i in idx]
@@ -0,0 +1,314 @@
+"""
+旁白合成管线
+把解说稿拆成逐句片段，asyncio 并发合成（限制并发数），每段按 (文本, 音色, 语速, 引擎) 哈希缓存，
+改稿后只重新合成改动的句子。输出沿用 audio/ 的命名：NN_section_K.mp3，外加整段 NN_section.mp3。
+默认写到 media/tts/，不碰仓库里手工切分、已提交的 audio/；确认无误后再用 --out audio 覆盖。
+重新生成某段时，该段多出来的旧片段（如句数变少后的 NN_section_6.mp3）会被删掉。
+
+    python -m scenes.templates.narration scenes/math_magic/解说词.py
+    python -m scenes.templates.narration scenes/math_magic/解说词.py --backend offline
+    python -m scenes.templates.narration scenes/math_magic/解说词.py --out audio
+
+引擎可插拔：edge（edge_tts，需联网）和 offline（本地替身，按字数估算时长写静音 mp3，
+格式与 edge_tts 输出一致，用于离线跑通管线和时长对齐）。
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import asyncio
+import hashlib
+import json
+import re
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+DEFAULT_VOICE = "zh-CN-XiaoxiaoNeural"
+DEFAULT_RATE = "+0%"
+CACHE_DIRNAME = ".tts_cache"
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_OUT_DIR = REPO_ROOT / "media" / "tts"
+
+# 句末无标点、不超过这个长度、后面还有正文的首行视为段标题（未给 SECTIONS 时的兜底规则）
+_HEADING_MAX_CHARS = 12
+
+
+@dataclass
+class Segment:
+    section_index: int
+    section: str
+    k: int
+    text: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.section_index:02d}_{self.section}_{self.k}"
+
+    @property
+    def section_name(self) -> str:
+        return f"{self.section_index:02d}_{self.section}"
+
+
+# ----------------------------------------------------------------------
+# 拆分
+# ----------------------------------------------------------------------
+def _slug(heading: str, index: int) -> str:
+    ascii_words = re.findall(r"[A-Za-z0-9]+", heading)
+    return "_".join(w.lower() for w in ascii_words) or f"section{index}"
+
+
+def _looks_like_heading(block: List[str]) -> bool:
+    first = block[0]
+    return len(block) > 1 and len(first) <= _HEADING_MAX_CHARS and not re.search(r"[。，,：:；;]$", first)
+
+
+def split_script(script: str, sections: Optional[Dict[str, str]] = None) -> List[Segment]:
+    """按段标题切分，段内每个非空行是一个片段
+
+    sections 为 {标题行: 英文段名}（如 {"开场": "opening"}）；给出时只有这些行算标题，
+    否则按"短、无句末标点、后面有正文"的首行猜标题，段名取标题里的英文词或 sectionN。
+    标题之前的正文归入 00_intro。
+    """
+    blocks: List[List[str]] = []
+    current: List[str] = []
+    for line in script.splitlines():
+        line = line.strip()
+        if line:
+            current.append(line)
+        elif current:
+            blocks.append(current)
+            current = []
+    if current:
+        blocks.append(current)
+
+    segments: List[Segment] = []
+    section_index, section, k = 0, "intro", 0
+    for block in blocks:
+        lines = block
+        heading = None
+        if sections is not None:
+            if block[0] in sections:
+                heading = block[0]
+        elif _looks_like_heading(block):
+            heading = block[0]
+        if heading is not None:
+            section_index += 1
+            section = sections[heading] if sections is not None else _slug(heading, section_index)
+            k = 0
+            lines = block[1:]
+        for line in lines:
+            k += 1
+            segments.append(Segment(section_index, section, k, line))
+    return segments
+
+
+def load_script_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """读取解说稿：.py 里取 SCRIPT / VOICE / RATE / SECTIONS 常量（AST 读取，不执行脚本），其他按纯文本"""
+    path = Path(path)
+    text = path.read_text(encoding="utf-8-sig")
+    if path.suffix != ".py":
+        return {"script": text}
+    found: Dict[str, Any] = {}
+    for node in ast.parse(text).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if name in ("SCRIPT", "VOICE", "RATE", "SECTIONS"):
+                found[name.lower()] = ast.literal_eval(node.value)
+    if "script" not in found:
+        raise ValueError(f"no SCRIPT string in {path.name}")
+    return found
+
+
+# ----------------------------------------------------------------------
+# 引擎
+# ----------------------------------------------------------------------
+class TTSBackend:
+    """合成引擎接口：把一句文本写成 mp3"""
+
+    name = "base"
+
+    async def synthesize(self, text: str, voice: str, rate: str, out_path: Path) -> None:
+        raise NotImplementedError
+
+
+class EdgeTTSBackend(TTSBackend):
+    name = "edge"
+
+    def __init__(self):
+        import edge_tts  # noqa: F401  缺依赖时在创建时就报错，而不是合成到一半
+
+    async def synthesize(self, text: str, voice: str, rate: str, out_path: Path) -> None:
+        import edge_tts
+
+        await edge_tts.Communicate(text, voice, rate=rate).save(str(out_path))
+
+
+# edge_tts 的输出格式：MPEG-2 Layer III，24 kHz，48 kbps，单声道；每帧 144 字节、576 个采样
+_SILENT_FRAME = bytes([0xFF, 0xF3, 0x64, 0xC4]) + bytes(140)
+_FRAME_SEC = 576 / 24000
+
+
+class OfflineBackend(TTSBackend):
+    """本地替身：不发声，按字数估算朗读时长写静音 mp3
+
+    时长 = 字数 × seconds_per_char ÷ 语速系数，汉字、英文单词各算一个字。
+    """
+
+    name = "offline"
+
+    def __init__(self, seconds_per_char: float = 0.24, pause: float = 0.3):
+        self.seconds_per_char = seconds_per_char
+        self.pause = pause
+
+    def estimate_seconds(self, text: str, rate: str = DEFAULT_RATE) -> float:
+        units = len(re.findall(r"[一-鿿]|[A-Za-z0-9]+", text))
+        speed = 1.0 + _parse_rate(rate)
+        return units * self.seconds_per_char / max(speed, 0.1) + self.pause
+
+    async def synthesize(self, text: str, voice: str, rate: str, out_path: Path) -> None:
+        frames = max(1, round(self.estimate_seconds(text, rate) / _FRAME_SEC))
+        out_path.write_bytes(_SILENT_FRAME * frames)
+
+
+BACKENDS = {"edge": EdgeTTSBackend, "offline": OfflineBackend}
+
+
+def _parse_rate(rate: str) -> float:
+    m = re.fullmatch(r"\s*([+-]?\d+(?:\.\d+)?)%\s*", rate or "")
+    return float(m.group(1)) / 100 if m else 0.0
+
+
+# ----------------------------------------------------------------------
+# 缓存与并发
+# ----------------------------------------------------------------------
+def segment_key(text: str, voice: str, rate: str, backend: str) -> str:
+    raw = json.dumps({"text": text, "voice": voice, "rate": rate, "backend": backend},
+                     ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _strip_id3(data: bytes) -> bytes:
+    """去掉开头的 ID3v2 标签，便于逐段拼接"""
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        return data[10 + size:]
+    return data
+
+
+async def synthesize_segments(segments: Sequence[Segment], out_dir: Union[str, Path],
+                              backend: TTSBackend, voice: str = DEFAULT_VOICE, rate: str = DEFAULT_RATE,
+                              concurrency: int = 4, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """并发合成所有片段（缓存命中的直接复制），再按段拼出整段 mp3，返回清单
+
+    文本相同的片段共用一个缓存键：每个键只合成一次，全部完成后再复制给各个片段，
+    避免两个协程同时写同一个 .part 文件。
+    """
+    out_dir = Path(out_dir)
+    cache_dir = Path(cache_dir) if cache_dir else out_dir / CACHE_DIRNAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    keys = [segment_key(seg.text, voice, rate, backend.name) for seg in segments]
+    texts = dict(zip(keys, (seg.text for seg in segments)))
+    fresh = set()
+
+    async def ensure(key: str) -> None:
+        cached = cache_dir / f"{key}.mp3"
+        if cached.exists() and cached.stat().st_size > 0:
+            return
+        async with semaphore:
+            tmp = cached.with_suffix(".part")
+            await backend.synthesize(texts[key], voice, rate, tmp)
+            tmp.replace(cached)
+        fresh.add(key)
+
+    await asyncio.gather(*(ensure(k) for k in texts))
+
+    entries = []
+    for seg, key in zip(segments, keys):
+        target = out_dir / f"{seg.name}.mp3"
+        shutil.copyfile(cache_dir / f"{key}.mp3", target)
+        entries.append(dict(asdict(seg), name=seg.name, file=target.name, key=key))
+    synthesized = sum(1 for k in keys if k in fresh)
+    stats = {"cached": len(keys) - synthesized, "synthesized": synthesized}
+
+    # 整段文件 = 逐句拼接（同一格式的 MPEG 帧可以直接首尾相接）
+    sections: Dict[str, List[Path]] = {}
+    for seg in segments:
+        sections.setdefault(seg.section_name, []).append(out_dir / f"{seg.name}.mp3")
+    for name, parts in sections.items():
+        (out_dir / f"{name}.mp3").write_bytes(b"".join(_strip_id3(p.read_bytes()) for p in parts))
+
+    # 本次重新生成的段里，编号超出当前句数的旧片段已不对应任何一句，删掉以免被当成旁白
+    current = {f"{seg.name}.mp3" for seg in segments}
+    removed = []
+    for name in sections:
+        for old in sorted(out_dir.glob(f"{name}_*.mp3")):
+            if re.fullmatch(rf"{re.escape(name)}_\d+\.mp3", old.name) and old.name not in current:
+                old.unlink()
+                removed.append(old.name)
+
+    manifest = {
+        "voice": voice,
+        "rate": rate,
+        "backend": backend.name,
+        "segments": list(entries),
+        "sections": sorted(sections),
+        "removed": removed,
+        **stats,
+    }
+    return manifest
+
+
+def build_narration(script_file: Union[str, Path], out_dir: Union[str, Path], backend: str = "edge",
+                    voice: Optional[str] = None, rate: Optional[str] = None,
+                    concurrency: int = 4) -> Dict[str, Any]:
+    """读稿、拆分、合成，清单写到 out_dir/narration.json"""
+    spec = load_script_file(script_file)
+    segments = split_script(spec["script"], spec.get("sections"))
+    engine = BACKENDS[backend]()
+    manifest = asyncio.run(synthesize_segments(
+        segments, out_dir, engine,
+        voice=voice or spec.get("voice", DEFAULT_VOICE),
+        rate=rate or spec.get("rate", DEFAULT_RATE),
+        concurrency=concurrency,
+    ))
+    manifest["script"] = str(script_file)
+    Path(out_dir, "narration.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=2),
+                                               encoding="utf-8")
+    return manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="解说稿逐句并发合成（带缓存）")
+    parser.add_argument("script", help="narration script (.py with SCRIPT/SECTIONS, or plain text)")
+    parser.add_argument("--out", default=str(DEFAULT_OUT_DIR),
+                        help="output directory (default media/tts; the committed audio/ only when given explicitly)")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="edge")
+    parser.add_argument("--voice", default=None)
+    parser.add_argument("--rate", default=None, help='edge_tts rate, e.g. "+10%%"')
+    parser.add_argument("--jobs", type=int, default=4, help="concurrent synthesis requests")
+    parser.add_argument("--list", action="store_true", help="only print the segments")
+    args = parser.parse_args()
+
+    if args.list:
+        spec = load_script_file(args.script)
+        for seg in split_script(spec["script"], spec.get("sections")):
+            print(f"{seg.name:24s} {seg.text}")
+        return 0
+
+    Path(args.out).mkdir(parents=True, exist_ok=True)
+    manifest = build_narration(args.script, args.out, backend=args.backend, voice=args.voice,
+                               rate=args.rate, concurrency=args.jobs)
+    print(f"[TTS] {len(manifest['segments'])} segments in {len(manifest['sections'])} sections: "
+          f"{manifest['synthesized']} synthesized, {manifest['cached']} from cache, "
+          f"{len(manifest['removed'])} stale removed -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,388 @@
+"""
+社交网络图
+随机图生成（Erdős–Rényi / Barabási–Albert / Watts–Strogatz，稀疏邻接矩阵）、力导向布局、
+友谊悖论统计，以及把整张图画成少数几个批量 VMobject（所有边一个，每种节点颜色一个）。
+
+    A = barabasi_albert(60, 2, seed=7)
+    pos = place(force_layout(A, seed=7), radius=1.5)     # 同一 (图, 种子) 的布局只算一次
+    net = NetworkGraph(A, pos, node_radius=0.06, colors=[BRAND_PINK])
+    self.play(Create(net))
+
+    stats = friendship_stats(barabasi_albert(100_000, 3, seed=1))   # 10⁵ 个节点也只需几十毫秒
+
+布局算法为 Fruchterman–Reingold：节点数不多时斥力逐对精确计算；节点多时用 Barnes–Hut 式的
+四叉树近似（逐层向量化），每次迭代 O(n log n)。
+布局按 (图结构, 种子, 参数) 缓存在内存和 media/graph_layouts/ 下，重复渲染直接读取。
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from manim import ORIGIN, WHITE, VGroup, VMobject
+from scipy import sparse
+
+from scenes.templates.batched import PlacementMixin, circle_points, segment_points
+
+# 布局算法或参数含义变化时递增，旧缓存自动失效
+LAYOUT_VERSION = 1
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_DIR = REPO_ROOT / "media" / "graph_layouts"
+
+# 超过这个节点数时斥力改用四叉树近似
+EXACT_REPULSION_LIMIT = 1500
+
+_LAYOUTS: Dict[str, np.ndarray] = {}
+
+_CHILD_OFFSETS = np.array([(ox, oy) for ox in range(-2, 4) for oy in range(-2, 4)])
+
+
+# ----------------------------------------------------------------------
+# 随机图
+# ----------------------------------------------------------------------
+def _undirected(src: np.ndarray, dst: np.ndarray, n: int) -> sparse.csr_matrix:
+    """无向简单图：去掉自环，重边只算一次，邻接矩阵对称、元素为 1"""
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    A = sparse.csr_matrix(
+        (np.ones(2 * len(src)), (np.concatenate([src, dst]), np.concatenate([dst, src]))),
+        shape=(n, n)
+    )
+    A.data[:] = 1.0
+    return A
+
+
+def erdos_renyi(n: int, mean_degree: float, seed: Optional[int] = None) -> sparse.csr_matrix:
+    """G(n, p) 随机图，p = mean_degree / (n - 1)
+
+    先按二项分布抽边数，再从 n(n-1)/2 个节点对里不放回地抽取，不需要逐对掷骰子。
+    """
+    rng = np.random.default_rng(seed)
+    pairs = n * (n - 1) // 2
+    p = min(max(mean_degree / max(n - 1, 1), 0.0), 1.0)
+    m = int(rng.binomial(pairs, p)) if pairs else 0
+    k = rng.choice(pairs, size=m, replace=False) if m else np.zeros(0, dtype=np.int64)
+    # 上三角的线性编号 k → (i, j)，i < j
+    i = n - 2 - np.floor(np.sqrt(-8.0 * k + 4.0 * n * (n - 1) - 7) / 2.0 - 0.5).astype(np.int64)
+    j = k + i + 1 - pairs + (n - i) * (n - i - 1) // 2
+    return _undirected(i, j, n)
+
+
+def barabasi_albert(n: int, m: int, seed: Optional[int] = None) -> sparse.csr_matrix:
+    """优先连接的无标度网络：每个新节点连 m 条边，连到老节点的概率正比于其度
+
+    Batagelj–Brandes 算法：第 t 条边的终点等于边端点列表中随机一个位置上的节点，
+    而该位置可能又是更早某条边的终点；这条引用链用指针倍增整体解开，不必逐条边循环。
+    早期的自环和重边被去掉，少数节点的度会略小于 m。
+    """
+    rng = np.random.default_rng(seed)
+    slots = n * m
+    owner = np.arange(slots) // m  # 第 t 条边的起点
+    # 端点列表中 2t 处是 owner[t]，2t+1 处是第 t 条边的终点；终点取 [0, 2t] 中的随机位置
+    r = np.floor(rng.random(slots) * (2 * np.arange(slots) + 1)).astype(np.int64)
+    target = np.where(r % 2 == 0, owner[r // 2], -1)
+    ref = np.where(r % 2 == 0, -1, (r - 1) // 2)
+    pending = np.flatnonzero(ref >= 0)
+    while len(pending):
+        nxt = ref[pending]
+        jump = ref[nxt]
+        done = jump < 0
+        target[pending[done]] = target[nxt[done]]
+        ref[pending] = jump
+        pending = pending[~done]
+    return _undirected(owner, target, n)
+
+
+def watts_strogatz(n: int, k: int, beta: float, seed: Optional[int] = None) -> sparse.csr_matrix:
+    """小世界网络：环上每个节点连最近的 k 个邻居（两侧各 k/2），每条边以概率 beta 重连终点"""
+    if k % 2:
+        raise ValueError("k must be even")
+    rng = np.random.default_rng(seed)
+    src = np.tile(np.arange(n), k // 2)
+    dst = (src + np.repeat(np.arange(1, k // 2 + 1), n)) % n
+    rewire = rng.random(len(dst)) < beta
+    dst[rewire] = rng.integers(0, n, int(rewire.sum()))
+    return _undirected(src, dst, n)
+
+
+def edge_list(A: sparse.spmatrix) -> Tuple[np.ndarray, np.ndarray]:
+    """无向图每条边只列一次：(起点, 终点)，起点 < 终点"""
+    upper = sparse.triu(A, k=1).tocoo()
+    return upper.row.astype(np.int64), upper.col.astype(np.int64)
+
+
+def degrees(A: sparse.spmatrix) -> np.ndarray:
+    return np.diff(sparse.csr_matrix(A).indptr)
+
+
+# ----------------------------------------------------------------------
+# 友谊悖论
+# ----------------------------------------------------------------------
+@dataclass
+class FriendshipStats:
+    n_nodes: int
+    n_edges: int
+    mean_degree: float
+    # 随机挑一条"朋友关系"，朋友的朋友数的期望 = <d²> / <d>
+    mean_friend_degree: float
+    # 每个人先对自己的朋友取平均，再对所有人（至少有一个朋友）平均
+    mean_local_friend_degree: float
+    # 朋友数少于"朋友们平均朋友数"的人所占比例
+    share_fewer: float
+    max_degree: int
+
+    @property
+    def ratio(self) -> float:
+        return self.mean_friend_degree / self.mean_degree if self.mean_degree else float("nan")
+
+
+def friendship_stats(A: sparse.spmatrix) -> FriendshipStats:
+    """平均朋友数与朋友的平均朋友数；全部是稀疏矩阵乘法，10⁵ 个节点也是毫秒级"""
+    A = sparse.csr_matrix(A)
+    d = degrees(A).astype(float)
+    has_friends = d > 0
+    neighbour_sum = A @ d
+    local = neighbour_sum[has_friends] / d[has_friends]
+    total = d.sum()
+    return FriendshipStats(
+        n_nodes=A.shape[0],
+        n_edges=int(total // 2),
+        mean_degree=float(d.mean()) if len(d) else 0.0,
+        mean_friend_degree=float((d * d).sum() / total) if total else 0.0,
+        mean_local_friend_degree=float(local.mean()) if len(local) else 0.0,
+        share_fewer=float((d[has_friends] < local).mean()) if len(local) else 0.0,
+        max_degree=int(d.max()) if len(d) else 0,
+    )
+
+
+# ----------------------------------------------------------------------
+# 力导向布局
+# ----------------------------------------------------------------------
+def _exact_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    diff = pos[:, None, :] - pos[None, :, :]
+    d2 = np.einsum("ijk,ijk->ij", diff, diff)
+    np.fill_diagonal(d2, np.inf)
+    return np.einsum("ijk,ij->ik", diff, k * k / np.maximum(d2, 1e-9))
+
+
+def _near_repulsion(pos: np.ndarray, cell: np.ndarray, g: int, k: float) -> np.ndarray:
+    """同一格子及周围 8 个格子里的节点逐对精确计算斥力；cell 为各节点所在格子 (n, 2)，g×g 网格"""
+    n = len(pos)
+    cid = cell[:, 0] * g + cell[:, 1]
+    order = np.argsort(cid, kind="stable")
+    counts = np.bincount(cid, minlength=g * g)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    force = np.zeros_like(pos)
+    nodes = np.arange(n)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            ox, oy = cell[:, 0] + dx, cell[:, 1] + dy
+            valid = (ox >= 0) & (ox < g) & (oy >= 0) & (oy < g)
+            other = ox[valid] * g + oy[valid]
+            cnt = counts[other]
+            total = int(cnt.sum())
+            if not total:
+                continue
+            i = np.repeat(nodes[valid], cnt)
+            within = np.arange(total) - np.repeat(np.cumsum(cnt) - cnt, cnt)
+            j = order[np.repeat(starts[other], cnt) + within]
+            keep = i != j
+            i, j = i[keep], j[keep]
+            diff = pos[i] - pos[j]
+            d2 = np.maximum(np.einsum("ij,ij->i", diff, diff), 1e-9)
+            f = diff * (k * k / d2)[:, None]
+            force[:, 0] += np.bincount(i, weights=f[:, 0], minlength=n)
+            force[:, 1] += np.bincount(i, weights=f[:, 1], minlength=n)
+    return force
+
+
+def _tree_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    """Barnes–Hut 式近似，四叉树取满树、逐层向量化
+
+    第 l 层把包围盒分成 2^l × 2^l 格。节点在每一层只与"父格邻域的子格中、不与自己相邻的格子"
+    （至多 27 个，都隔着至少一格）按质心和节点数计算斥力；最细一层（平均每格约 4 个节点）
+    的相邻格子逐对精确计算。每次迭代 O(n log n)。
+    """
+    n = len(pos)
+    lo = pos.min(axis=0)
+    span = max(float((pos.max(axis=0) - lo).max()), 1e-9) * (1 + 1e-9)
+    rel = (pos - lo) / span
+    depth = int(np.clip(np.ceil(np.log(max(n, 4) / 4) / np.log(4)), 2, 12))
+
+    force = np.zeros_like(pos)
+    for level in range(2, depth + 1):
+        g = 2 ** level
+        cell = np.minimum((rel * g).astype(np.int64), g - 1)
+        cid = cell[:, 0] * g + cell[:, 1]
+        mass = np.bincount(cid, minlength=g * g).astype(float)
+        com = np.stack([np.bincount(cid, weights=pos[:, 0], minlength=g * g),
+                        np.bincount(cid, weights=pos[:, 1], minlength=g * g)], axis=1)
+        com /= np.maximum(mass, 1)[:, None]
+        # 父格的 3×3 邻域展开到本层是以 2·(cell // 2) 为起点、偏移 -2..3 的 6×6 个格子
+        tx = (2 * (cell[:, 0] // 2))[:, None] + _CHILD_OFFSETS[:, 0]
+        ty = (2 * (cell[:, 1] // 2))[:, None] + _CHILD_OFFSETS[:, 1]
+        far = (np.abs(tx - cell[:, :1]) > 1) | (np.abs(ty - cell[:, 1:]) > 1)
+        valid = far & (tx >= 0) & (tx < g) & (ty >= 0) & (ty < g)
+        t = np.where(valid, tx * g + ty, 0)
+        weight = np.where(valid, mass[t], 0.0)
+        diff = pos[:, None, :] - com[t]
+        d2 = np.maximum(np.einsum("ijk,ijk->ij", diff, diff), 1e-9)
+        force += np.einsum("ijk,ij->ik", diff, k * k * weight / d2)
+    g = 2 ** depth
+    return force + _near_repulsion(pos, np.minimum((rel * g).astype(np.int64), g - 1), g, k)
+
+
+def _layout_key(A: sparse.csr_matrix, seed: int, iterations: int, gravity: float, exact: bool) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"v{LAYOUT_VERSION}:{A.shape[0]}:{seed}:{iterations}:{gravity}:{exact}".encode())
+    h.update(np.ascontiguousarray(A.indptr, dtype=np.int64).tobytes())
+    h.update(np.ascontiguousarray(A.indices, dtype=np.int64).tobytes())
+    return h.hexdigest()
+
+
+def _fruchterman_reingold(A: sparse.csr_matrix, seed: int, iterations: int, gravity: float,
+                          exact: bool) -> np.ndarray:
+    n = A.shape[0]
+    rng = np.random.default_rng(seed)
+    k = 1.0  # 理想边长；最后统一缩放，取 1 即可
+    side = np.sqrt(n) * k
+    pos = rng.uniform(-side / 2, side / 2, size=(n, 2))
+    src, dst = edge_list(A)
+    repulsion = _exact_repulsion if exact else _tree_repulsion
+
+    for it in range(iterations):
+        temperature = 0.1 * side * (1.0 - it / iterations) + 0.01 * k
+        disp = repulsion(pos, k)
+        diff = pos[dst] - pos[src]
+        dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+        pull = diff * (dist / k)[:, None]
+        for axis in (0, 1):
+            disp[:, axis] += np.bincount(src, weights=pull[:, axis], minlength=n)
+            disp[:, axis] -= np.bincount(dst, weights=pull[:, axis], minlength=n)
+        # 向中心的弱引力，防止孤立节点和小连通分量飘远
+        disp -= gravity * pos
+        length = np.sqrt(np.einsum("ij,ij->i", disp, disp))
+        pos += disp * (np.minimum(length, temperature) / np.maximum(length, 1e-9))[:, None]
+
+    pos -= pos.mean(axis=0)
+    extent = np.sqrt(np.einsum("ij,ij->i", pos, pos)).max() if n else 0.0
+    return pos / extent if extent > 0 else pos
+
+
+def force_layout(A: sparse.spmatrix,
+                 seed: int = 0,
+                 iterations: int = 100,
+                 gravity: float = 1.0,
+                 exact: Optional[bool] = None,
+                 cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR) -> np.ndarray:
+    """力导向布局，返回 (n, 2)，居中且最远的节点离中心为 1；结果只读
+
+    exact 为 None 时按节点数自动选择精确斥力或四叉树近似。
+    同一张图（按邻接结构判断）、同一种子和参数的结果缓存在内存中，cache_dir 不为 None 时也写入磁盘。
+    """
+    A = sparse.csr_matrix(A)
+    A.sort_indices()
+    if exact is None:
+        exact = A.shape[0] <= EXACT_REPULSION_LIMIT
+    key = _layout_key(A, seed, iterations, gravity, exact)
+    if key in _LAYOUTS:
+        return _LAYOUTS[key]
+
+    path = Path(cache_dir) / f"{key}.npy" if cache_dir else None
+    if path is not None and path.exists():
+        pos = np.load(path)
+    else:
+        pos = _fruchterman_reingold(A, seed, iterations, gravity, exact)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".part.npy")
+            np.save(tmp, pos)
+            tmp.replace(path)
+    pos.setflags(write=False)
+    _LAYOUTS[key] = pos
+    return pos
+
+
+def place(layout: np.ndarray, radius: float = 1.0, center=ORIGIN) -> np.ndarray:
+    """把归一化布局放进场景：(n, 3)，以 center 为中心、半径 radius 的圆内"""
+    out = np.zeros((len(layout), 3))
+    out[:, :2] = radius * np.asarray(layout)[:, :2]
+    return out + np.asarray(center, dtype=float)
+
+
+# ----------------------------------------------------------------------
+# 批量绘制
+# ----------------------------------------------------------------------
+class NetworkGraph(PlacementMixin, VGroup):
+    """整张图：edges（所有边一个 VMobject）在下，nodes（每种颜色一个 VMobject）在上
+
+    positions：(n, 3) 场景坐标，通常由 place(force_layout(A)) 得到
+    node_radius：标量，或每个节点一个（例如按度放大超级节点）
+    colors / groups：groups 为每个节点的整数类别，colors 是各类别的颜色；不给 groups 时全部用 colors[0]
+    node_positions() 给出节点此刻在画面上的位置，图本身或外层 VGroup 被移动、缩放过也一样。
+    """
+
+    def __init__(self,
+                 adjacency: sparse.spmatrix,
+                 positions: np.ndarray,
+                 node_radius: Union[float, Sequence[float], np.ndarray] = 0.08,
+                 colors: Sequence = (WHITE,),
+                 groups: Optional[Sequence[int]] = None,
+                 node_fill_opacity: float = 0.8,
+                 node_stroke_width: float = 0,
+                 edge_color=WHITE,
+                 edge_width: float = 1,
+                 edge_opacity: float = 0.4,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.adjacency = sparse.csr_matrix(adjacency)
+        self.base_positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        n = self.adjacency.shape[0]
+        if len(self.base_positions) != n:
+            raise ValueError(f"need one position per node ({n})")
+        self._init_placement(self.base_positions.mean(axis=0) if n else ORIGIN)
+        self.radii = np.broadcast_to(np.asarray(node_radius, dtype=float), (n,)).copy()
+        self.degrees = degrees(self.adjacency)
+        self.edge_src, self.edge_dst = edge_list(self.adjacency)
+
+        if groups is None:
+            self.groups = np.zeros(n, dtype=int)
+        else:
+            self.groups = np.asarray(groups, dtype=int)
+            if self.groups.shape != (n,):
+                raise ValueError(f"groups must have one entry per node ({n})")
+            if len(self.groups) and (self.groups.min() < 0 or self.groups.max() >= len(colors)):
+                raise ValueError(f"groups must index into the {len(colors)} colors")
+
+        pos = self.base_positions
+        self.edges = VMobject(stroke_color=edge_color, stroke_width=edge_width, stroke_opacity=edge_opacity)
+        self.edges.set_points(segment_points(pos[self.edge_src], pos[self.edge_dst]))
+        self.nodes = VGroup()
+        for g, color in enumerate(colors):
+            idx = np.flatnonzero(self.groups == g)
+            self.nodes.add(
+                VMobject(stroke_color=color, stroke_width=node_stroke_width, fill_color=color,
+                         fill_opacity=node_fill_opacity).set_points(circle_points(pos[idx], self.radii[idx]))
+            )
+        self.add(self.edges, self.nodes)
+
+    @property
+    def n_nodes(self) -> int:
+        return int(self.adjacency.shape[0])
+
+    def node_positions(self) -> np.ndarray:
+        """当前各节点在场景中的位置 (n, 3)"""
+        return self.place(self.base_positions)
+
+    def node_position(self, i: int) -> np.ndarray:
+        return self.node_positions()[i]
+
+    def hub(self) -> int:
+        """度最大的节点"""
+        return int(np.argmax(self.degrees))
@@ -0,0 +1,248 @@
+"""
+神经网络示意图
+拓扑（节点坐标、全连接的边）只建一次并存成数组；边和静止的节点各层只是一个 VMobject，
+之后每帧变化的只有"激活高亮"和"信号脉冲"两个批量对象：脉冲位置 = 起点 + 进度 × (终点 - 起点)，
+整批一次向量化算出。几千条边的真实 MLP 层也能逐帧动画。
+
+    net = NeuralNetworkGraph([4, 6, 6, 3], node_colors=NEURAL_GREEN, edge_color=ELECTRIC_BLUE)
+    self.play(Create(net))
+    self.play(SignalPulses(net, layer=0), run_time=1)      # 第 0 层到第 1 层的每条边各跑一个脉冲
+
+    # 持续流动：updater 挂在 net.signals 上，边和节点没有 updater，可以用 StaticLayerMixin 冻结
+    net.signals.add_updater(lambda m: net.set_pulses(edge_ids, (t.get_value() + phase) % 2))
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+from manim import ORIGIN, WHITE, YELLOW, Animation, VGroup, VMobject, linear
+
+from scenes.templates.batched import PlacementMixin, circle_points, segment_points
+
+
+def mlp_layout(layer_sizes: Sequence[int],
+               layer_spacing: float = 2.0,
+               node_spacing: float = 0.8,
+               max_height: float = 6.0,
+               center=ORIGIN) -> List[np.ndarray]:
+    """各层节点坐标（每层 (n, 3)，自下而上），整体居中于 center
+
+    节点多到放不下时把该层的间距压缩到 max_height 以内。
+    """
+    n_layers = len(layer_sizes)
+    out = []
+    for l, size in enumerate(layer_sizes):
+        spacing = node_spacing if size <= 1 else min(node_spacing, max_height / (size - 1))
+        pos = np.zeros((size, 3))
+        pos[:, 0] = (l - (n_layers - 1) / 2) * layer_spacing
+        pos[:, 1] = (np.arange(size) - (size - 1) / 2) * spacing
+        out.append(pos + np.asarray(center, dtype=float))
+    return out
+
+
+class NeuralNetworkGraph(PlacementMixin, VGroup):
+    """分层全连接网络
+
+    layer_sizes / positions：给层大小时用 mlp_layout 排布；也可以直接给每层的坐标数组
+    node_colors：单个颜色，或每层一个颜色
+    edge_buff：边两端各缩进的距离（通常等于节点半径，线只画到圆周）
+    weights：可选，每层的权重矩阵，形状 (下一层, 本层)，即 h = Wx 中的 W；
+             给出时边按正负着色、按 |w| 分 weight_levels 档不透明度
+    子对象（由下到上）：edges、glows、nodes、active、pulses；
+    glows / active / pulses 合称 signals，是唯一需要逐帧改动的部分。
+    脉冲和高亮按网络当前所在的位置与大小摆放，整张图被移动、缩放后照常对齐。
+    """
+
+    def __init__(self,
+                 layer_sizes: Optional[Sequence[int]] = None,
+                 positions: Optional[Sequence[np.ndarray]] = None,
+                 node_radius: float = 0.15,
+                 node_colors=WHITE,
+                 node_fill_opacity: float = 0.5,
+                 edge_color=WHITE,
+                 edge_width: float = 2,
+                 edge_opacity: float = 0.3,
+                 edge_buff: float = 0.0,
+                 weights: Optional[Sequence[np.ndarray]] = None,
+                 weight_colors: Sequence = ("#2DD4BF", "#F472B6"),
+                 weight_levels: int = 4,
+                 active_color=YELLOW,
+                 active_opacity: float = 0.9,
+                 glow_radius: Optional[float] = None,
+                 glow_opacity: float = 0.2,
+                 pulse_radius: float = 0.05,
+                 pulse_color=YELLOW,
+                 pulse_opacity: float = 0.8,
+                 **kwargs):
+        super().__init__(**kwargs)
+        if positions is None:
+            if layer_sizes is None:
+                raise ValueError("give layer_sizes or positions")
+            positions = mlp_layout(layer_sizes)
+        layer_pos = [np.asarray(p, dtype=float).reshape(-1, 3) for p in positions]
+        self.layer_sizes = [len(p) for p in layer_pos]
+        self.node_offsets = np.concatenate([[0], np.cumsum(self.layer_sizes)]).astype(int)
+        self.base_nodes = np.concatenate(layer_pos)
+        self._init_placement(self.base_nodes.mean(axis=0))
+        self.node_radius = node_radius
+        self.glow_radius = node_radius * 5 / 3 if glow_radius is None else glow_radius
+        self.pulse_radius = pulse_radius
+        self.edge_buff = edge_buff
+
+        # 全连接：第 l 层节点 i → 第 l+1 层节点 j 的边号 = edge_offsets[l] + i * size[l+1] + j
+        src, dst, layer_of = [], [], []
+        for l in range(len(self.layer_sizes) - 1):
+            a, b = self.layer_sizes[l], self.layer_sizes[l + 1]
+            i, j = np.divmod(np.arange(a * b), b)
+            src.append(self.node_offsets[l] + i)
+            dst.append(self.node_offsets[l + 1] + j)
+            layer_of.append(np.full(a * b, l))
+        self.edge_src = np.concatenate(src) if src else np.zeros(0, dtype=int)
+        self.edge_dst = np.concatenate(dst) if dst else np.zeros(0, dtype=int)
+        self.edge_layer = np.concatenate(layer_of) if layer_of else np.zeros(0, dtype=int)
+        self.edge_offsets = np.concatenate(
+            [[0], np.cumsum([a * b for a, b in zip(self.layer_sizes, self.layer_sizes[1:])])]
+        ).astype(int)
+
+        self.edges = self._build_edges(edge_color, edge_width, edge_opacity, weights, weight_colors, weight_levels)
+        colors = list(node_colors) if isinstance(node_colors, (list, tuple)) else [node_colors] * len(self.layer_sizes)
+        if len(colors) != len(self.layer_sizes):
+            raise ValueError(f"need one node color per layer ({len(self.layer_sizes)})")
+        self.nodes = VGroup(*[
+            VMobject(stroke_color=c, fill_color=c, fill_opacity=node_fill_opacity).set_points(
+                circle_points(self.base_nodes[self.node_offsets[l]:self.node_offsets[l + 1]], node_radius))
+            for l, c in enumerate(colors)
+        ])
+        self.glows = VMobject(fill_color=active_color, fill_opacity=glow_opacity, stroke_width=0)
+        self.active = VMobject(fill_color=active_color, fill_opacity=active_opacity, stroke_width=0)
+        self.pulses = VMobject(fill_color=pulse_color, fill_opacity=pulse_opacity, stroke_width=0)
+        self.signals = VGroup(self.glows, self.active, self.pulses)
+        self.add(self.edges, self.glows, self.nodes, self.active, self.pulses)
+
+    @property
+    def n_nodes(self) -> int:
+        return int(self.node_offsets[-1])
+
+    @property
+    def n_edges(self) -> int:
+        return int(len(self.edge_src))
+
+    def _edge_ends(self, edge_ids: Optional[np.ndarray] = None):
+        nodes = self.node_positions()
+        src = self.edge_src if edge_ids is None else self.edge_src[edge_ids]
+        dst = self.edge_dst if edge_ids is None else self.edge_dst[edge_ids]
+        start, end = nodes[src], nodes[dst]
+        if self.edge_buff:
+            d = end - start
+            length = np.linalg.norm(d, axis=1, keepdims=True)
+            unit = d / np.maximum(length, 1e-9)
+            buff = np.minimum(self.edge_buff * self.zoom, length / 2)
+            start, end = start + unit * buff, end - unit * buff
+        return start, end
+
+    def _build_edges(self, color, width, opacity, weights, weight_colors, levels) -> VGroup:
+        start, end = self._edge_ends()
+        edges = VGroup()
+        if weights is None:
+            for l in range(len(self.layer_sizes) - 1):
+                ids = slice(self.edge_offsets[l], self.edge_offsets[l + 1])
+                edges.add(VMobject(stroke_color=color, stroke_width=width, stroke_opacity=opacity)
+                          .set_points(segment_points(start[ids], end[ids])))
+            return edges
+
+        # 按权重分组：每层 × 正负 × 不透明度档位各一个 VMobject
+        w = np.concatenate([np.asarray(W, dtype=float).T.ravel() for W in weights])
+        if w.shape != (self.n_edges,):
+            raise ValueError("weights must be one (next, prev) matrix per layer transition")
+        scale = np.abs(w).max() or 1.0
+        level = np.minimum((np.abs(w) / scale * levels).astype(int), levels - 1)
+        for l in range(len(self.layer_sizes) - 1):
+            in_layer = self.edge_layer == l
+            for sign, c in zip((1, -1), weight_colors):
+                for k in range(levels):
+                    ids = np.flatnonzero(in_layer & (np.sign(w) == sign) & (level == k))
+                    if len(ids):
+                        edges.add(VMobject(stroke_color=c, stroke_width=width,
+                                           stroke_opacity=opacity * (k + 1) / levels)
+                                  .set_points(segment_points(start[ids], end[ids])))
+        return edges
+
+    # ------------------------------------------------------------------
+    # 索引
+    # ------------------------------------------------------------------
+    def node_index(self, layer, i) -> np.ndarray:
+        return self.node_offsets[np.asarray(layer)] + np.asarray(i)
+
+    def edge_index(self, layer, i, j) -> np.ndarray:
+        """第 layer 层节点 i → 下一层节点 j 的边号（可传数组）"""
+        layer = np.asarray(layer)
+        next_size = np.asarray(self.layer_sizes)[layer + 1]
+        return self.edge_offsets[layer] + np.asarray(i) * next_size + np.asarray(j)
+
+    def layer_edges(self, layer: int) -> np.ndarray:
+        return np.arange(self.edge_offsets[layer], self.edge_offsets[layer + 1])
+
+    def node_positions(self) -> np.ndarray:
+        """当前全部节点在场景中的坐标 (n_nodes, 3)"""
+        return self.place(self.base_nodes)
+
+    def layer_positions(self, layer: int) -> np.ndarray:
+        return self.node_positions()[self.node_offsets[layer]:self.node_offsets[layer + 1]]
+
+    # ------------------------------------------------------------------
+    # 逐帧更新
+    # ------------------------------------------------------------------
+    def set_active(self, mask: Optional[np.ndarray]) -> "NeuralNetworkGraph":
+        """高亮激活的节点（长度 n_nodes 的布尔数组；None 为全部熄灭）"""
+        ids = np.zeros(0, dtype=int) if mask is None else np.flatnonzero(mask)
+        centers = self.node_positions()[ids]
+        self.active.set_points(circle_points(centers, self.node_radius * self.zoom))
+        self.glows.set_points(circle_points(centers, self.glow_radius * self.zoom))
+        return self
+
+    def pulse_positions(self, edge_ids: np.ndarray, progress: np.ndarray) -> np.ndarray:
+        start, end = self._edge_ends(np.asarray(edge_ids, dtype=int))
+        return start + np.asarray(progress, dtype=float)[:, None] * (end - start)
+
+    def set_pulses(self, edge_ids, progress) -> "NeuralNetworkGraph":
+        """在 edge_ids 各边上进度 progress 处放一个脉冲；进度不在 [0, 1] 内的不显示"""
+        edge_ids = np.asarray(edge_ids, dtype=int).ravel()
+        progress = np.broadcast_to(np.asarray(progress, dtype=float), edge_ids.shape)
+        shown = (progress >= 0) & (progress <= 1)
+        centers = self.pulse_positions(edge_ids[shown], progress[shown])
+        self.pulses.set_points(circle_points(centers, self.pulse_radius * self.zoom))
+        return self
+
+    def clear_signals(self) -> "NeuralNetworkGraph":
+        self.set_active(None)
+        return self.set_pulses([], [])
+
+
+class SignalPulses(Animation):
+    """信号沿一层的边（或指定的边）从起点跑到终点，结束后脉冲消失
+
+    边数很多时按 max_pulses 均匀抽取，避免几万个脉冲挤成一片。
+    """
+
+    def __init__(self, network: NeuralNetworkGraph, layer: Optional[int] = None,
+                 edge_ids: Optional[Sequence[int]] = None, max_pulses: int = 400,
+                 rate_func=linear, **kwargs):
+        if edge_ids is None:
+            if layer is None:
+                raise ValueError("give a layer or edge_ids")
+            edge_ids = network.layer_edges(layer)
+        edge_ids = np.asarray(edge_ids, dtype=int)
+        if len(edge_ids) > max_pulses:
+            edge_ids = edge_ids[np.linspace(0, len(edge_ids) - 1, max_pulses).astype(int)]
+        self.network = network
+        self.edge_ids = edge_ids
+        super().__init__(network.pulses, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        self.network.set_pulses(self.edge_ids, alpha)
+
+    def finish(self) -> None:
+        super().finish()
+        self.network.set_pulses([], [])
@@ -0,0 +1,123 @@
+"""
+批量路径动画
+把"循环里逐步 self.play"的写法合并为一次 play：
+所有对象的关键帧位置 / 颜色 / 不透明度预先算成数组，在单个动画里统一插值。
+"""
+
+from manim import *
+import numpy as np
+from typing import Callable, Optional, Sequence
+
+
+class KeyframePaths(Animation):
+    """沿预计算关键帧路径同时移动多个对象
+
+    positions: 形状 (对象数, 关键帧数, 3) 的位置数组，第 0 帧通常是当前位置
+    colors:    可选，形状 (对象数, 关键帧数) 的颜色，或 (对象数, 关键帧数, 3) 的 RGB 数组
+    opacities: 可选，形状 (对象数, 关键帧数)，为相对初始不透明度的系数 (0-1)
+    key_times: 可选，长度为关键帧数的单调递增时间点（任意单位，内部归一化到 0-1），
+               默认等间隔；用来复刻原来每一步不同的 run_time
+    segment_rate_func: 每一段内部的缓动，默认 smooth，与逐步 play 的观感一致
+    """
+
+    def __init__(self,
+                 mobjects: Sequence[Mobject],
+                 positions: np.ndarray,
+                 colors=None,
+                 opacities: Optional[np.ndarray] = None,
+                 key_times: Optional[Sequence[float]] = None,
+                 segment_rate_func: Callable[[float], float] = smooth,
+                 rate_func: Callable[[float], float] = linear,
+                 **kwargs):
+        mobs = list(mobjects)
+        positions = np.asarray(positions, dtype=float)
+        if positions.ndim != 3 or positions.shape[2] != 3:
+            raise ValueError(f"positions must have shape (objects, keyframes, 3), got {positions.shape}")
+        if positions.shape[0] != len(mobs):
+            raise ValueError(f"got {len(mobs)} mobjects but {positions.shape[0]} paths")
+        if positions.shape[1] < 2:
+            raise ValueError("at least 2 keyframes are required")
+
+        n_obj, n_key, _ = positions.shape
+        self.positions = positions
+        self.rgbs = self._normalize_colors(colors, n_obj, n_key)
+        self.opacities = None
+        if opacities is not None:
+            self.opacities = np.clip(np.asarray(opacities, dtype=float), 0, 1)
+            if self.opacities.shape != (n_obj, n_key):
+                raise ValueError(f"opacities must have shape {(n_obj, n_key)}, got {self.opacities.shape}")
+
+        if key_times is None:
+            self.key_times = np.linspace(0, 1, n_key)
+        else:
+            key_times = np.asarray(key_times, dtype=float)
+            if key_times.shape != (n_key,) or np.any(np.diff(key_times) < 0):
+                raise ValueError("key_times must be a non-decreasing sequence with one entry per keyframe")
+            span = key_times[-1] - key_times[0]
+            self.key_times = (key_times - key_times[0]) / span if span > 0 else np.linspace(0, 1, n_key)
+
+        self.segment_rate_func = segment_rate_func
+        self.path_mobjects = mobs
+        group = VGroup(*mobs) if all(isinstance(m, VMobject) for m in mobs) else Group(*mobs)
+        super().__init__(group, rate_func=rate_func, **kwargs)
+
+    @staticmethod
+    def _normalize_colors(colors, n_obj: int, n_key: int) -> Optional[np.ndarray]:
+        """把颜色参数统一成 (对象数, 关键帧数, 3) 的 RGB 数组"""
+        if colors is None:
+            return None
+        arr = np.asarray(colors, dtype=object)
+        if arr.shape == (n_obj, n_key, 3):
+            return arr.astype(float)
+        if arr.shape != (n_obj, n_key):
+            raise ValueError(f"colors must have shape {(n_obj, n_key)} or {(n_obj, n_key, 3)}")
+        rgbs = np.empty((n_obj, n_key, 3))
+        for i in range(n_obj):
+            for k in range(n_key):
+                rgbs[i, k] = color_to_rgb(arr[i, k])
+        return rgbs
+
+    def begin(self) -> None:
+        # 记录当前锚点，之后每帧只做 shift，避免反复计算包围盒
+        self._anchors = np.array([m.get_center() for m in self.path_mobjects])
+        self._base_opacity = [
+            (m.get_fill_opacity(), m.get_stroke_opacity()) if isinstance(m, VMobject) else None
+            for m in self.path_mobjects
+        ]
+        super().begin()
+
+    def _sample(self, alpha: float):
+        """返回 alpha 时刻所在的段序号和段内进度"""
+        alpha = float(np.clip(alpha, 0, 1))
+        k = int(np.searchsorted(self.key_times, alpha, side="right") - 1)
+        k = min(max(k, 0), len(self.key_times) - 2)
+        t0, t1 = self.key_times[k], self.key_times[k + 1]
+        u = (alpha - t0) / (t1 - t0) if t1 > t0 else 1.0
+        return k, self.segment_rate_func(float(np.clip(u, 0, 1)))
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        k, u = self._sample(alpha)
+        targets = self.positions[:, k] + u * (self.positions[:, k + 1] - self.positions[:, k])
+        deltas = targets - self._anchors
+        for mob, delta in zip(self.path_mobjects, deltas):
+            mob.shift(delta)
+        self._anchors = targets
+
+        if self.rgbs is not None:
+            rgb = self.rgbs[:, k] + u * (self.rgbs[:, k + 1] - self.rgbs[:, k])
+            for mob, c in zip(self.path_mobjects, rgb):
+                mob.set_color(rgb_to_color(np.clip(c, 0, 1)))
+
+        if self.opacities is not None:
+            op = self.opacities[:, k] + u * (self.opacities[:, k + 1] - self.opacities[:, k])
+            for mob, base, o in zip(self.path_mobjects, self._base_opacity, op):
+                if base is None:
+                    mob.set_opacity(o)
+                else:
+                    mob.set_fill(opacity=base[0] * o)
+                    mob.set_stroke(opacity=base[1] * o)
+
+
+def stack_keyframes(frames: Sequence[np.ndarray]) -> np.ndarray:
+    """把按时间顺序记录的 (对象数, 3) 位置快照拼成 (对象数, 关键帧数, 3)"""
+    return np.stack([np.asarray(f, dtype=float) for f in frames], axis=1)
@@ -0,0 +1,175 @@
+"""
+叶序（Phyllotaxis）种子排布
+第 k 颗种子转 k·α、离中心 c·√k。N 颗种子的位置、大小、颜色一次向量化算出，
+同一组参数的位置按发散角缓存；整朵花盘只由少数几个 VMobject 组成（每种颜色一个，
+所有种子作为子路径），几千颗种子随发散角连续变形也能逐帧重算。
+
+    head = PhyllotaxisHead(5000, scale=0.05, radius=0.02, colors=[LEAF_GREEN, FLOWER_GOLD])
+    self.play(SeedReveal(head), run_time=4)                        # 按序号逐颗长出
+    self.play(AngleSweep(head, GOLDEN_ANGLE, 137.0 * DEGREES), run_time=6)
+
+    # 多个参数同时随时间变化时用 updater，替代每帧重建几千个 Dot 的 always_redraw
+    head.add_updater(lambda m: m.set_state(angle=angle_of(t.get_value())))
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+from manim import ORIGIN, Animation, VGroup, VMobject, color_gradient, linear
+
+from scenes.templates.batched import PlacementMixin, circle_points
+
+# 黄金角 2π/φ² ≈ 137.508°
+GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))
+
+# 缓存键里的发散角精度（弧度）：第 5000 颗种子的角度误差不超过 2.5e-4 rad，远小于一个像素
+ANGLE_QUANTUM = 1e-7
+
+_RadiusSpec = Union[float, Sequence[float], np.ndarray]
+
+
+@lru_cache(maxsize=512)
+def _spiral(n: int, angle_key: int, scale: float, start: int) -> np.ndarray:
+    k = np.arange(start, start + n, dtype=float)
+    theta = k * (angle_key * ANGLE_QUANTUM)
+    r = scale * np.sqrt(k)
+    pos = np.zeros((n, 3))
+    pos[:, 0] = r * np.cos(theta)
+    pos[:, 1] = r * np.sin(theta)
+    pos.setflags(write=False)
+    return pos
+
+
+def seed_positions(n: int, angle: float = GOLDEN_ANGLE, scale: float = 0.06, start: int = 0) -> np.ndarray:
+    """n 颗种子的位置 (n, 3)，以花盘中心为原点；结果只读、按 (n, 发散角, scale, start) 缓存"""
+    return _spiral(int(n), int(round(angle / ANGLE_QUANTUM)), float(scale), int(start))
+
+
+def angle_sweep(n: int, angles: Sequence[float], scale: float = 0.06, start: int = 0) -> np.ndarray:
+    """一组发散角下的位置 (角度数, n, 3)；来回扫动时重复的角度直接命中缓存"""
+    return np.stack([seed_positions(n, a, scale, start) for a in angles])
+
+
+class PhyllotaxisHead(PlacementMixin, VGroup):
+    """一次成形的花盘：每种颜色一个子对象，对应的种子都是它的子路径
+
+    colors：groups 为 None 时是渐变色标，按种子序号（由内向外）分成 color_bins 档；
+            给定 groups（每颗种子的整数类别）时是各类别的颜色表
+    radius：种子半径，标量或长度为 n 的数组
+    start：第一颗种子的序号（原各集有从 0 开始的，也有从 1 开始的）
+    set_angle / set_state 重算时沿用花盘当前的中心、大小和朝向，外层 VGroup 的变换也算在内。
+    """
+
+    def __init__(self,
+                 n_seeds: int,
+                 angle: float = GOLDEN_ANGLE,
+                 scale: float = 0.06,
+                 radius: _RadiusSpec = 0.02,
+                 colors: Sequence = ("#FFFF00",),
+                 groups: Optional[Sequence[int]] = None,
+                 color_bins: int = 16,
+                 start: int = 0,
+                 fill_opacity: float = 1.0,
+                 center=ORIGIN,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.n_seeds = int(n_seeds)
+        self.angle = float(angle)
+        self.spiral_scale = float(scale)
+        self.start = int(start)
+        self.visible = self.n_seeds
+        self.radii = self._radius_array(radius)
+
+        if groups is None:
+            n_bins = min(color_bins, self.n_seeds) if len(colors) > 1 else 1
+            depth = np.arange(self.n_seeds) / max(self.n_seeds, 1)
+            self.groups = np.minimum((depth * n_bins).astype(int), n_bins - 1)
+            palette = color_gradient(list(colors), n_bins) if n_bins > 1 else [colors[0]]
+        else:
+            self.groups = np.asarray(groups, dtype=int)
+            if self.groups.shape != (self.n_seeds,):
+                raise ValueError(f"groups must have one entry per seed ({self.n_seeds})")
+            palette = list(colors)
+            if self.groups.min() < 0 or self.groups.max() >= len(palette):
+                raise ValueError(f"groups must index into the {len(palette)} colors")
+        self.palette = palette
+        self._init_placement(ORIGIN, offset=center)
+        self._members = [np.flatnonzero(self.groups == g) for g in range(len(palette))]
+
+        for color in palette:
+            self.add(VMobject(fill_color=color, fill_opacity=fill_opacity, stroke_width=0))
+        self._refresh()
+
+    def _radius_array(self, radius: _RadiusSpec) -> np.ndarray:
+        return np.broadcast_to(np.asarray(radius, dtype=float), (self.n_seeds,)).copy()
+
+    # ------------------------------------------------------------------
+    # 重算
+    # ------------------------------------------------------------------
+    def positions(self) -> np.ndarray:
+        """当前各颗种子在场景中的位置 (n, 3)"""
+        base = seed_positions(self.n_seeds, self.angle, self.spiral_scale, self.start)
+        return self.place(base)
+
+    def _refresh(self, radii: Optional[np.ndarray] = None) -> "PhyllotaxisHead":
+        pos = self.positions()
+        radii = self.zoom * (self.radii if radii is None else radii)
+        for sub, idx in zip(self.submobjects, self._members):
+            idx = idx[idx < self.visible]
+            sub.set_points(circle_points(pos[idx], radii[idx]))
+        return self
+
+    def set_state(self, angle: Optional[float] = None, radius: Optional[_RadiusSpec] = None,
+                  visible: Optional[int] = None) -> "PhyllotaxisHead":
+        """同时修改发散角 / 种子半径 / 显示的种子数，只重算一次"""
+        if angle is not None:
+            self.angle = float(angle)
+        if radius is not None:
+            self.radii = self._radius_array(radius)
+        if visible is not None:
+            self.visible = int(np.clip(visible, 0, self.n_seeds))
+        return self._refresh()
+
+    def set_angle(self, angle: float) -> "PhyllotaxisHead":
+        return self.set_state(angle=angle)
+
+    def set_visible(self, count: int) -> "PhyllotaxisHead":
+        return self.set_state(visible=count)
+
+    def highlighted(self, scales: Dict[int, float]) -> "PhyllotaxisHead":
+        """副本，其中类别 g 的种子半径乘以 scales[g]（相对原始半径）；配合 Transform 做突出显示"""
+        target = self.copy()
+        factor = np.ones(self.n_seeds)
+        for g, s in scales.items():
+            factor[self.groups == g] = s
+        target._refresh(self.radii * factor)
+        return target
+
+
+class SeedReveal(Animation):
+    """按序号逐颗显示种子（由内向外生长），start / end 为显示的种子数"""
+
+    def __init__(self, head: PhyllotaxisHead, start: int = 0, end: Optional[int] = None,
+                 rate_func=linear, **kwargs):
+        self.count_start = start
+        self.count_end = head.n_seeds if end is None else end
+        super().__init__(head, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        count = self.count_start + (self.count_end - self.count_start) * alpha
+        self.mobject.set_visible(int(round(count)))
+
+
+class AngleSweep(Animation):
+    """发散角从 start_angle 连续变到 end_angle"""
+
+    def __init__(self, head: PhyllotaxisHead, start_angle: float, end_angle: float, **kwargs):
+        self.start_angle = start_angle
+        self.end_angle = end_angle
+        super().__init__(head, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        self.mobject.set_angle(self.start_angle + (self.end_angle - self.start_angle) * alpha)
@@ -0,0 +1,352 @@
+"""
+渲染性能剖析
+可选混入类：记录每次 play/wait、每个分段方法、每个 updater / always_redraw 回调、
+光栅化与编码的耗时，以及每帧的对象数和点数；输出 JSON 报告和火焰图折叠栈。
+
+用法（不改原场景，新建一个子类即可）：
+
+    class MarkovChainEP16Profiled(ProfilingMixin, MarkovChainEP16):
+        pass
+
+    manim scenes/probability/markov_chain_ep16.py MarkovChainEP16Profiled -ql
+
+汇总整个目录的热点 updater：
+
+    python -m scenes.templates.profiling media/profiles --top 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from manim import Animation, Scene, Wait
+
+PROFILE_DIR = Path("media") / "profiles"
+
+
+class _Tracer:
+    """嵌套计时器：按调用栈路径累计总耗时和自身耗时"""
+
+    def __init__(self):
+        self.stack: List[List[Any]] = []  # [名称, 开始时刻, 子调用耗时]
+        self.self_time: Dict[Tuple[str, ...], float] = defaultdict(float)
+        self.total_time: Dict[Tuple[str, ...], float] = defaultdict(float)
+        self.calls: Dict[Tuple[str, ...], int] = defaultdict(int)
+
+    def enter(self, name: str) -> None:
+        self.stack.append([name, time.perf_counter(), 0.0])
+
+    def exit(self) -> float:
+        name, start, child = self.stack.pop()
+        elapsed = time.perf_counter() - start
+        path = tuple(frame[0] for frame in self.stack) + (name,)
+        self.self_time[path] += elapsed - child
+        self.total_time[path] += elapsed
+        self.calls[path] += 1
+        if self.stack:
+            self.stack[-1][2] += elapsed
+        return elapsed
+
+    def timed(self, name: str, func: Callable, *args, **kwargs):
+        self.enter(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.exit()
+
+
+def _updater_label(updater: Callable) -> str:
+    """updater 的可读名称；always_redraw 的匿名函数取其包装的构造函数名"""
+    name = getattr(updater, "__qualname__", repr(updater))
+    if getattr(updater, "__name__", "") == "<lambda>" and updater.__closure__:
+        for cell in updater.__closure__:
+            inner = cell.cell_contents
+            if callable(inner) and hasattr(inner, "__qualname__"):
+                return f"always_redraw:{inner.__qualname__}"
+    return name
+
+
+class _TimedUpdater:
+    """updater 的计时包装
+
+    与被包装的原函数比较相等，场景里 remove_updater(原函数) 照样能把它移除；
+    签名沿用原函数，manim 仍按有没有 dt 参数决定调用方式。
+    """
+
+    def __init__(self, updater: Callable, tracer: _Tracer):
+        self.__wrapped__ = updater
+        self.__signature__ = inspect.signature(updater)
+        self.label = f"updater:{_updater_label(updater)}"
+        self.tracer = tracer
+
+    def __call__(self, *args):
+        return self.tracer.timed(self.label, self.__wrapped__, *args)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _TimedUpdater):
+            other = other.__wrapped__
+        return other is self.__wrapped__
+
+    def __hash__(self) -> int:
+        return hash(self.__wrapped__)
+
+
+def _animation_label(args: Iterable[Any]) -> str:
+    names = []
+    for anim in args:
+        if isinstance(anim, Animation):
+            names.append(type(anim).__name__)
+        elif hasattr(anim, "mobject") and hasattr(anim, "methods"):
+            names.append(".animate")  # _AnimationBuilder
+        else:
+            names.append(type(anim).__name__)
+    return "+".join(names) or "empty"
+
+
+class ProfilingMixin:
+    """性能剖析混入类，放在继承列表最前面
+
+    适用于 Scene、ProbabilityBase、ITSceneBase、BaseScene 等任意场景基类。
+    渲染结束时把报告写到 profile_dir/<场景名>.json 和 <场景名>.collapsed。
+    """
+
+    profile_dir: Path = PROFILE_DIR
+    # 每帧统计对象数 / 点数会遍历整棵对象树，长片可关掉
+    profile_frame_stats: bool = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tracer = _Tracer()
+        self._plays: List[Dict[str, Any]] = []
+        self._frames: List[Tuple[float, int, int]] = []
+        self._timeline = 0.0
+        self._wrap_section_methods()
+        self._wrap_renderer()
+
+    # ------------------------------------------------------------------
+    # 插桩
+    # ------------------------------------------------------------------
+    def _wrap_section_methods(self) -> None:
+        """把场景子类里定义的方法（construct 与各分段方法）包上计时"""
+        skip = set(dir(ProfilingMixin)) | {"play", "wait"}
+        seen = set()
+        for cls in type(self).__mro__:
+            if cls is ProfilingMixin or cls.__module__.startswith("manim"):
+                continue
+            for name, attr in vars(cls).items():
+                if name in seen or name in skip or name.startswith("__"):
+                    continue
+                seen.add(name)
+                if not inspect.isfunction(attr):
+                    continue
+                bound = getattr(self, name)
+                setattr(self, name, self._make_section_wrapper(name, bound))
+
+    def _make_section_wrapper(self, name: str, bound: Callable) -> Callable:
+        tracer = self._tracer
+
+        def wrapper(*args, **kwargs):
+            return tracer.timed(name, bound, *args, **kwargs)
+
+        wrapper.__wrapped__ = bound
+        return wrapper
+
+    def _wrap_renderer(self) -> None:
+        """区分光栅化（update_frame）和编码（add_frame → 写入 ffmpeg）"""
+        renderer = self.renderer
+        tracer = self._tracer
+        update_frame = renderer.update_frame
+        add_frame = renderer.add_frame
+
+        def timed_update_frame(scene, *args, **kwargs):
+            tracer.timed("rasterize", update_frame, scene, *args, **kwargs)
+            if self.profile_frame_stats:
+                self._frames.append((self._timeline, *self._count_mobjects()))
+
+        def timed_add_frame(*args, **kwargs):
+            return tracer.timed("encode", add_frame, *args, **kwargs)
+
+        renderer.update_frame = timed_update_frame
+        renderer.add_frame = timed_add_frame
+
+    def _count_mobjects(self) -> Tuple[int, int]:
+        n_mobjects = 0
+        n_points = 0
+        for mob in self.mobjects:
+            for sub in mob.get_family():
+                n_mobjects += 1
+                n_points += len(sub.points)
+        return n_mobjects, n_points
+
+    def _wrap_updaters(self) -> None:
+        """给场景里所有对象的 updater 包上计时（每个 updater 只包一次）"""
+        tracer = self._tracer
+        for mob in self.mobjects:
+            for sub in mob.get_family():
+                for i, updater in enumerate(sub.updaters):
+                    if not isinstance(updater, _TimedUpdater):
+                        sub.updaters[i] = _TimedUpdater(updater, tracer)
+
+    # ------------------------------------------------------------------
+    # 场景接口
+    # ------------------------------------------------------------------
+    def play(self, *args, **kwargs):
+        self._wrap_updaters()
+        is_wait = len(args) == 1 and isinstance(args[0], Wait)
+        label = "wait" if is_wait else f"play:{_animation_label(args)}"
+        section = next(
+            (frame[0] for frame in reversed(self._tracer.stack) if frame[0] != "construct"),
+            "construct"
+        )
+
+        self._tracer.enter(label)
+        try:
+            result = super().play(*args, **kwargs)
+        finally:
+            wall = self._tracer.exit()
+        run_time = float(getattr(self, "duration", 0.0) or 0.0)
+        self._plays.append({
+            "index": len(self._plays),
+            "label": label,
+            "section": section,
+            "start": round(self._timeline, 4),
+            "run_time": round(run_time, 4),
+            "wall": round(wall, 6),
+        })
+        self._timeline += run_time
+        return result
+
+    def tear_down(self):
+        super().tear_down()
+        self.save_profile()
+
+    # ------------------------------------------------------------------
+    # 报告
+    # ------------------------------------------------------------------
+    def profile_report(self) -> Dict[str, Any]:
+        tracer = self._tracer
+        sections: Dict[str, Dict[str, float]] = defaultdict(lambda: {"calls": 0, "total_wall": 0.0})
+        updaters: Dict[str, Dict[str, float]] = defaultdict(lambda: {"calls": 0, "total_wall": 0.0})
+        render = {"rasterize_wall": 0.0, "encode_wall": 0.0, "rasterize_calls": 0, "encode_calls": 0}
+
+        for path, total in tracer.total_time.items():
+            leaf = path[-1]
+            calls = tracer.calls[path]
+            if leaf.startswith("updater:"):
+                bucket = updaters[leaf[len("updater:"):]]
+            elif leaf in ("rasterize", "encode"):
+                render[f"{leaf}_wall"] += total
+                render[f"{leaf}_calls"] += calls
+                continue
+            elif leaf == "wait" or leaf.startswith("play:"):
+                continue
+            else:
+                bucket = sections[leaf]
+            bucket["calls"] += calls
+            # 递归调用时只累计最外层，避免重复计入
+            if leaf not in path[:-1]:
+                bucket["total_wall"] += total
+
+        frames = self._frames
+        frame_stats = {}
+        if frames:
+            mobs = [f[1] for f in frames]
+            pts = [f[2] for f in frames]
+            frame_stats = {
+                "count": len(frames),
+                "max_mobjects": max(mobs),
+                "mean_mobjects": round(sum(mobs) / len(mobs), 1),
+                "max_points": max(pts),
+                "mean_points": round(sum(pts) / len(pts), 1),
+                "timeline": [[round(t, 3), m, p] for t, m, p in frames],
+            }
+
+        return {
+            "scene": type(self).__name__,
+            "total_wall": round(sum(t for p, t in tracer.total_time.items() if len(p) == 1), 6),
+            "timeline_duration": round(self._timeline, 4),
+            "plays": self._plays,
+            "sections": {
+                k: {"calls": v["calls"], "total_wall": round(v["total_wall"], 6)}
+                for k, v in sorted(sections.items(), key=lambda kv: -kv[1]["total_wall"])
+            },
+            "updaters": {
+                k: {"calls": v["calls"], "total_wall": round(v["total_wall"], 6)}
+                for k, v in sorted(updaters.items(), key=lambda kv: -kv[1]["total_wall"])
+            },
+            "render": {k: round(v, 6) if isinstance(v, float) else v for k, v in render.items()},
+            "frames": frame_stats,
+        }
+
+    def collapsed_stacks(self) -> str:
+        """火焰图折叠栈格式（flamegraph.pl / speedscope 可直接读取），单位微秒"""
+        lines = []
+        for path, self_time in sorted(self._tracer.self_time.items()):
+            us = int(self_time * 1e6)
+            if us > 0:
+                stack = ";".join(p.replace(";", ",").replace(" ", "_") for p in path)
+                lines.append(f"{stack} {us}")
+        return "\n".join(lines) + "\n"
+
+    def save_profile(self, out_dir: Optional[Path] = None) -> Path:
+        out_dir = Path(out_dir or self.profile_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        name = type(self).__name__
+        out_path = out_dir / f"{name}.json"
+        out_path.write_text(json.dumps(self.profile_report(), ensure_ascii=False, indent=2), encoding="utf-8")
+        (out_dir / f"{name}.collapsed").write_text(self.collapsed_stacks(), encoding="utf-8")
+        return out_path
+
+
+def profiled(scene_cls: type) -> type:
+    """动态生成带剖析的场景子类，例如 profiled(MarkovChainEP16)().render()"""
+    if not issubclass(scene_cls, Scene):
+        raise TypeError(f"{scene_cls!r} is not a Scene subclass")
+    return type(scene_cls.__name__, (ProfilingMixin, scene_cls), {"__module__": scene_cls.__module__})
+
+
+def rank_updaters(report_paths: Iterable[Path], top: int = 20) -> List[Dict[str, Any]]:
+    """汇总多份报告，按总耗时给 updater 排名"""
+    rows = []
+    for path in report_paths:
+        report = json.loads(Path(path).read_text(encoding="utf-8"))
+        for name, stats in report.get("updaters", {}).items():
+            rows.append({
+                "scene": report.get("scene", Path(path).stem),
+                "updater": name,
+                "calls": stats["calls"],
+                "total_wall": stats["total_wall"],
+                "per_call_ms": round(1000 * stats["total_wall"] / max(stats["calls"], 1), 3),
+            })
+    rows.sort(key=lambda r: -r["total_wall"])
+    return rows[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="汇总渲染剖析报告，列出最耗时的 updater")
+    parser.add_argument("paths", nargs="*", default=[str(PROFILE_DIR)], help="report files or directories")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    files: List[Path] = []
+    for p in map(Path, args.paths):
+        files.extend(sorted(p.glob("*.json")) if p.is_dir() else [p])
+    if not files:
+        print("[PROFILE] no reports found")
+        return 1
+
+    print(f"[PROFILE] {len(files)} reports")
+    for row in rank_updaters(files, top=args.top):
+        print(f"  {row['total_wall']:9.3f}s  {row['calls']:7d} calls  {row['per_call_ms']:8.3f} ms/call  "
+              f"{row['scene']}  {row['updater']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
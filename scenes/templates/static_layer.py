@@ -0,0 +1,172 @@
+"""
+静态背景图层缓存
+把长期不变的装饰性背景（粒子点阵、心形 / 叶片纹理、渐变标题等）光栅化一次，
+合成进相机背景，之后每帧只做一次数组拷贝，不再由 Cairo 逐个对象重绘。
+
+    self.play(Create(bg), run_time=2)
+    self.freeze_layer(bg)          # 之后 bg 以位图形式留在画面最底层
+    ...
+    self.play(FadeOut(bg))         # 对冻结对象做动画会自动解冻，无需手动处理
+
+冻结后对象被修改（位置、颜色、点等）会在下一次 play 前自动重新光栅化；
+对冻结对象做动画、再次 add、remove 或 clear 时自动解冻。
+注意：冻结图层始终位于所有动态内容之下，且只保留相机画面范围内的部分。
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, List, Optional
+
+import numpy as np
+from manim import Group, Mobject, VMobject
+
+
+def _fingerprint(mob: Mobject) -> bytes:
+    """对象树的外观指纹：点坐标、颜色、线宽、层级，任何一项变化都会触发重绘"""
+    h = hashlib.blake2b(digest_size=16)
+    for sub in mob.get_family():
+        h.update(str(id(sub)).encode())
+        h.update(np.ascontiguousarray(sub.points).tobytes())
+        h.update(str(getattr(sub, "z_index", 0)).encode())
+        if isinstance(sub, VMobject):
+            h.update(np.ascontiguousarray(sub.get_fill_rgbas()).tobytes())
+            h.update(np.ascontiguousarray(sub.get_stroke_rgbas()).tobytes())
+            h.update(np.float64(sub.get_stroke_width()).tobytes())
+        elif hasattr(sub, "pixel_array"):
+            h.update(np.ascontiguousarray(sub.pixel_array).tobytes())
+    return h.digest()
+
+
+class StaticLayerMixin:
+    """静态图层混入类，放在场景继承列表的前面"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._frozen_layers: List[Mobject] = []
+        self._frozen_prints: Dict[int, bytes] = {}
+        self._layer_base: Optional[np.ndarray] = None
+        self._layer_composite: Optional[np.ndarray] = None
+
+    # ------------------------------------------------------------------
+    # 公共接口
+    # ------------------------------------------------------------------
+    def freeze_layer(self, *mobjects: Mobject) -> Mobject:
+        """冻结一组对象为缓存位图，返回这组对象（用于之后解冻或动画）"""
+        group = mobjects[0] if len(mobjects) == 1 else Group(*mobjects)
+        if group.get_family_updaters():
+            raise ValueError("cannot freeze mobjects with updaters; they change every frame")
+        if any(group is layer for layer in self._frozen_layers):
+            return group
+
+        super().remove(*mobjects)
+        self._frozen_layers.append(group)
+        self._frozen_prints[id(group)] = _fingerprint(group)
+        self._composite_layers()
+        return group
+
+    def thaw_layer(self, group: Mobject, restore: bool = True) -> None:
+        """解冻：恢复为普通矢量对象；restore=True 时放回场景最底层"""
+        if not self._drop_layer(group):
+            return
+        if restore:
+            self.bring_to_back(group)
+        self._composite_layers()
+
+    def is_frozen(self, mob: Mobject) -> bool:
+        return self._layer_containing(mob) is not None
+
+    # ------------------------------------------------------------------
+    # 内部实现
+    # ------------------------------------------------------------------
+    def _layer_containing(self, mob: Mobject) -> Optional[Mobject]:
+        for layer in self._frozen_layers:
+            if mob is layer or mob in layer.get_family():
+                return layer
+        return None
+
+    def _drop_layer(self, group: Mobject) -> bool:
+        for i, layer in enumerate(self._frozen_layers):
+            if layer is group:
+                del self._frozen_layers[i]
+                self._frozen_prints.pop(id(group), None)
+                return True
+        return False
+
+    def _composite_layers(self) -> None:
+        """在干净的相机背景上依次光栅化所有冻结图层，结果作为新背景"""
+        camera = self.camera
+        if not self._frozen_layers and self._layer_base is None:
+            return
+        if self._layer_base is None or camera.background is not self._layer_composite:
+            # 首次冻结，或背景色被重新设置过：以当前背景为干净底图
+            self._layer_base = camera.background.copy()
+        if not self._frozen_layers:
+            camera.background = self._layer_base
+            self._layer_composite = None
+            self._layer_base = None
+            return
+
+        saved = camera.pixel_array.copy()
+        camera.set_pixel_array(self._layer_base)
+        camera.capture_mobjects(self._frozen_layers)
+        self._layer_composite = camera.pixel_array.copy()
+        camera.set_pixel_array(saved)
+        camera.background = self._layer_composite
+
+    def _refresh_layers(self, animations) -> None:
+        """play 前：被动画的冻结对象先解冻，被修改过的图层重新光栅化"""
+        if not self._frozen_layers:
+            return
+        targets = [getattr(anim, "mobject", None) for anim in animations]
+        for target in targets:
+            if target is None:
+                continue
+            for mob in target.get_family():
+                layer = self._layer_containing(mob)
+                if layer is not None:
+                    self.thaw_layer(layer)
+
+        stale = self.camera.background is not self._layer_composite
+        for layer in self._frozen_layers:
+            fp = _fingerprint(layer)
+            if fp != self._frozen_prints.get(id(layer)):
+                self._frozen_prints[id(layer)] = fp
+                stale = True
+        if stale:
+            self._composite_layers()
+
+    # ------------------------------------------------------------------
+    # 场景接口
+    # ------------------------------------------------------------------
+    def play(self, *args, **kwargs):
+        animations = [self._to_animation(a) for a in args]
+        self._refresh_layers(animations)
+        return super().play(*animations, **kwargs)
+
+    @staticmethod
+    def _to_animation(arg):
+        # .animate 构建器要先转成动画才能拿到目标对象
+        if hasattr(arg, "build") and not hasattr(arg, "interpolate"):
+            return arg.build()
+        return arg
+
+    def add(self, *mobjects: Mobject):
+        for mob in mobjects:
+            layer = self._layer_containing(mob)
+            if layer is not None:
+                self.thaw_layer(layer, restore=False)
+        return super().add(*mobjects)
+
+    def remove(self, *mobjects: Mobject):
+        for mob in mobjects:
+            layer = self._layer_containing(mob)
+            if layer is not None:
+                self.thaw_layer(layer, restore=False)
+        return super().remove(*mobjects)
+
+    def clear(self):
+        self._frozen_layers.clear()
+        self._frozen_prints.clear()
+        self._composite_layers()
+        return super().clear()
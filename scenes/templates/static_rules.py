@@ -0,0 +1,719 @@
+"""
+场景脚本静态规则检查（基于 AST）
+每个脚本只解析一次，能追踪通过变量、**kwargs、辅助方法传入的 run_time；
+结果按文件内容哈希缓存，未命中的文件并行检查。只依赖标准库，不导入 manim。
+
+    python -m scenes.templates.static_rules scenes            # 整个目录
+    python -m scenes.templates.static_rules scenes/信息论/information_theory_ep20.py
+
+信息论目录使用完整规则（import random、禁灰字等），其余目录使用通用规则。
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import product
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+@dataclass
+class CheckResult:
+    ok: bool
+    errors: List[str]
+    warnings: List[str]
+    details: Dict[str, Any]
+
+
+# 规则或解析逻辑变化时递增，旧缓存自动失效
+RULES_VERSION = 1
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_PATH = REPO_ROOT / "media" / "qa_cache" / "static_rules.json"
+
+EMOJI_RE = re.compile(
+    "["
+    "\U0001F300-\U0001F5FF"
+    "\U0001F600-\U0001F64F"
+    "\U0001F680-\U0001F6FF"
+    "\U0001F700-\U0001F77F"
+    "\U0001F780-\U0001F7FF"
+    "\U0001F800-\U0001F8FF"
+    "\U0001F900-\U0001F9FF"
+    "\U0001FA00-\U0001FAFF"
+    "☀-➿"
+    "]+"
+)
+
+GRAY_NAMES = {"IT_GRAY", "GRAY", "DARK_GRAY", "GREY", "DARK_GREY"}
+GRAY_HEX = {"#6b7280", "#333333"}
+TEXT_CLASSES = {"Text", "MarkupText", "Paragraph"}
+
+# 各目录的规则档位
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "it": {
+        "require_random": True,
+        "gray_text": True,
+        "long_run_error": True,
+        "max_run_time": 12.0,
+        "max_wait": 4.0,
+        "rhythm": True,
+    },
+    "default": {
+        "require_random": False,
+        "gray_text": False,
+        "long_run_error": False,
+        "max_run_time": 12.0,
+        "max_wait": 4.0,
+        "rhythm": False,
+    },
+}
+
+SKIP_DIRS = {"templates", "components", "__pycache__"}
+
+# 解析多值表达式时的组合上限，防止循环变量相乘爆炸
+_MAX_CANDIDATES = 64
+
+
+def profile_for(path: Path) -> str:
+    return "it" if "信息论" in Path(path).parts else "default"
+
+
+# ----------------------------------------------------------------------
+# 常量折叠
+# ----------------------------------------------------------------------
+@dataclass
+class _Scope:
+    """一个函数体（或模块）里的简单赋值：名字 -> [(行号, 表达式)]"""
+    assigns: Dict[str, List[Tuple[int, ast.AST]]] = field(default_factory=dict)
+    loops: Dict[str, List[Tuple[int, ast.AST]]] = field(default_factory=dict)
+    params: set = field(default_factory=set)
+
+
+def _collect_scope(body_owner: ast.AST) -> _Scope:
+    scope = _Scope()
+    if isinstance(body_owner, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        a = body_owner.args
+        for arg in a.posonlyargs + a.args + a.kwonlyargs:
+            scope.params.add(arg.arg)
+        if a.vararg:
+            scope.params.add(a.vararg.arg)
+        if a.kwarg:
+            scope.params.add(a.kwarg.arg)
+
+    def visit(node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            # 嵌套函数 / 类有自己的作用域
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+                continue
+            if isinstance(child, ast.Assign) and len(child.targets) == 1:
+                target = child.targets[0]
+                if isinstance(target, ast.Name):
+                    scope.assigns.setdefault(target.id, []).append((child.lineno, child.value))
+                elif isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) \
+                        and target.value.id == "self":
+                    scope.assigns.setdefault(f"self.{target.attr}", []).append((child.lineno, child.value))
+            elif isinstance(child, ast.AnnAssign) and isinstance(child.target, ast.Name) and child.value:
+                scope.assigns.setdefault(child.target.id, []).append((child.lineno, child.value))
+            elif isinstance(child, ast.For) and isinstance(child.target, ast.Name):
+                scope.loops.setdefault(child.target.id, []).append((child.lineno, child.iter))
+            visit(child)
+
+    visit(body_owner)
+    return scope
+
+
+class _Evaluator:
+    """把表达式折叠成候选数值列表；无法确定时返回 None"""
+
+    def __init__(self, scopes: Sequence[_Scope]):
+        self.scopes = scopes  # 由内到外：函数、类属性、模块
+
+    def values(self, node: Optional[ast.AST], line: int, depth: int = 0) -> Optional[List[float]]:
+        if node is None or depth > 8:
+            return None
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return [float(node.value)]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            vals = self.values(node.operand, line, depth + 1)
+            if vals is None:
+                return None
+            return [-v for v in vals] if isinstance(node.op, ast.USub) else vals
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div)):
+            left = self.values(node.left, line, depth + 1)
+            right = self.values(node.right, line, depth + 1)
+            if left is None or right is None:
+                return None
+            out = []
+            for a, b in product(left, right):
+                if isinstance(node.op, ast.Add):
+                    out.append(a + b)
+                elif isinstance(node.op, ast.Sub):
+                    out.append(a - b)
+                elif isinstance(node.op, ast.Mult):
+                    out.append(a * b)
+                elif b != 0:
+                    out.append(a / b)
+            return out[:_MAX_CANDIDATES] or None
+        if isinstance(node, ast.IfExp):
+            a = self.values(node.body, line, depth + 1)
+            b = self.values(node.orelse, line, depth + 1)
+            if a is None or b is None:
+                return None
+            return a + b
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("max", "min") \
+                and node.args and not node.keywords:
+            parts = [self.values(a, line, depth + 1) for a in node.args]
+            if any(p is None for p in parts):
+                return None
+            if len(parts) == 1:
+                return [max(parts[0])] if node.func.id == "max" else [min(parts[0])]
+            fn = max if node.func.id == "max" else min
+            return [fn(combo) for combo in product(*parts)][:_MAX_CANDIDATES]
+        if isinstance(node, (ast.List, ast.Tuple)):
+            out = []
+            for elt in node.elts:
+                vals = self.values(elt, line, depth + 1)
+                if vals is None:
+                    return None
+                out.extend(vals)
+            return out
+        if isinstance(node, ast.Name):
+            return self._lookup(node.id, line, depth)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self":
+            return self._lookup(f"self.{node.attr}", line, depth)
+        return None
+
+    def _lookup(self, name: str, line: int, depth: int) -> Optional[List[float]]:
+        for i, scope in enumerate(self.scopes):
+            candidates = scope.assigns.get(name, [])
+            # 函数内取使用点之前的最后一次赋值；外层作用域取最后一次
+            before = [c for c in candidates if c[0] <= line] if i == 0 else candidates
+            if before:
+                return self.values(before[-1][1], line, depth + 1)
+            loops = scope.loops.get(name, [])
+            if loops:
+                return self.values(loops[-1][1], line, depth + 1)
+            if i == 0 and name in scope.params:
+                return None
+        return None
+
+    def kwargs_dict(self, node: ast.AST, line: int) -> Optional[Dict[str, ast.AST]]:
+        """**kw 展开：字典字面量、dict(...) 调用，或赋值为它们的变量"""
+        if isinstance(node, ast.Name):
+            for i, scope in enumerate(self.scopes):
+                candidates = scope.assigns.get(node.id, [])
+                before = [c for c in candidates if c[0] <= line] if i == 0 else candidates
+                if before:
+                    return self.kwargs_dict(before[-1][1], line)
+            return None
+        if isinstance(node, ast.Dict):
+            out = {}
+            for k, v in zip(node.keys, node.values):
+                if isinstance(k, ast.Constant) and isinstance(k.value, str):
+                    out[k.value] = v
+            return out
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "dict":
+            return {kw.arg: kw.value for kw in node.keywords if kw.arg}
+        return None
+
+
+# ----------------------------------------------------------------------
+# 辅助方法签名
+# ----------------------------------------------------------------------
+@dataclass
+class _Helper:
+    name: str
+    params: List[str]
+    defaults: Dict[str, ast.AST]
+    run_time_param: Optional[str]
+
+
+def _forwards(fn: ast.AST, param: str) -> bool:
+    """函数体里是否把该参数作为 run_time / duration 继续传下去"""
+    for node in ast.walk(fn):
+        if isinstance(node, ast.keyword) and node.arg in ("run_time", "duration") \
+                and isinstance(node.value, ast.Name) and node.value.id == param:
+            return True
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "wait" \
+                and node.args and isinstance(node.args[0], ast.Name) and node.args[0].id == param:
+            return True
+    return False
+
+
+def _helpers_in(tree: ast.AST) -> Dict[str, _Helper]:
+    helpers: Dict[str, _Helper] = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) or node.name in ("play", "wait"):
+            continue
+        a = node.args
+        positional = [p.arg for p in a.posonlyargs + a.args]
+        if positional and positional[0] in ("self", "cls"):
+            positional = positional[1:]
+        defaults = dict(zip([p.arg for p in (a.posonlyargs + a.args)][-len(a.defaults):], a.defaults)) \
+            if a.defaults else {}
+        defaults.update({k.arg: d for k, d in zip(a.kwonlyargs, a.kw_defaults) if d is not None})
+        rt = None
+        for cand in ("run_time", "duration", "rt", "t"):
+            if cand in positional + [k.arg for k in a.kwonlyargs] and _forwards(node, cand):
+                rt = cand
+                break
+        if rt is not None:
+            helpers[node.name] = _Helper(node.name, positional, defaults, rt)
+    return helpers
+
+
+_IMPORT_RE = re.compile(r"^[ \t]*(?:from|import)[ \t]+([\w.]+)", re.M)
+
+
+def _sibling_modules(path: Path) -> List[Path]:
+    """同目录下被 import 的模块（如 it_common），其中的辅助方法签名也要用到
+
+    只扫 import 行、不解析 AST：缓存命中时计算缓存键也要足够快。
+    """
+    text = path.read_bytes().decode("utf-8", errors="replace")
+    found = set()
+    for module in _IMPORT_RE.findall(text):
+        candidate = path.parent / f"{module.split('.')[-1]}.py"
+        if candidate.exists() and candidate.name != path.name:
+            found.add(candidate)
+    return sorted(found)
+
+
+# ----------------------------------------------------------------------
+# 单文件分析
+# ----------------------------------------------------------------------
+def _parse(path: Path) -> ast.AST:
+    # 按字节解析，带 BOM 的脚本也能正确处理
+    return ast.parse(path.read_bytes(), filename=str(path))
+
+
+def _enclosing_scopes(tree: ast.AST) -> Dict[int, Tuple[ast.AST, Optional[ast.ClassDef]]]:
+    """每个节点 id -> (所在函数或模块, 所在类)"""
+    owner: Dict[int, Tuple[ast.AST, Optional[ast.ClassDef]]] = {}
+
+    def visit(node: ast.AST, fn: ast.AST, cls: Optional[ast.ClassDef]) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                owner[id(child)] = (fn, cls)
+                visit(child, fn, child)
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                owner[id(child)] = (fn, cls)
+                visit(child, child, cls)
+            else:
+                owner[id(child)] = (fn, cls)
+                visit(child, fn, cls)
+
+    visit(tree, tree, None)
+    return owner
+
+
+def analyze_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """解析一次，提取所有规则需要的事实（可 JSON 序列化，便于缓存）"""
+    path = Path(path)
+    raw = path.read_bytes()
+    text = raw.decode("utf-8-sig", errors="replace")
+    tree = _parse(path)
+
+    helpers: Dict[str, _Helper] = {}
+    for sibling in _sibling_modules(path):
+        try:
+            helpers.update(_helpers_in(_parse(sibling)))
+        except SyntaxError:
+            pass
+    helpers.update(_helpers_in(tree))
+
+    owners = _enclosing_scopes(tree)
+    scope_cache: Dict[int, _Scope] = {}
+
+    def scope_of(node: ast.AST) -> _Scope:
+        if id(node) not in scope_cache:
+            scope_cache[id(node)] = _collect_scope(node)
+        return scope_cache[id(node)]
+
+    def evaluator_for(node: ast.AST) -> _Evaluator:
+        fn, cls = owners.get(id(node), (tree, None))
+        scopes = [scope_of(fn)]
+        if cls is not None:
+            # self.xxx 可能在类的任意方法（通常是 __init__ / setup）里赋值
+            merged = _Scope()
+            for item in cls.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    for k, v in scope_of(item).assigns.items():
+                        if k.startswith("self."):
+                            merged.assigns.setdefault(k, []).extend(v)
+            scopes.append(merged)
+        if fn is not tree:
+            scopes.append(scope_of(tree))
+        return _Evaluator(scopes)
+
+    run_times: List[Dict[str, Any]] = []
+    waits: List[Dict[str, Any]] = []
+    unresolved: List[int] = []
+    gray_text: List[Dict[str, Any]] = []
+    bottom: List[Dict[str, Any]] = []
+    right_zone: List[int] = []
+    has_random = False
+    strings: List[Tuple[int, str]] = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import) and any(a.name == "random" for a in node.names):
+            has_random = True
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            strings.append((node.lineno, node.value))
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+            _check_bottom(node, evaluator_for(node), bottom)
+        elif isinstance(node, ast.Call):
+            ev = evaluator_for(node)
+            line = node.lineno
+            func = node.func
+            fname = func.attr if isinstance(func, ast.Attribute) else func.id if isinstance(func, ast.Name) else ""
+
+            explicit = [kw.value for kw in node.keywords if kw.arg == "run_time"]
+            for kw in node.keywords:
+                if kw.arg is None:
+                    expanded = ev.kwargs_dict(kw.value, line)
+                    if expanded is None:
+                        continue
+                    if "run_time" in expanded:
+                        explicit.append(expanded["run_time"])
+            for expr in explicit:
+                _record(ev.values(expr, line), line, "run_time", run_times, unresolved, expr)
+
+            if fname == "wait" and isinstance(func, ast.Attribute):
+                expr = node.args[0] if node.args else next(
+                    (kw.value for kw in node.keywords if kw.arg == "duration"), None)
+                if expr is not None:
+                    _record(ev.values(expr, line), line, "wait", waits, unresolved, expr)
+            elif fname in helpers and not explicit:
+                h = helpers[fname]
+                expr = _helper_arg(node, h)
+                if expr is not None:
+                    vals = ev.values(expr, line)
+                    if vals is not None:
+                        for v in vals:
+                            run_times.append({"line": line, "value": v, "via": fname})
+
+            if fname in TEXT_CLASSES:
+                for kw in node.keywords:
+                    if kw.arg == "color":
+                        gray = _gray_name(kw.value, ev, line)
+                        if gray:
+                            gray_text.append({"line": line, "color": gray})
+            if fname == "move_to" and isinstance(func, ast.Attribute) and isinstance(func.value, ast.Call) \
+                    and isinstance(func.value.func, ast.Name) and func.value.func.id in TEXT_CLASSES \
+                    and node.args and _is_right_zone_offset(node.args[0]):
+                right_zone.append(line)
+
+    question_in_head = any(line <= 120 and re.search(r"[？?]", s) for line, s in strings)
+    preview_line = min((line for line, s in strings if "下期预告" in s), default=None)
+    preview_runs = [r["value"] for r in run_times if preview_line is not None and r["line"] >= preview_line]
+
+    has_scene = any(
+        isinstance(c, ast.ClassDef) and any(
+            isinstance(f, ast.FunctionDef) and f.name == "construct" for f in c.body)
+        for c in ast.walk(tree))
+
+    return {
+        "has_scene": has_scene,
+        "has_random": has_random,
+        "emoji": bool(EMOJI_RE.search(text)),
+        "gray_text": gray_text,
+        "bottom": bottom,
+        "right_zone": right_zone,
+        "run_times": run_times,
+        "waits": waits,
+        "unresolved": sorted(set(unresolved)),
+        "question_in_head": question_in_head,
+        "has_preview": preview_line is not None,
+        "preview_run_time": sum(preview_runs),
+    }
+
+
+def _record(vals: Optional[List[float]], line: int, kind: str, out: List[Dict[str, Any]],
+            unresolved: List[int], expr: ast.AST) -> None:
+    if vals is None:
+        unresolved.append(line)
+        return
+    via = "literal" if isinstance(expr, ast.Constant) else "expression"
+    for v in vals:
+        out.append({"line": line, "value": v, "via": via})
+
+
+def _helper_arg(call: ast.Call, h: _Helper) -> Optional[ast.AST]:
+    for kw in call.keywords:
+        if kw.arg == h.run_time_param:
+            return kw.value
+    if h.run_time_param in h.params:
+        idx = h.params.index(h.run_time_param)
+        if idx < len(call.args) and not any(isinstance(a, ast.Starred) for a in call.args[:idx + 1]):
+            return call.args[idx]
+    return h.defaults.get(h.run_time_param)
+
+
+def _gray_name(node: ast.AST, ev: _Evaluator, line: int, depth: int = 0) -> Optional[str]:
+    if depth > 4:
+        return None
+    if isinstance(node, ast.Name):
+        if node.id in GRAY_NAMES:
+            return node.id
+        for scope in ev.scopes:
+            assigned = scope.assigns.get(node.id)
+            if assigned:
+                return _gray_name(assigned[-1][1], ev, line, depth + 1)
+        return None
+    if isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.lower() in GRAY_HEX:
+        return node.value
+    return None
+
+
+def _check_bottom(node: ast.BinOp, ev: _Evaluator, out: List[Dict[str, Any]]) -> None:
+    """DOWN * k 或 k * DOWN，k 可以是表达式"""
+    for vec, scalar in ((node.left, node.right), (node.right, node.left)):
+        if isinstance(vec, ast.Name) and vec.id == "DOWN":
+            vals = ev.values(scalar, node.lineno)
+            if vals:
+                out.append({"line": node.lineno, "value": max(vals)})
+            return
+
+
+def _is_right_zone_offset(node: ast.AST) -> bool:
+    if not (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add)):
+        return False
+    names = {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+    return "RIGHT_ZONE" in names and bool(names & {"UP", "DOWN"})
+
+
+# ----------------------------------------------------------------------
+# 规则
+# ----------------------------------------------------------------------
+def static_rules_from_facts(facts: Dict[str, Any], profile: str = "it") -> CheckResult:
+    rules = PROFILES[profile]
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    if rules["require_random"] and not facts["has_random"]:
+        errors.append("missing `import random`")
+
+    if rules["gray_text"]:
+        for g in facts["gray_text"]:
+            errors.append(f"gray text detected: color={g['color']} (line {g['line']})")
+
+    if facts["emoji"]:
+        errors.append("emoji characters found in script")
+
+    if any(b["value"] >= 4.0 for b in facts["bottom"]):
+        errors.append("unsafe bottom placement: DOWN * 4")
+    if any(3.5 < b["value"] < 4.0 for b in facts["bottom"]):
+        warnings.append("possible bottom-risk placement below DOWN * 3.5")
+
+    if facts["right_zone"]:
+        warnings.append("right-zone text uses absolute move_to; prefer arranged flow")
+
+    run_times = [r["value"] for r in facts["run_times"]]
+    long_runs = [v for v in run_times if v > rules["max_run_time"]]
+    if long_runs:
+        msg = f"run_time > {rules['max_run_time']:g} found: {long_runs}"
+        (errors if rules["long_run_error"] else warnings).append(msg)
+
+    waits = [w["value"] for w in facts["waits"]]
+    long_waits = [v for v in waits if v > rules["max_wait"]]
+    if long_waits:
+        warnings.append(f"self.wait > {rules['max_wait']:g} found: {long_waits}")
+
+    details = {
+        "run_times_count": len(run_times),
+        "waits_count": len(waits),
+        "long_runs": long_runs,
+        "long_waits": long_waits,
+        "via_helpers": sorted({r["via"] for r in facts["run_times"]} - {"literal", "expression"}),
+        "unresolved_lines": facts["unresolved"],
+    }
+    return CheckResult(ok=len(errors) == 0, errors=errors, warnings=warnings, details=details)
+
+
+def rhythm_from_facts(facts: Dict[str, Any]) -> CheckResult:
+    warnings: List[str] = []
+    # 钩子代理: 前 6 秒（脚本开头）至少有一条问题句
+    if not facts["question_in_head"]:
+        warnings.append("no question mark found near script header; hook may be weak")
+    # 预告时长代理: 预告段 run_time 过长预警
+    if facts["has_preview"] and facts["preview_run_time"] > 8:
+        warnings.append(f"preview runtime sum seems long: {facts['preview_run_time']:.2f}s")
+    return CheckResult(ok=True, errors=[], warnings=warnings, details={})
+
+
+# ----------------------------------------------------------------------
+# 缓存与并行
+# ----------------------------------------------------------------------
+def _content_key(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(RULES_VERSION).encode())
+    h.update(path.read_bytes())
+    # 辅助方法签名来自同目录模块，它们变了结果也要重算
+    for sibling in _sibling_modules(path):
+        h.update(sibling.read_bytes())
+    return h.hexdigest()
+
+
+class FactCache:
+    """按内容哈希缓存每个文件的分析结果（JSON 单文件）"""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_CACHE_PATH):
+        self.path = Path(path) if path else None
+        self.entries: Dict[str, Any] = {}
+        self.dirty = False
+        if self.path and self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception:
+                self.entries = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(key)
+
+    def put(self, key: str, facts: Dict[str, Any]) -> None:
+        self.entries[key] = facts
+        self.dirty = True
+
+    def save(self, live_keys: Iterable[str] = ()) -> None:
+        if not self.path or not self.dirty:
+            return
+        live = set(live_keys)
+        if live:
+            # 只保留本次仍然存在的文件版本，缓存不会无限增长
+            self.entries = {k: v for k, v in self.entries.items() if k in live}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, ensure_ascii=False), encoding="utf-8")
+
+
+def _analyze_job(path: str) -> Dict[str, Any]:
+    try:
+        return analyze_file(path)
+    except SyntaxError as exc:
+        return {"syntax_error": f"line {exc.lineno}: {exc.msg}"}
+
+
+def discover_scripts(paths: Sequence[Union[str, Path]]) -> List[Path]:
+    files: List[Path] = []
+    for p in map(Path, paths):
+        if p.is_dir():
+            files += [f for f in sorted(p.rglob("*.py"))
+                      if not (SKIP_DIRS & set(f.parts)) and f.name != "__init__.py"]
+        else:
+            files.append(p)
+    return files
+
+
+def check_files(paths: Sequence[Union[str, Path]], jobs: Optional[int] = None,
+                cache: Optional[FactCache] = None) -> Dict[str, Dict[str, Any]]:
+    """检查一批脚本，返回 {路径: {"static": CheckResult, "rhythm": CheckResult, "cached": bool}}
+
+    目录里没有定义 construct 的工具模块不出现在结果里；显式给出的文件总会检查。
+    """
+    files = discover_scripts(paths)
+    cache = cache if cache is not None else FactCache()
+    keys = {f: _content_key(f) for f in files}
+
+    facts: Dict[Path, Dict[str, Any]] = {}
+    misses = []
+    for f in files:
+        hit = cache.get(keys[f])
+        if hit is not None:
+            facts[f] = hit
+        else:
+            misses.append(f)
+
+    workers = jobs if jobs is not None else min(len(misses), os.cpu_count() or 1)
+    if len(misses) > 8 and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(_analyze_job, [str(f) for f in misses], chunksize=4))
+    else:
+        fresh = [_analyze_job(str(f)) for f in misses]
+    for f, result in zip(misses, fresh):
+        facts[f] = result
+        cache.put(keys[f], result)
+    # 只有扫描目录时才知道哪些文件版本仍然存在；单文件检查只追加，不清掉其他文件的缓存
+    scanned_dirs = any(Path(p).is_dir() for p in paths)
+    cache.save(keys.values() if scanned_dirs else ())
+
+    explicit = {Path(p) for p in paths if not Path(p).is_dir()}
+    results: Dict[str, Dict[str, Any]] = {}
+    for f in files:
+        fact = facts[f]
+        # 目录扫描时跳过工具模块（没有定义 construct 的文件）
+        if f not in explicit and not fact.get("has_scene", True):
+            continue
+        if "syntax_error" in fact:
+            err = CheckResult(ok=False, errors=[f"syntax error: {fact['syntax_error']}"], warnings=[], details={})
+            results[str(f)] = {"static": err, "rhythm": CheckResult(True, [], [], {}), "cached": f not in misses}
+            continue
+        profile = profile_for(f)
+        rhythm = rhythm_from_facts(fact) if PROFILES[profile]["rhythm"] else CheckResult(True, [], [], {})
+        results[str(f)] = {
+            "static": static_rules_from_facts(fact, profile),
+            "rhythm": rhythm,
+            "cached": f not in misses,
+        }
+    return results
+
+
+def check_script(py_file: Path) -> Tuple[CheckResult, CheckResult]:
+    """单个脚本的 (静态规则, 节奏代理) 结果；只哈希、分析一次"""
+    res = check_files([py_file], jobs=1)[str(py_file)]
+    return res["static"], res["rhythm"]
+
+
+def check_static_rules(py_file: Path) -> CheckResult:
+    return check_script(py_file)[0]
+
+
+def check_rhythm_proxy(py_file: Path) -> CheckResult:
+    return check_script(py_file)[1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="场景脚本静态规则检查（AST，增量缓存，并行）")
+    parser.add_argument("paths", nargs="*", default=[str(REPO_ROOT / "scenes")])
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--json", default=None, help="write all results to this JSON file")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only print files with errors")
+    args = parser.parse_args()
+
+    cache = FactCache(None) if args.no_cache else FactCache()
+    results = check_files(args.paths, jobs=args.jobs, cache=cache)
+
+    failed = 0
+    cached = 0
+    for path, res in results.items():
+        static, rhythm = res["static"], res["rhythm"]
+        cached += res["cached"]
+        failed += not static.ok
+        if args.quiet and static.ok:
+            continue
+        status = "ok" if static.ok else "FAIL"
+        print(f"[LINT] {status} {path}")
+        for e in static.errors:
+            print(f"    error: {e}")
+        if not args.quiet:
+            for w in static.warnings + rhythm.warnings:
+                print(f"    warning: {w}")
+    print(f"[LINT] {len(results) - failed}/{len(results)} files pass ({cached} from cache)")
+
+    if args.json:
+        payload = {p: {"static": asdict(r["static"]), "rhythm": asdict(r["rhythm"])} for p, r in results.items()}
+        Path(args.json).write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
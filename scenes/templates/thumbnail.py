@@ -0,0 +1,230 @@
+"""
+封面 / 缩略图渲染
+跳过模式快进到指定时刻或指定分段，只光栅化一帧，按任意分辨率保存 PNG；拿到画面后立即停止，
+不跑完后面的时间线。
+
+    # 某一时刻
+    python -m scenes.templates.thumbnail scenes/geometry/golden_rectangle_ep4.py GoldenRectangleEP4 --at 95.5
+    # 某个方法执行完的画面（分段方法，或 make_title_block 这类构造方法之后的第一个 play）
+    python -m scenes.templates.thumbnail scenes/geometry/golden_rectangle_ep4.py GoldenRectangleEP4 \\
+        --section create_golden_spiral -r 3840,2160
+    # 分段开始后 2 秒
+    python -m scenes.templates.thumbnail ... --section show_title --at 2
+    # 整个系列并行出封面
+    python -m scenes.templates.thumbnail scenes/信息论 --section make_title_block --jobs 4 --out output/covers
+    python -m scenes.templates.thumbnail --batch covers.json --jobs 4
+
+批量清单 covers.json 为列表，每项 {"script", "scene", "at" / "section", "out", "resolution"}，
+缺省字段取命令行参数。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from PIL import Image
+from manim import config
+
+from scenes.templates.dry_run import load_scene_class, run_dry
+from scenes.templates.frame_sampler import FrameSamplerMixin
+from scenes.templates.layout_check import discover_scenes
+
+DEFAULT_RESOLUTION = (3840, 2160)
+DEFAULT_OUT_DIR = "output/covers"
+
+
+class _Captured(Exception):
+    """截到目标画面后中止时间线"""
+
+    def __init__(self, frame: np.ndarray, time: float, section: str):
+        super().__init__(section)
+        self.frame = frame
+        self.time = time
+        self.section = section
+
+
+class ThumbnailMixin(FrameSamplerMixin):
+    """快进到目标处截一帧后中止场景
+
+    thumbnail_at：时间线上的秒数；与 thumbnail_section 同时给出时表示相对该方法首次 play 的偏移
+    thumbnail_section：方法名。只给方法名时，截取"最后一个属于它的 play 结束后"的画面：
+        分段方法（create_golden_spiral）即该段结束时；只构造对象、不自己 play 的方法
+        （make_title_block）即调用之后的第一个 play 结束时。
+    """
+
+    thumbnail_at: Optional[float] = None
+    thumbnail_section: Optional[str] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._target_called = False
+        self._target_seen = False
+        self._sections_seen: List[str] = []
+        target = self.thumbnail_section
+        if target:
+            bound = getattr(self, target, None)
+            if bound is None or not callable(bound):
+                raise ValueError(f"{type(self).__name__} has no method {target!r}")
+            setattr(self, target, self._flag_call(bound))
+        elif self.thumbnail_at is not None:
+            self._pending_times = [float(self.thumbnail_at)]
+
+    def _flag_call(self, bound: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            self._target_called = True
+            return bound(*args, **kwargs)
+
+        wrapper.__wrapped__ = bound
+        return wrapper
+
+    def _save(self, frame: np.ndarray, t: float, section: str, kind: str) -> None:
+        raise _Captured(frame, t, section)
+
+    def play(self, *args, **kwargs):
+        target = self.thumbnail_section
+        section = self.current_section
+        if not self._sections_seen or self._sections_seen[-1] != section:
+            self._sections_seen.append(section)
+        if target:
+            involved = self._target_called or target in self._method_stack
+            self._target_called = False
+            if involved and not self._target_seen:
+                self._target_seen = True
+                if self.thumbnail_at is not None:
+                    self._pending_times = [self.timeline_time + float(self.thumbnail_at)]
+            elif not involved and self._target_seen and self.thumbnail_at is None:
+                self._save(self._grab(), self.timeline_time, section, "section")
+        return super().play(*args, **kwargs)
+
+    def tear_down(self):
+        # 目标在最后一段：时间线走完时的画面就是结果
+        if self._target_seen and self.thumbnail_at is None:
+            self._save(self._grab(), self.timeline_time, self.current_section, "section")
+        super().tear_down()
+
+
+def render_thumbnail(script: Union[str, Path],
+                     class_name: Optional[str] = None,
+                     out: Union[str, Path, None] = None,
+                     at: Optional[float] = None,
+                     section: Optional[str] = None,
+                     resolution: Sequence[int] = DEFAULT_RESOLUTION) -> Dict[str, Any]:
+    """渲染单张封面，返回 {scene, time, section, path, resolution}"""
+    if at is None and not section:
+        raise ValueError("give a timestamp (at) or a method name (section)")
+    scene_cls = load_scene_class(script, class_name)
+    width, height = int(resolution[0]), int(resolution[1])
+    out = Path(out) if out else Path(DEFAULT_OUT_DIR) / f"{scene_cls.__name__}.png"
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    # 非 16:9（竖版、方形）时按像素比例调整画幅宽度，避免拉伸
+    overrides: Dict[str, Any] = {
+        "pixel_width": width,
+        "pixel_height": height,
+        "frame_width": config.frame_height * width / height,
+    }
+
+    attrs = {"thumbnail_at": at, "thumbnail_section": section, "sample_dir": str(out.parent)}
+    try:
+        # 不开 rasterize：途中每次 play 都不画，只在截帧时光栅化一次
+        scene = run_dry(scene_cls, mixins=(ThumbnailMixin,), attrs=attrs, config_overrides=overrides)
+    except _Captured as hit:
+        Image.fromarray(hit.frame[..., :3]).save(out)
+        return {
+            "script": str(script),
+            "scene": scene_cls.__name__,
+            "time": round(hit.time, 4),
+            "section": hit.section,
+            "path": str(out),
+            "resolution": [width, height],
+        }
+
+    what = f"section {section!r}" if section else f"t={at}s"
+    if section and not scene._target_seen:
+        raise ValueError(f"{what} never played in {scene_cls.__name__}; sections: {scene._sections_seen}")
+    raise ValueError(f"{what} is past the end of {scene_cls.__name__} ({scene.timeline_time:.2f}s)")
+
+
+def _thumbnail_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return dict(render_thumbnail(**job), ok=True)
+    except Exception as exc:  # 单个场景失败不影响整批
+        return {"script": str(job["script"]), "scene": job.get("class_name"), "ok": False,
+                "error": f"{type(exc).__name__}: {exc}", "traceback": traceback.format_exc(limit=3)}
+
+
+def render_thumbnails(jobs: Sequence[Dict[str, Any]], workers: int = 1) -> List[Dict[str, Any]]:
+    """多进程批量渲染；每个 job 是 render_thumbnail 的关键字参数"""
+    if workers <= 1 or len(jobs) <= 1:
+        return [_thumbnail_job(j) for j in jobs]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_thumbnail_job, j) for j in jobs]
+        for fut in as_completed(futures):
+            results.append(fut.result())
+    return sorted(results, key=lambda r: (r["script"], r.get("scene") or ""))
+
+
+def load_batch(path: Union[str, Path], defaults: Dict[str, Any], out_dir: Union[str, Path]) -> List[Dict[str, Any]]:
+    jobs = []
+    for item in json.loads(Path(path).read_text(encoding="utf-8")):
+        job = dict(defaults)
+        job["script"] = item["script"]
+        job["class_name"] = item.get("scene")
+        for key in ("at", "section"):
+            if key in item:
+                job[key] = item[key]
+        if "resolution" in item:
+            job["resolution"] = tuple(item["resolution"])
+        name = item.get("out") or f"{item.get('scene') or Path(item['script']).stem}.png"
+        job["out"] = str(Path(out_dir) / name)
+        jobs.append(job)
+    return jobs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="快进到指定时刻 / 分段，渲染一帧封面")
+    parser.add_argument("script", nargs="?", help="scene script, or a directory for a whole series")
+    parser.add_argument("scene", nargs="?", default=None)
+    parser.add_argument("--at", type=float, default=None,
+                        help="timestamp in seconds (relative to --section's first play when both given)")
+    parser.add_argument("--section", default=None, help="method name, e.g. create_golden_spiral / make_title_block")
+    parser.add_argument("-r", "--resolution", default="3840,2160", help="W,H")
+    parser.add_argument("--out", default=None, help="PNG path (single scene) or directory (batch)")
+    parser.add_argument("--batch", default=None, help="JSON list of {script, scene, at|section, out}")
+    parser.add_argument("--jobs", type=int, default=1)
+    args = parser.parse_args()
+
+    resolution = tuple(int(v) for v in args.resolution.split(","))
+    defaults = {"at": args.at, "section": args.section, "resolution": resolution}
+
+    if args.batch:
+        jobs = load_batch(args.batch, defaults, args.out or DEFAULT_OUT_DIR)
+    elif args.script and Path(args.script).is_dir():
+        out_dir = Path(args.out or DEFAULT_OUT_DIR)
+        jobs = [dict(defaults, script=str(path), class_name=name, out=str(out_dir / f"{name}.png"))
+                for path, name in discover_scenes(args.script)]
+    elif args.script:
+        jobs = [dict(defaults, script=args.script, class_name=args.scene, out=args.out)]
+    else:
+        parser.error("give a script, a directory or --batch")
+
+    failed = 0
+    for r in render_thumbnails(jobs, workers=args.jobs):
+        if r["ok"]:
+            print(f"[COVER] {r['scene']} t={r['time']:.2f}s ({r['section']}) "
+                  f"{r['resolution'][0]}x{r['resolution'][1]} -> {r['path']}")
+        else:
+            failed += 1
+            print(f"[FAIL] {r['script']} {r['scene'] or ''}: {r['error']}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+"""
+时间线时长估算
+跳过全部动画、不光栅化地执行 construct，记录每次 play / wait 的起点、时长和所属分段，
+在渲染之前就能知道成片时长。整个目录并行估算，单集通常一两秒。
+
+    python -m scenes.templates.timeline scenes/信息论/information_theory_ep20.py --scene InformationTheoryEP20 -v
+    python -m scenes.templates.timeline scenes/信息论 --jobs 8 --min 60 --max 75
+
+作为渲染前的闸门使用时，时长超出 [--min, --max] 返回非零退出码。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from scenes.templates.dry_run import TimelineMixin, load_scene_class, run_dry
+from scenes.templates.layout_check import discover_scenes
+
+
+def estimate_timeline(script: Union[str, Path], class_name: Optional[str] = None) -> Dict[str, Any]:
+    """试运行一个场景，返回 timeline_summary()（总时长、各分段、每次 play 的时间）"""
+    scene_cls = load_scene_class(script, class_name)
+    scene = run_dry(scene_cls, mixins=(TimelineMixin,))
+    summary = scene.timeline_summary()
+    summary["script"] = str(script)
+    return summary
+
+
+def check_duration_bounds(summary: Dict[str, Any], min_s: Optional[float] = None,
+                          max_s: Optional[float] = None) -> List[str]:
+    duration = summary["duration"]
+    errors = []
+    if min_s is not None and duration < min_s:
+        errors.append(f"duration too short: {duration:.2f}s < {min_s:.2f}s")
+    if max_s is not None and duration > max_s:
+        errors.append(f"duration too long: {duration:.2f}s > {max_s:.2f}s")
+    return errors
+
+
+def _estimate_job(script: str, class_name: str) -> Dict[str, Any]:
+    if not class_name:
+        return {"script": script, "scene": None, "error": "failed to load script"}
+    try:
+        return estimate_timeline(script, class_name)
+    except Exception as exc:
+        return {
+            "script": script, "scene": class_name,
+            "error": f"{type(exc).__name__}: {exc}",
+            "traceback": traceback.format_exc(limit=5),
+        }
+
+
+def estimate_catalogue(root: Union[str, Path], jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+    targets = discover_scenes(root)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1:
+        return [_estimate_job(str(p), c) for p, c in targets]
+    summaries = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_estimate_job, str(p), c) for p, c in targets]
+        for fut in as_completed(futures):
+            summaries.append(fut.result())
+    return sorted(summaries, key=lambda s: (s["script"], s.get("scene") or ""))
+
+
+def _print_summary(summary: Dict[str, Any], verbose: bool) -> None:
+    print(f"[TIMELINE] {summary['script']} {summary['scene']}: {summary['duration']:.2f}s "
+          f"({summary['n_plays']} plays, {summary['n_waits']} waits)")
+    for s in summary["sections"]:
+        print(f"    {s['start']:7.2f}s  {s['duration']:6.2f}s  {s['name']}")
+    if verbose:
+        for p in summary["plays"]:
+            print(f"        {p['start']:7.2f}s +{p['run_time']:5.2f}s  {p['kind']:4s} "
+                  f"{','.join(p['animations'])}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="不渲染估算场景时长（跳过模式试运行）")
+    parser.add_argument("paths", nargs="+", help="scene scripts or directories")
+    parser.add_argument("--scene", default=None, help="scene class (single script only)")
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--min", dest="min_s", type=float, default=None, help="fail below this duration")
+    parser.add_argument("--max", dest="max_s", type=float, default=None, help="fail above this duration")
+    parser.add_argument("--json", default=None, help="write all timelines to this JSON file")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every play/wait")
+    args = parser.parse_args()
+
+    summaries: List[Dict[str, Any]] = []
+    for p in args.paths:
+        if Path(p).is_dir():
+            summaries += estimate_catalogue(p, jobs=args.jobs)
+        else:
+            summaries.append(_estimate_job(p, args.scene or load_scene_class(p).__name__))
+
+    failed = 0
+    for s in summaries:
+        if s.get("error"):
+            failed += 1
+            print(f"[TIMELINE] {s['script']} {s.get('scene') or '-'}: ERROR {s['error']}")
+            continue
+        _print_summary(s, args.verbose)
+        s["errors"] = check_duration_bounds(s, args.min_s, args.max_s)
+        for e in s["errors"]:
+            print(f"    error: {e}")
+        failed += bool(s["errors"])
+    print(f"[TIMELINE] {len(summaries) - failed}/{len(summaries)} scenes within bounds")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(summaries, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,8 +6,13 @@ EP03: 黄金分割的几何构造
 
 from manim import *
 import numpy as np
+import sys
+from pathlib import Path
 from typing import List, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.phyllotaxis import PhyllotaxisHead
+
 # 系列三配色方案
 PROOF_BLUE = "#2563EB"      # 主色：证明蓝
 PROOF_GREEN = "#059669"     # 辅助：推理绿  
@@ -602,21 +607,9 @@ class GoldenRatioEP03(Scene):
     
     def create_sunflower_pattern(self):
         """创建向日葵图案"""
-        pattern = VGroup()
         n_seeds = 100
         golden_angle = 2 * PI / (PHI ** 2)
-        
-        for i in range(n_seeds):
-            angle = i * golden_angle
-            radius = 0.05 * np.sqrt(i)
-            
-            x = radius * np.cos(angle)
-            y = radius * np.sin(angle)
-            
-            seed = Dot([x, y, 0], radius=0.02, color=PROOF_YELLOW)
-            pattern.add(seed)
-        
-        return pattern
+        return PhyllotaxisHead(n_seeds, angle=golden_angle, scale=0.05, radius=0.02, colors=[PROOF_YELLOW])
     
     def golden_ratio_in_art(self):
         """艺术中的应用"""
@@ -7,8 +7,13 @@ EP02: 圆周率π的5种推导
 from manim import *
 import numpy as np
 import random
+import sys
+from pathlib import Path
 from typing import List, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.probability.components.monte_carlo import BuffonNeedle, CirclePi, simulate
+
 # 系列三配色方案
 PROOF_BLUE = "#2563EB"      # 主色：证明蓝
 PROOF_GREEN = "#059669"     # 辅助：推理绿  
@@ -438,50 +443,45 @@ class PiCalculationEP02(Scene):
         for line in explanation:
             self.play(Write(line), run_time=0.6)
         
-        # 模拟投点
-        random.seed(42)
-        points_inside = 0
-        points_total = 0
-        
+        # 模拟投点：一千万个点分批向量化生成，在对数间隔的检查点刷新计数和密度图
+        run = simulate(CirclePi(radius=2), 10**7, resolution=320, seed=42)
+        square.set_z_index(1)
+        circle.set_z_index(1)
+
+        def density_at(k):
+            image = ImageMobject(run.density_image(
+                k, hit_color=color_to_int_rgb(PROOF_GREEN), miss_color=color_to_int_rgb(PROOF_RED)
+            ))
+            image.stretch_to_fit_width(square.width)
+            image.stretch_to_fit_height(square.height)
+            image.move_to(square)
+            return image
+
+        def make_counter(total=0, inside=0, pi_estimate=None):
+            pi_text = "0.000" if pi_estimate is None else f"{pi_estimate:.4f}"
+            error_text = "-" if pi_estimate is None else f"{abs(pi_estimate - PI):.4f}"
+            return VGroup(
+                Text(f"总点数：{total:,}", font_size=SMALL_SIZE),
+                Text(f"圆内点数：{inside:,}", font_size=SMALL_SIZE, color=PROOF_GREEN),
+                Text(f"π ≈ {pi_text}", font_size=NORMAL_SIZE, color=PROOF_PURPLE),
+                Text(f"误差 {error_text}", font_size=SMALL_SIZE, color=PROOF_GRAY)
+            ).arrange(DOWN, buff=0.2).shift(RIGHT * 3 + DOWN * 2)
+
         # 计数器
-        counter = VGroup(
-            Text("总点数：0", font_size=SMALL_SIZE),
-            Text("圆内点数：0", font_size=SMALL_SIZE, color=PROOF_GREEN),
-            Text("π ≈ 0.000", font_size=NORMAL_SIZE, color=PROOF_PURPLE)
-        ).arrange(DOWN, buff=0.2)
-        counter.shift(RIGHT * 3 + DOWN * 2)
-        
+        counter = make_counter()
+
         for text in counter:
             self.play(Write(text), run_time=0.3)
-        
-        # 投点动画
-        for _ in range(100):
-            x, y = random.uniform(-2, 2), random.uniform(-2, 2)
-            point_pos = LEFT * 3 + RIGHT * x + UP * y
-            
-            if x**2 + y**2 <= 4:
-                color = PROOF_GREEN
-                points_inside += 1
-            else:
-                color = PROOF_RED
-            
-            points_total += 1
-            
-            dot = Dot(point_pos, radius=0.03, color=color)
-            self.add(dot)
-            
-            # 更新计数器（每10个点更新一次）
-            if points_total % 10 == 0:
-                pi_estimate = 4 * points_inside / points_total
-                new_counter = VGroup(
-                    Text(f"总点数：{points_total}", font_size=SMALL_SIZE),
-                    Text(f"圆内点数：{points_inside}", font_size=SMALL_SIZE, color=PROOF_GREEN),
-                    Text(f"π ≈ {pi_estimate:.3f}", font_size=NORMAL_SIZE, color=PROOF_PURPLE)
-                ).arrange(DOWN, buff=0.2)
-                new_counter.shift(RIGHT * 3 + DOWN * 2)
-                
-                counter.become(new_counter)
-        
+
+        # 投点动画：10 → 10⁷ 个点
+        density = None
+        for k, n in enumerate(run.checkpoints):
+            new_density = density_at(k)
+            counter.become(make_counter(int(n), int(run.hits[k]), float(run.estimates[k])))
+            fades = [FadeIn(new_density)] + ([FadeOut(density)] if density is not None else [])
+            self.play(*fades, run_time=0.3)
+            density = new_density
+
         # 结果
         result = Text(
             "点数越多，估计越准确",
@@ -535,73 +535,69 @@ class PiCalculationEP02(Scene):
             self.play(Write(line), run_time=0.5)
         
         # 模拟投针
-        random.seed(42)
-        needles = VGroup()
-        intersections = 0
-        total = 0
-        
-        # 针的长度（小于线间距）
+        # 针的长度（小于线间距）；针的中点落在四个间距高的带内
         needle_length = 1.0
         line_spacing = 1.5
-        
-        for _ in range(30):
-            # 随机位置和角度
-            center_x = random.uniform(-3, 3)
-            center_y = random.uniform(-3, 3)
-            angle = random.uniform(0, PI)
-            
-            # 计算针的两端
-            dx = needle_length * np.cos(angle) / 2
-            dy = needle_length * np.sin(angle) / 2
-            
-            start = np.array([center_x - dx, center_y - dy, 0])
-            end = np.array([center_x + dx, center_y + dy, 0])
-            
-            # 检查是否与线相交
-            for i in range(5):
-                line_y = (i - 2) * 1.5
-                if min(start[1], end[1]) <= line_y <= max(start[1], end[1]):
-                    color = PROOF_RED
-                    intersections += 1
-                    break
-            else:
-                color = PROOF_GREEN
-            
-            total += 1
-            
-            # 创建针
-            needle = Line(
-                start + LEFT * 1,
-                end + LEFT * 1,
-                stroke_color=color,
-                stroke_width=2
-            )
-            needles.add(needle)
-            
-            self.play(Create(needle), run_time=0.1)
-        
+        buffon = BuffonNeedle(needle_length, line_spacing, extent=(-3.0, 3.0, -3.0, 3.0))
+
+        # 先逐根画出 30 根针，看清相交的含义
+        starts, ends, crossed = buffon.needle_segments(np.random.default_rng(42), 30)
+        needles = VGroup(*[
+            Line(start + LEFT * 1, end + LEFT * 1,
+                 stroke_color=PROOF_RED if hit else PROOF_GREEN, stroke_width=2)
+            for start, end, hit in zip(starts, ends, crossed)
+        ])
+        self.play(LaggedStart(*[Create(needle) for needle in needles], lag_ratio=0.5), run_time=3)
+
+        # 再投一千万根：只记针的中点，相交的针集中在平行线附近
+        run = simulate(buffon, 10**7, resolution=320, seed=42)
+        lines.set_z_index(1)
+
+        def density_at(k):
+            image = ImageMobject(run.density_image(
+                k, hit_color=color_to_int_rgb(PROOF_RED), miss_color=color_to_int_rgb(PROOF_GREEN)
+            ))
+            image.stretch_to_fit_width(6)
+            image.stretch_to_fit_height(6)
+            image.move_to(LEFT * 1)
+            return image
+
+        def make_counts(total, intersections):
+            return VGroup(
+                Text(f"总针数：{total:,}", font_size=SMALL_SIZE),
+                Text(f"相交数：{intersections:,}", font_size=SMALL_SIZE, color=PROOF_RED),
+            ).arrange(DOWN, buff=0.3).shift(RIGHT * 4 + DOWN * 1.6)
+
+        def make_estimate(pi_estimate):
+            return Text(f"π ≈ {pi_estimate:.4f}", font_size=NORMAL_SIZE, color=PROOF_PURPLE) \
+                .shift(RIGHT * 4 + DOWN * 2.8)
+
+        counts = make_counts(len(needles), int(crossed.sum()))
+        estimate = make_estimate(float(buffon.estimate(crossed.sum(), len(needles))))
+        self.play(Write(counts), Write(estimate), run_time=0.5)
+
+        density = None
+        for k, n in enumerate(run.checkpoints):
+            new_density = density_at(k)
+            counts.become(make_counts(int(n), int(run.hits[k])))
+            estimate.become(make_estimate(float(run.estimates[k])))
+            fades = [FadeIn(new_density), FadeOut(density if density is not None else needles)]
+            self.play(*fades, run_time=0.3)
+            density = new_density
+
         # 计算π
-        if intersections > 0:
-            pi_estimate = (2 * needle_length * total) / (line_spacing * intersections)
-        else:
-            pi_estimate = 0
-        
+        pi_estimate = float(run.estimates[-1])
+
         # 结果显示
-        result = VGroup(
-            Text(f"总针数：{total}", font_size=SMALL_SIZE),
-            Text(f"相交数：{intersections}", font_size=SMALL_SIZE, color=PROOF_RED),
-            MathTex(f"\\pi \\approx \\frac{{2l \\cdot n}}{{d \\cdot m}} = {pi_estimate:.3f}", 
-                   font_size=32, color=PROOF_PURPLE)
-        ).arrange(DOWN, buff=0.3)
-        result.shift(RIGHT * 4 + DOWN * 2)
-        
-        for line in result:
-            self.play(Write(line), run_time=0.5)
-        
+        formula = MathTex(f"\\pi \\approx \\frac{{2l \\cdot n}}{{d \\cdot m}} = {pi_estimate:.4f}",
+                          font_size=32, color=PROOF_PURPLE).move_to(estimate)
+        self.play(ReplacementTransform(estimate, formula), run_time=0.5)
+        result = VGroup(counts, formula)
+
         self.wait(2)
         self.play(
             FadeOut(method_num), FadeOut(title), FadeOut(lines),
-            FadeOut(needles), FadeOut(explanation), FadeOut(result)
+            FadeOut(density), FadeOut(explanation), FadeOut(result)
         )
     
     def pi_properties(self):
@@ -3,8 +3,17 @@
 from manim import *
 import numpy as np
 import random
+import sys
+from pathlib import Path
 from typing import Iterable, List, Sequence
 
+# manim 从本目录运行时，仓库根目录不在 sys.path 上
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from scenes.templates.layout_check import bounding_boxes, sweep_overlaps
+
 # --- 信息论系列公共配色 ---
 IT_GREEN = "#00FF41"
 IT_RED = "#FF2A68"
@@ -76,36 +85,18 @@ class ITSceneBase(Scene):
             self.play(FadeOut(VGroup(*self.mobjects)), run_time=run_time)
 
     def assert_in_safe_area(self, mob: Mobject, name: str = "mob") -> None:
-        top = mob.get_top()[1]
-        bottom = mob.get_bottom()[1]
+        _, bottom, _, top = bounding_boxes([mob])[0]
         if top > SAFE_TOP_Y:
             raise ValueError(f"{name} exceeds safe top: {top:.2f} > {SAFE_TOP_Y:.2f}")
         if bottom < SAFE_BOTTOM_Y:
             raise ValueError(f"{name} exceeds safe bottom: {bottom:.2f} < {SAFE_BOTTOM_Y:.2f}")
 
     def assert_no_overlap(self, mobs: Sequence[Mobject], name: str = "group") -> None:
-        for i in range(len(mobs)):
-            for j in range(i + 1, len(mobs)):
-                a = mobs[i]
-                b = mobs[j]
-                if self._overlap(a, b):
-                    raise ValueError(f"{name} overlap detected between index {i} and {j}")
-
-    @staticmethod
-    def _overlap(a: Mobject, b: Mobject) -> bool:
-        ax1, ay1, _ = a.get_left()
-        ax2, ay2, _ = a.get_right()
-        at = a.get_top()[1]
-        ab = a.get_bottom()[1]
-
-        bx1, by1, _ = b.get_left()
-        bx2, by2, _ = b.get_right()
-        bt = b.get_top()[1]
-        bb = b.get_bottom()[1]
-
-        horiz = (ax1 <= bx2) and (ax2 >= bx1)
-        vert = (ab <= bt) and (at >= bb)
-        return horiz and vert
+        # 包围盒一次取成数组，排序扫描代替两两比较；闭区间判断，贴边也算重叠
+        pairs = sweep_overlaps(bounding_boxes(list(mobs)), inclusive=True)
+        if pairs:
+            i, j, _ = min(pairs)
+            raise ValueError(f"{name} overlap detected between index {i} and {j}")
 
 
 def formula_text(content: str, size: int = 34, color=IT_YELLOW) -> Text:
@@ -1,99 +1,26 @@
 ﻿from __future__ import annotations
 
 import argparse
-import json
 import os
-import re
 import sys
-from dataclasses import dataclass, asdict
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
 
 import cv2
 import numpy as np
 
+from ocr_cache import CachedOCR, OCRCache
+from pixel_stats import analyze_pixel_stats, collect_pixel_stats
+from qa_db import QADatabase
+from video_frames import iter_frames, probe_video
 
-EMOJI_RE = re.compile(
-    "["
-    "\U0001F300-\U0001F5FF"
-    "\U0001F600-\U0001F64F"
-    "\U0001F680-\U0001F6FF"
-    "\U0001F700-\U0001F77F"
-    "\U0001F780-\U0001F7FF"
-    "\U0001F800-\U0001F8FF"
-    "\U0001F900-\U0001F9FF"
-    "\U0001FA00-\U0001FAFF"
-    "\u2600-\u27BF"
-    "]+"
-)
+# 静态规则、采样帧模式需要从仓库根目录导入 scenes.templates
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
 
-
-@dataclass
-class CheckResult:
-    ok: bool
-    errors: List[str]
-    warnings: List[str]
-    details: Dict[str, Any]
-
-
-
-def _read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8")
-
-
-
-def check_static_rules(py_file: Path) -> CheckResult:
-    content = _read_text(py_file)
-    errors: List[str] = []
-    warnings: List[str] = []
-
-    if "import random" not in content:
-        errors.append("missing `import random`")
-
-    # 禁灰字: 信息文本不允许灰色
-    gray_text_patterns = [
-        r"Text\([^\n]*color\s*=\s*IT_GRAY",
-        r"Text\([^\n]*color\s*=\s*GRAY",
-        r"Text\([^\n]*color\s*=\s*DARK_GRAY",
-        r"Text\([^\n]*color\s*=\s*#6B7280",
-        r"Text\([^\n]*color\s*=\s*#333333",
-    ]
-    for p in gray_text_patterns:
-        if re.search(p, content):
-            errors.append(f"gray text detected by pattern: {p}")
-
-    # 禁emoji
-    if EMOJI_RE.search(content):
-        errors.append("emoji characters found in script")
-
-    # 底线检查
-    if re.search(r"DOWN\s*\*\s*4(\.0+)?", content):
-        errors.append("unsafe bottom placement: DOWN * 4")
-    if re.search(r"DOWN\s*\*\s*3\.[6-9]", content):
-        warnings.append("possible bottom-risk placement below DOWN * 3.5")
-
-    # 右侧绝对堆叠风险 (提示)
-    if re.search(r"Text\([^\n]*\)\.move_to\(RIGHT_ZONE\s*\+\s*(UP|DOWN)", content):
-        warnings.append("right-zone text uses absolute move_to; prefer arranged flow")
-
-    # 连续解释段时长风险
-    run_times = [float(v) for v in re.findall(r"run_time\s*=\s*([0-9]+(?:\.[0-9]+)?)", content)]
-    long_runs = [v for v in run_times if v > 12.0]
-    if long_runs:
-        errors.append(f"run_time > 12 found: {long_runs}")
-
-    waits = [float(v) for v in re.findall(r"self\.wait\(\s*([0-9]+(?:\.[0-9]+)?)\s*\)", content)]
-    long_waits = [v for v in waits if v > 4.0]
-    if long_waits:
-        warnings.append(f"self.wait > 4 found: {long_waits}")
-
-    details = {
-        "run_times_count": len(run_times),
-        "waits_count": len(waits),
-        "long_runs": long_runs,
-        "long_waits": long_waits,
-    }
-    return CheckResult(ok=len(errors) == 0, errors=errors, warnings=warnings, details=details)
+from scenes.templates.static_rules import CheckResult, check_script  # noqa: E402
 
 
 
@@ -127,6 +54,27 @@ def _find_video(ep: int, stage: str) -> Path | None:
 
 
 
+# 各阶段的渲染参数 (宽, 高, 帧率)，与 run_episode_pipeline 的 manim 参数一致
+STAGE_RENDER_SETTINGS = {
+    "preview": (854, 480, 15),
+    "final": (1920, 1080, 60),
+    "sampled": (854, 480, 15),
+}
+
+
+
+def _layout_export_path(ep: int, stage: str) -> Path:
+    root = Path("..") / "media" if (Path("..") / "media").exists() else Path("media")
+    return root / "layout" / f"information_theory_ep{ep:02d}_{stage}.npz"
+
+
+
+def _sampled_frames_dir(ep: int) -> Path:
+    root = Path("..") / "media" if (Path("..") / "media").exists() else Path("media")
+    return root / "qa_frames" / f"information_theory_ep{ep:02d}"
+
+
+
 def check_duration(video_path: Path, min_s: float = 60.0, max_s: float = 75.0) -> CheckResult:
     cap = cv2.VideoCapture(str(video_path))
     fps = cap.get(cv2.CAP_PROP_FPS) or 0
@@ -136,6 +84,21 @@ def check_duration(video_path: Path, min_s: float = 60.0, max_s: float = 75.0) -
     cap.release()
 
     duration = (frames / fps) if fps else 0.0
+    return _duration_result(duration, fps, frames, f"{int(w)}x{int(h)}", min_s, max_s)
+
+
+
+def check_timeline_duration(manifest: Dict[str, Any], min_s: float = 60.0, max_s: float = 75.0) -> CheckResult:
+    """采样帧模式：时长取自试运行的时间线，与成片帧数一致"""
+    fps = float(manifest.get("fps") or 0)
+    duration = float(manifest.get("duration") or 0)
+    w, h = manifest.get("resolution", [0, 0])
+    return _duration_result(duration, fps, round(duration * fps), f"{int(w)}x{int(h)}", min_s, max_s)
+
+
+
+def _duration_result(duration: float, fps: float, frames: float, resolution: str,
+                     min_s: float, max_s: float) -> CheckResult:
     errors: List[str] = []
     warnings: List[str] = []
 
@@ -148,12 +111,30 @@ def check_duration(video_path: Path, min_s: float = 60.0, max_s: float = 75.0) -
         "duration_sec": round(duration, 2),
         "fps": round(fps, 2),
         "frames": int(frames),
-        "resolution": f"{int(w)}x{int(h)}",
+        "resolution": resolution,
     }
     return CheckResult(ok=len(errors) == 0, errors=errors, warnings=warnings, details=details)
 
 
 
+def check_pixel_stats(video_path: Path) -> CheckResult:
+    """逐帧像素统计（低分辨率顺序解码全部帧）：黑场、闪烁报错，长静帧、安全区外墨迹提示"""
+    errors: List[str] = []
+    warnings: List[str] = []
+    details = analyze_pixel_stats(collect_pixel_stats(video_path))
+
+    if details["black_spans"]:
+        errors.append(f"black frames: {details['black_spans'][:5]}")
+    if details["flicker_spans"]:
+        errors.append(f"flicker: {details['flicker_spans'][:5]}")
+    if details["frozen_spans"]:
+        warnings.append(f"frozen spans: {details['frozen_spans'][:5]}")
+    if details["unsafe_ink_spans"]:
+        warnings.append(f"ink outside title-safe area: {details['unsafe_ink_spans'][:5]}")
+    return CheckResult(ok=len(errors) == 0, errors=errors, warnings=warnings, details=details)
+
+
+
 def _overlap_ratio(box1: Tuple[float, float, float, float], box2: Tuple[float, float, float, float]) -> float:
     x1 = max(box1[0], box2[0])
     y1 = max(box1[1], box2[1])
@@ -168,26 +149,135 @@ def _overlap_ratio(box1: Tuple[float, float, float, float], box2: Tuple[float, f
 
 
 
-def check_video_ocr_layout(video_path: Path, sample_frames: int = 12, conf_th: float = 0.35) -> CheckResult:
-    errors: List[str] = []
-    warnings: List[str] = []
-
+def _open_ocr(warnings: List[str], workers: int | None = None, expected_frames: int | None = None):
     try:
-        import easyocr  # type: ignore
+        from ocr_pool import open_ocr
+        return open_ocr(workers, expected_frames)
     except Exception as exc:  # pragma: no cover
         warnings.append(f"easyocr unavailable: {exc}")
-        return CheckResult(ok=True, errors=[], warnings=warnings, details={"skipped": True})
+        return None
 
-    reader = easyocr.Reader(["ch_sim", "en"], gpu=False)
 
-    cap = cv2.VideoCapture(str(video_path))
-    total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+class LazyOCR:
+    """多集共用的识别器：第一次有帧未命中缓存时才加载模型 / 起进程池，之后各集沿用，close() 时释放
+
+    文字布局走导出表、或采样帧全部命中缓存时，整次 QA 都不会加载 easyocr。
+    """
+
+    def __init__(self, workers: int | None = None, expected_frames: int | None = None):
+        self.workers = workers
+        self.expected_frames = expected_frames
+        self.ocr = None
+        self._tried = False
+        self._error: str | None = None
+
+    def open(self, warnings: List[str]):
+        if not self._tried:
+            self._tried = True
+            failed: List[str] = []
+            self.ocr = _open_ocr(failed, self.workers, self.expected_frames)
+            self._error = failed[0] if failed else None
+        if self.ocr is None and self._error:
+            warnings.append(self._error)
+        return self.ocr
+
+    def close(self) -> None:
+        if self.ocr is not None:
+            self.ocr.close()
+            self.ocr = None
+
+
+
+def check_video_ocr_layout(video_path: Path, sample_frames: int = 12, conf_th: float = 0.35,
+                           ocr=None, cache: OCRCache | None = None) -> CheckResult:
+    info = probe_video(video_path)
+    total = info.frames
+    h = info.height
     if total <= 0:
-        cap.release()
         return CheckResult(ok=False, errors=["video has no frames"], warnings=[], details={})
 
     idxs = np.linspace(0, max(total - 1, 1), sample_frames, dtype=int)
+    # 顺序解码一遍取出全部采样帧，不做逐帧 seek
+    return _run_ocr_layout(ocr, iter_frames(video_path, idxs), h, sample_frames, conf_th, cache)
+
+
+
+def check_frames_ocr_layout(frames_dir: Path, conf_th: float = 0.35, ocr=None,
+                            cache: OCRCache | None = None) -> CheckResult:
+    """采样帧模式：直接读取 frame_sampler 输出的 PNG，不解码视频"""
+    from scenes.templates.frame_sampler import load_manifest
+
+    manifest = load_manifest(frames_dir)
+    entries = manifest.get("frames", [])
+    if not entries:
+        return CheckResult(ok=False, errors=["no sampled frames"], warnings=[], details={})
+
+    def frames() -> Iterable[Tuple[int, np.ndarray]]:
+        for e in entries:
+            frame = cv2.imread(e["path"])
+            if frame is not None:
+                yield int(e["frame"]), frame
+
+    h = int(manifest["resolution"][1])
+    return _run_ocr_layout(ocr, frames(), h, len(entries), conf_th, cache)
+
+
+
+def _run_ocr_layout(ocr, frames: Iterable[Tuple[int, np.ndarray]], h: int,
+                    sample_frames: int, conf_th: float, cache: OCRCache | None = None) -> CheckResult:
+    """先查帧内容缓存，未命中的帧才交给识别器
+
+    ocr 为 None 时在第一次未命中时才临时起识别器，用完关闭；传入 LazyOCR 时同样按需打开，
+    但留给后续各集沿用；传入已打开的 OCRPool 则直接使用不关闭。cache 为 None 时使用默认磁盘缓存。
+    """
+    warnings: List[str] = []
+    owned_cache = cache is None
+    if owned_cache:
+        cache = OCRCache()
+    if isinstance(ocr, LazyOCR):
+        lazy = ocr
+        cached = CachedOCR(None, cache, opener=lambda: lazy.open(warnings), close_opened=False)
+    else:
+        cached = CachedOCR(ocr, cache, opener=lambda: _open_ocr(warnings))
+    hits_before, misses_before = cache.hits, cache.misses
+    try:
+        res = _ocr_layout_on_frames(cached, frames, h, sample_frames, conf_th)
+    finally:
+        cached.close()
+        if owned_cache:
+            cache.close()
+
+    if cached.unavailable:
+        return CheckResult(ok=True, errors=[], warnings=warnings, details={"skipped": True})
+    hits, misses = cache.hits - hits_before, cache.misses - misses_before
+    res.details["ocr_cache"] = {
+        "enabled": cache.enabled,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+    }
+    res.warnings.extend(warnings)
+    return res
+
+
+
+def _batched(frames: Iterable[Tuple[int, np.ndarray]], size: int) -> Iterable[List[Tuple[int, np.ndarray]]]:
+    batch: List[Tuple[int, np.ndarray]] = []
+    for item in frames:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+
+def _ocr_layout_on_frames(ocr, frames: Iterable[Tuple[int, np.ndarray]], h: int,
+                          sample_frames: int, conf_th: float, batch_size: int = 16) -> CheckResult:
+    errors: List[str] = []
+    warnings: List[str] = []
     top_margin = 20
     bottom_margin = 40
 
@@ -196,57 +286,15 @@ def check_video_ocr_layout(video_path: Path, sample_frames: int = 12, conf_th: f
     out_of_bounds = []
     overlaps = []
 
-    for idx in idxs:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, int(idx))
-        ok, frame = cap.read()
-        if not ok:
-            continue
-
-        # easyocr + OpenCV 在低分辨率帧上偶发崩溃，先放大可显著降低异常概率
-        scale = 2.0
-        proc_frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR)
-        try:
-            results = reader.readtext(proc_frame)
-        except Exception:
-            failed_ocr_frames.append(int(idx))
-            continue
-        boxes: List[Tuple[float, float, float, float, float, str]] = []
-
-        for r in results:
-            pts = np.array(r[0], dtype=float)
-            txt = str(r[1])
-            conf = float(r[2])
-            if conf < conf_th:
+    for batch in _batched(frames, batch_size):
+        batch_results = ocr.readtext_batch([frame for _, frame in batch])
+        for (idx, _), results in zip(batch, batch_results):
+            if results is None:
+                failed_ocr_frames.append(int(idx))
                 continue
-            x1, y1 = float(np.min(pts[:, 0]) / scale), float(np.min(pts[:, 1]) / scale)
-            x2, y2 = float(np.max(pts[:, 0]) / scale), float(np.max(pts[:, 1]) / scale)
-            boxes.append((x1, y1, x2, y2, conf, txt))
-
-        detected_count += len(boxes)
-
-        for b in boxes:
-            if b[1] < top_margin or b[3] > (h - bottom_margin):
-                out_of_bounds.append({
-                    "frame": int(idx),
-                    "box": [round(v, 1) for v in b[:4]],
-                    "text": b[5],
-                    "conf": round(b[4], 2),
-                })
-
-        for i in range(len(boxes)):
-            for j in range(i + 1, len(boxes)):
-                a = boxes[i]
-                b = boxes[j]
-                ratio = _overlap_ratio(a[:4], b[:4])
-                if ratio > 0.25:
-                    overlaps.append({
-                        "frame": int(idx),
-                        "ratio": round(ratio, 2),
-                        "text_a": a[5],
-                        "text_b": b[5],
-                    })
-
-    cap.release()
+            boxes = _filter_boxes(results, conf_th)
+            detected_count += len(boxes)
+            _collect_layout_issues(int(idx), boxes, h, top_margin, bottom_margin, out_of_bounds, overlaps)
 
     if out_of_bounds:
         errors.append(f"OCR out-of-bounds boxes: {len(out_of_bounds)}")
@@ -268,45 +316,165 @@ def check_video_ocr_layout(video_path: Path, sample_frames: int = 12, conf_th: f
 
 
 
-def check_rhythm_proxy(py_file: Path) -> CheckResult:
-    content = _read_text(py_file)
-    errors: List[str] = []
+def _filter_boxes(results, conf_th: float) -> List[Tuple[float, float, float, float, float, str]]:
+    boxes: List[Tuple[float, float, float, float, float, str]] = []
+    for r in results:
+        pts = np.array(r[0], dtype=float)
+        txt = str(r[1])
+        conf = float(r[2])
+        if conf < conf_th:
+            continue
+        x1, y1 = float(np.min(pts[:, 0])), float(np.min(pts[:, 1]))
+        x2, y2 = float(np.max(pts[:, 0])), float(np.max(pts[:, 1]))
+        boxes.append((x1, y1, x2, y2, conf, txt))
+    return boxes
+
+
+
+def _collect_layout_issues(idx: int, boxes, h: int, top_margin: int, bottom_margin: int,
+                           out_of_bounds: List[Dict[str, Any]], overlaps: List[Dict[str, Any]]) -> None:
+    for b in boxes:
+        if b[1] < top_margin or b[3] > (h - bottom_margin):
+            out_of_bounds.append({
+                "frame": idx,
+                "box": [round(v, 1) for v in b[:4]],
+                "text": b[5],
+                "conf": round(b[4], 2),
+            })
+
+    for i in range(len(boxes)):
+        for j in range(i + 1, len(boxes)):
+            a = boxes[i]
+            b = boxes[j]
+            ratio = _overlap_ratio(a[:4], b[:4])
+            if ratio > 0.25:
+                overlaps.append({
+                    "frame": idx,
+                    "ratio": round(ratio, 2),
+                    "text_a": a[5],
+                    "text_b": b[5],
+                })
+
+
+
+def check_scene_layout(py_file: Path, scene_name: str, export_path: Path | None = None,
+                       stage: str = "preview") -> CheckResult:
+    """跳过模式试运行，每次 play 结束时检查文字重叠与安全区（不渲染、不依赖视频）
+
+    给定 export_path 时同一趟试运行顺带导出文字布局表，供 check_export_layout 使用。
+    """
     warnings: List[str] = []
+    try:
+        from scenes.templates.layout_check import LayoutValidatorMixin, validate_scene
+        from scenes.templates.layout_export import export_scene_layout
+    except Exception as exc:  # pragma: no cover
+        warnings.append(f"layout validator unavailable: {exc}")
+        return CheckResult(ok=True, errors=[], warnings=warnings, details={"skipped": True})
 
-    # 钩子代理: 前 6 秒至少有一条问题句
-    head = "\n".join(content.splitlines()[:120])
-    if not re.search(r"[？?]", head):
-        warnings.append("no question mark found near script header; hook may be weak")
+    try:
+        if export_path is None:
+            report = validate_scene(py_file, scene_name)
+        else:
+            w, h, fps = STAGE_RENDER_SETTINGS[stage]
+            scene = export_scene_layout(py_file, scene_name, export_path, resolution=(w, h), fps=fps,
+                                        mixins=(LayoutValidatorMixin,))
+            report = scene.layout_report()
+    except Exception as exc:
+        # 场景本身跑不通是错误，不能当作"跳过"放行
+        error = f"layout dry run failed: {type(exc).__name__}: {exc}"
+        return CheckResult(ok=False, errors=[error], warnings=warnings, details={"failed": True})
 
-    # 预告时长代理: 预告段 run_time 过长预警
-    if "下期预告" in content:
-        preview_block = content.split("下期预告", 1)[-1]
-        rt = [float(v) for v in re.findall(r"run_time\s*=\s*([0-9]+(?:\.[0-9]+)?)", preview_block)]
-        if sum(rt) > 8:
-            warnings.append(f"preview runtime sum seems long: {sum(rt):.2f}s")
+    errors: List[str] = []
+    if report["overlaps"]:
+        errors.append(f"layout overlapping text: {report['overlaps']}")
+    if report["safe_area"]:
+        errors.append(f"layout text outside safe area: {report['safe_area']}")
 
-    return CheckResult(ok=len(errors) == 0, errors=errors, warnings=warnings, details={})
+    details = {
+        "timeline_sec": report["duration"],
+        "overlaps": report["overlaps"],
+        "safe_area": report["safe_area"],
+        "issue_samples": report["issues"][:20],
+    }
+    return CheckResult(ok=len(errors) == 0, errors=errors, warnings=warnings, details=details)
+
+
+
+def check_export_layout(export_path: Path) -> CheckResult:
+    """用导出的文字布局表做与 OCR 相同的越界 / 重叠检查，毫秒级，不读视频"""
+    from scenes.templates.layout_table import check_layout_table, load_layout_table
+
+    errors: List[str] = []
+    warnings: List[str] = []
+    table = load_layout_table(export_path)
+    found = check_layout_table(table, top_margin=20, bottom_margin=40, overlap_th=0.25)
+    out_of_bounds = found["out_of_bounds"]
+    overlaps = found["overlaps"]
 
+    if out_of_bounds:
+        errors.append(f"text out-of-bounds boxes: {len(out_of_bounds)}")
+    if overlaps:
+        errors.append(f"text overlapping boxes: {len(overlaps)}")
+    if len(table["text"]) == 0:
+        warnings.append("layout export has zero text boxes; review manually")
+
+    details = {
+        "source": "layout_export",
+        "export": str(export_path),
+        "snapshots": int(len(set(table["play"].tolist()))),
+        "detected_boxes": int(len(table["text"])),
+        "out_of_bounds_samples": out_of_bounds[:20],
+        "overlap_samples": overlaps[:20],
+    }
+    return CheckResult(ok=len(errors) == 0, errors=errors, warnings=warnings, details=details)
 
 
-def run_qa(ep: int, stage: str, sample_frames: int) -> Dict[str, Any]:
+
+def run_qa(ep: int, stage: str, sample_frames: int, ocr=None, cache: OCRCache | None = None,
+           force_ocr: bool = False) -> Dict[str, Any]:
     ep2 = f"{ep:02d}"
     py_file = Path(f"information_theory_ep{ep2}.py")
     if not py_file.exists():
         raise FileNotFoundError(f"missing script: {py_file}")
 
-    static_res = check_static_rules(py_file)
-    rhythm_res = check_rhythm_proxy(py_file)
-
-    video = _find_video(ep, stage)
-    if video is None:
-        raise FileNotFoundError(f"video not found for ep{ep2} stage={stage}")
-
-    dur_res = check_duration(video)
-    ocr_res = check_video_ocr_layout(video, sample_frames=sample_frames)
-
-    all_errors = static_res.errors + rhythm_res.errors + dur_res.errors + ocr_res.errors
-    all_warnings = static_res.warnings + rhythm_res.warnings + dur_res.warnings + ocr_res.warnings
+    static_res, rhythm_res = check_script(py_file)
+
+    # 一趟跳过模式试运行：布局校验 + 导出文字布局表；导出成功则不再 OCR
+    export_path = _layout_export_path(ep, stage)
+    layout_res = check_scene_layout(py_file, f"InformationTheoryEP{ep2}", export_path=export_path, stage=stage)
+    dry_run_ok = not (layout_res.details.get("skipped") or layout_res.details.get("failed"))
+    use_export = not force_ocr and dry_run_ok and export_path.exists()
+
+    pixel_res = None
+    if stage == "sampled":
+        # 不编码视频：跳过模式跑时间线，只光栅化采样时刻的画面
+        from scenes.templates.frame_sampler import render_sample_frames
+
+        video = _sampled_frames_dir(ep)
+        manifest = render_sample_frames(py_file, f"InformationTheoryEP{ep2}", out_dir=video,
+                                        count=sample_frames, quality="low")
+        dur_res = check_timeline_duration(manifest)
+        if use_export:
+            ocr_res = check_export_layout(export_path)
+        else:
+            ocr_res = check_frames_ocr_layout(video, ocr=ocr, cache=cache)
+    else:
+        video = _find_video(ep, stage)
+        if video is None:
+            raise FileNotFoundError(f"video not found for ep{ep2} stage={stage}")
+
+        dur_res = check_duration(video)
+        pixel_res = check_pixel_stats(video)
+        if use_export:
+            ocr_res = check_export_layout(export_path)
+        else:
+            ocr_res = check_video_ocr_layout(video, sample_frames=sample_frames, ocr=ocr, cache=cache)
+
+    results = [static_res, rhythm_res, dur_res, layout_res, ocr_res]
+    if pixel_res is not None:
+        results.append(pixel_res)
+    all_errors = [e for r in results for e in r.errors]
+    all_warnings = [w for r in results for w in r.warnings]
 
     report = {
         "ep": ep,
@@ -320,45 +488,80 @@ def run_qa(ep: int, stage: str, sample_frames: int) -> Dict[str, Any]:
             "static": asdict(static_res),
             "rhythm_proxy": asdict(rhythm_res),
             "duration": asdict(dur_res),
+            "layout": asdict(layout_res),
             "ocr_layout": asdict(ocr_res),
         },
     }
+    if pixel_res is not None:
+        report["checks"]["pixel_stats"] = asdict(pixel_res)
     return report
 
 
 
-def save_report(report: Dict[str, Any]) -> Path:
-    ep2 = f"{report['ep']:02d}"
-    out_dir = Path("qa_reports")
-    out_dir.mkdir(parents=True, exist_ok=True)
-    out_path = out_dir / f"ep{ep2}_report.json"
-
-    if out_path.exists():
-        try:
-            existing = json.loads(out_path.read_text(encoding="utf-8"))
-        except Exception:
-            existing = {}
-    else:
-        existing = {}
-
-    existing[report["stage"]] = report
-    out_path.write_text(json.dumps(existing, ensure_ascii=False, indent=2), encoding="utf-8")
-    return out_path
+def save_report(report: Dict[str, Any], db: QADatabase | None = None) -> Path:
+    """写入 QA 结果库（一个事务），再从库里重新生成该集的 epNN_report.json"""
+    owned = db is None
+    if owned:
+        db = QADatabase()
+    try:
+        db.adopt_legacy_json(report["ep"])
+        db.record(report)
+        return db.export_json(report["ep"])
+    finally:
+        if owned:
+            db.close()
 
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="信息论单集 QA")
-    parser.add_argument("--ep", type=int, required=True, help="episode number, e.g. 13")
-    parser.add_argument("--stage", choices=["preview", "final"], required=True)
+    parser.add_argument("--ep", type=int, nargs="+", required=True,
+                        help="episode number(s), e.g. 13 or 13 14 15; OCR models load once for all")
+    parser.add_argument("--stage", choices=["preview", "final", "sampled"], required=True,
+                        help="sampled: render only the sampled frames, no video encode")
     parser.add_argument("--sample-frames", type=int, default=10)
+    parser.add_argument("--ocr-workers", type=int, default=None,
+                        help="OCR worker processes (default: one per 32 sampled frames, at most half "
+                             "the CPU cores; 1 = in-process)")
+    parser.add_argument("--ocr-cache-mb", type=float, default=256,
+                        help="size bound of the per-frame OCR result cache; 0 disables it")
+    parser.add_argument("--ocr-phash-distance", type=int, default=None,
+                        help="also reuse cached OCR boxes of perceptually similar frames (dHash Hamming "
+                             "distance); off by default because small text edits keep the same hash")
+    parser.add_argument("--ocr", action="store_true",
+                        help="check text layout by OCR on video frames even when a layout export is available")
     args = parser.parse_args()
 
-    report = run_qa(args.ep, args.stage, sample_frames=args.sample_frames)
-    out_path = save_report(report)
+    cache = (OCRCache(max_mb=args.ocr_cache_mb, phash_distance=args.ocr_phash_distance)
+             if args.ocr_cache_mb > 0 else OCRCache.disabled())
+    # 不在这里加载模型：第一次真正需要识别时才打开，之后各集共用
+    ocr = LazyOCR(workers=args.ocr_workers, expected_frames=len(args.ep) * args.sample_frames)
+
+    db = QADatabase()
+    all_ok = True
+    try:
+        for ep in args.ep:
+            report = run_qa(ep, args.stage, sample_frames=args.sample_frames, ocr=ocr, cache=cache,
+                            force_ocr=args.ocr)
+            out_path = save_report(report, db)
+            all_ok = all_ok and report["ok"]
+            _print_report(report, out_path)
+    finally:
+        ocr.close()
+        cache.close()
+        db.close()
+
+    return 0 if all_ok else 1
 
-    print(f"[QA] EP{args.ep:02d} stage={args.stage} ok={report['ok']}")
+
+
+def _print_report(report: Dict[str, Any], out_path: Path) -> None:
+    print(f"[QA] EP{report['ep']:02d} stage={report['stage']} ok={report['ok']}")
     print(f"[QA] report: {out_path}")
+    ocr_cache = report["checks"]["ocr_layout"]["details"].get("ocr_cache")
+    if ocr_cache and ocr_cache["enabled"]:
+        print(f"[QA] OCR cache: {ocr_cache['hits']} hits / {ocr_cache['misses']} misses "
+              f"(hit rate {ocr_cache['hit_rate']:.0%})")
 
     if report["errors"]:
         print("[QA] errors:")
@@ -369,8 +572,6 @@ def main() -> int:
         for w in report["warnings"]:
             print(f"  - {w}")
 
-    return 0 if report["ok"] else 1
-
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from ocr_pool import OCR_LANGS, OCR_SCALE, OCRBox
+
+
+DEFAULT_CACHE_PATH = Path("qa_cache") / "ocr_cache.sqlite"
+DEFAULT_MAX_MB = 256
+
+# 感知哈希边长：16 → 256 位 dHash，片头、静态面板、长 wait 之间的编码噪声不会改变它
+PHASH_SIZE = 16
+
+
+
+def exact_hash(frame: np.ndarray) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    h.update(str(frame.shape).encode())
+    h.update(np.ascontiguousarray(frame).tobytes())
+    return h.hexdigest()
+
+
+
+def perceptual_hash(frame: np.ndarray, size: int = PHASH_SIZE) -> str:
+    """dHash：缩成 (size+1)×size 灰度图，比较水平相邻像素的明暗"""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    small = cv2.resize(gray, (size + 1, size), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return np.packbits(bits).tobytes().hex()
+
+
+
+def _hamming(a: str, b: str) -> int:
+    x = np.frombuffer(bytes.fromhex(a), dtype=np.uint8) ^ np.frombuffer(bytes.fromhex(b), dtype=np.uint8)
+    return int(np.unpackbits(x).sum())
+
+
+
+def ocr_config_key(langs: Sequence[str] = OCR_LANGS, scale: float = OCR_SCALE) -> str:
+    """识别配置变了（语言、放大倍数、easyocr 版本）缓存就失效"""
+    try:
+        import easyocr  # type: ignore
+        version = getattr(easyocr, "__version__", "?")
+    except Exception:
+        version = "?"
+    raw = json.dumps({"langs": list(langs), "scale": scale, "easyocr": version}, sort_keys=True)
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+
+
+class OCRCache:
+    """按帧内容缓存 OCR 结果（SQLite 单文件，总大小超限时按最久未用淘汰）
+
+    默认只按精确哈希命中。感知哈希匹配需显式开启（phash_distance 为允许的汉明距离，0 表示完全相同）：
+    dHash 对小字号文字的改动不敏感，改了一个数字的帧也会拿到旧的识别框，只适合反复跑同一版画面时提速。
+    """
+
+    def __init__(self, path: Optional[Path] = DEFAULT_CACHE_PATH, max_mb: float = DEFAULT_MAX_MB,
+                 config_key: Optional[str] = None, phash_distance: Optional[int] = None):
+        self.path = Path(path) if path is not None else None
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.config_key = config_key or ocr_config_key()
+        self.phash_distance = phash_distance
+        self.hits = 0
+        self.perceptual_hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.path is not None and self.max_bytes > 0:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=30)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_cache ("
+                " exact TEXT NOT NULL, config TEXT NOT NULL, phash TEXT NOT NULL, shape TEXT NOT NULL,"
+                " result TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL,"
+                " PRIMARY KEY (exact, config))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ocr_cache_phash ON ocr_cache (config, shape, phash)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ocr_cache_lru ON ocr_cache (last_used)")
+            self._conn.commit()
+
+    @classmethod
+    def disabled(cls) -> "OCRCache":
+        return cls(path=None)
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def keys(self, frame: np.ndarray) -> Tuple[str, str, str]:
+        return exact_hash(frame), perceptual_hash(frame), "x".join(str(v) for v in frame.shape)
+
+    def get(self, keys: Tuple[str, str, str]) -> Optional[List[OCRBox]]:
+        if not self.enabled:
+            self.misses += 1
+            return None
+        exact, phash, shape = keys
+        row = self._conn.execute(
+            "SELECT result FROM ocr_cache WHERE exact = ? AND config = ?", (exact, self.config_key)
+        ).fetchone()
+        if row is not None:
+            self.hits += 1
+            self._touch("exact = ?", exact)
+            return _decode(row[0])
+
+        row = self._perceptual_lookup(phash, shape) if self.phash_distance is not None else None
+        if row is not None:
+            self.hits += 1
+            self.perceptual_hits += 1
+            self._touch("exact = ?", row[0])
+            return _decode(row[1])
+
+        self.misses += 1
+        return None
+
+    def _perceptual_lookup(self, phash: str, shape: str):
+        if self.phash_distance <= 0:
+            return self._conn.execute(
+                "SELECT exact, result FROM ocr_cache WHERE config = ? AND shape = ? AND phash = ? LIMIT 1",
+                (self.config_key, shape, phash),
+            ).fetchone()
+        best = None
+        for exact, other, result in self._conn.execute(
+            "SELECT exact, phash, result FROM ocr_cache WHERE config = ? AND shape = ?", (self.config_key, shape)
+        ):
+            d = _hamming(phash, other)
+            if d <= self.phash_distance and (best is None or d < best[0]):
+                best = (d, exact, result)
+        return None if best is None else best[1:]
+
+    def put(self, keys: Tuple[str, str, str], result: List[OCRBox]) -> None:
+        if not self.enabled:
+            return
+        exact, phash, shape = keys
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ocr_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (exact, self.config_key, phash, shape, payload, len(payload), time.time()),
+            )
+        self._evict()
+
+    def _touch(self, where: str, value: str) -> None:
+        with self._conn:
+            self._conn.execute(f"UPDATE ocr_cache SET last_used = ? WHERE {where}", (time.time(), value))
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # 一次删到上限的 90%，避免每次写入都触发淘汰
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        doomed = []
+        for exact, config, size in self._conn.execute(
+            "SELECT exact, config, size FROM ocr_cache ORDER BY last_used ASC"
+        ):
+            doomed.append((exact, config))
+            freed += size
+            if freed >= target:
+                break
+        with self._conn:
+            self._conn.executemany("DELETE FROM ocr_cache WHERE exact = ? AND config = ?", doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "perceptual_hits": self.perceptual_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+
+def _decode(payload: str) -> List[OCRBox]:
+    return [(pts, txt, conf) for pts, txt, conf in json.loads(payload)]
+
+
+
+class CachedOCR:
+    """在识别器前加一层缓存：命中的帧直接返回，未命中的整批交给识别器
+
+    opener 用于按需创建识别器：全部命中时根本不加载模型。
+    close_opened=False 表示 opener 返回的是别处共用的识别器（如 it_qa 的 LazyOCR），这里用完不关。
+    """
+
+    def __init__(self, ocr, cache: OCRCache, opener: Optional[Callable[[], Any]] = None,
+                 close_opened: bool = True):
+        self.ocr = ocr
+        self.cache = cache
+        self.opener = opener
+        self.close_opened = close_opened
+        self.unavailable = False
+        self._opened = False
+
+    def readtext_batch(self, frames: Sequence[np.ndarray]) -> List[Optional[List[OCRBox]]]:
+        keys = [self.cache.keys(f) for f in frames]
+        out: List[Optional[List[OCRBox]]] = [self.cache.get(k) for k in keys]
+        todo = [i for i, r in enumerate(out) if r is None]
+        if not todo:
+            return out
+
+        if self.ocr is None and self.opener is not None and not self._opened:
+            self._opened = True
+            self.ocr = self.opener()
+        if self.ocr is None:
+            self.unavailable = True
+            return out
+
+        fresh = self.ocr.readtext_batch([frames[i] for i in todo])
+        for i, result in zip(todo, fresh):
+            out[i] = result
+            if result is not None:
+                self.cache.put(keys[i], result)
+        return out
+
+    def close(self) -> None:
+        """只关闭由 opener 创建的识别器，外部传入的共享识别器由调用方管理"""
+        if self._opened and self.close_opened and self.ocr is not None:
+            self.ocr.close()
+        if self._opened:
+            self.ocr = None
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+# 一条识别结果: (四点框[原图坐标], 文本, 置信度)
+OCRBox = Tuple[List[List[float]], str, float]
+
+OCR_LANGS = ("ch_sim", "en")
+
+# easyocr + OpenCV 在低分辨率帧上偶发崩溃，先放大可显著降低异常概率
+OCR_SCALE = 2.0
+
+# 每个工作进程要先花十几秒加载模型；分到的帧太少时多开进程只是白白加载
+FRAMES_PER_WORKER = 32
+
+_WORKER_READER = None
+
+
+
+def _make_reader(langs: Sequence[str]):
+    import easyocr  # type: ignore
+
+    return easyocr.Reader(list(langs), gpu=False, verbose=False)
+
+
+
+def _init_worker(langs: Sequence[str], threads: int) -> None:
+    """每个工作进程只加载一次模型，之后处理所有批次"""
+    global _WORKER_READER
+    try:
+        import torch  # type: ignore
+
+        torch.set_num_threads(max(1, threads))
+    except Exception:
+        pass
+    cv2.setNumThreads(1)
+    _WORKER_READER = _make_reader(langs)
+
+
+
+def _readtext_frames(reader, frames: Sequence[np.ndarray], scale: float) -> List[Optional[List[OCRBox]]]:
+    """识别一批同尺寸帧；整批失败时逐帧重试，单帧失败返回 None"""
+    procs = [cv2.resize(f, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR) for f in frames]
+    try:
+        raw = reader.readtext_batched(procs, batch_size=len(procs)) if len(procs) > 1 else [reader.readtext(procs[0])]
+    except Exception:
+        raw = []
+        for p in procs:
+            try:
+                raw.append(reader.readtext(p))
+            except Exception:
+                raw.append(None)
+
+    out: List[Optional[List[OCRBox]]] = []
+    for results in raw:
+        if results is None:
+            out.append(None)
+            continue
+        boxes = []
+        for r in results:
+            pts = (np.array(r[0], dtype=float) / scale).tolist()
+            boxes.append((pts, str(r[1]), float(r[2])))
+        out.append(boxes)
+    return out
+
+
+
+def _worker_batch(frames: Sequence[np.ndarray], scale: float) -> List[Optional[List[OCRBox]]]:
+    return _readtext_frames(_WORKER_READER, frames, scale)
+
+
+
+class LocalOCR:
+    """进程内识别：单核机器或调试时使用，接口与 OCRPool 相同"""
+
+    def __init__(self, langs: Sequence[str] = OCR_LANGS, scale: float = OCR_SCALE):
+        self.scale = scale
+        self.reader = _make_reader(langs)
+
+    def readtext_batch(self, frames: Sequence[np.ndarray]) -> List[Optional[List[OCRBox]]]:
+        if not frames:
+            return []
+        return _readtext_frames(self.reader, list(frames), self.scale)
+
+    def close(self) -> None:
+        self.reader = None
+
+    def __enter__(self) -> "LocalOCR":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+
+class OCRPool:
+    """常驻 OCR 进程池：模型在每个工作进程里只加载一次，可连续处理多集的帧
+
+    with OCRPool(workers=4) as ocr:
+        for ep in range(13, 21):
+            run_qa(ep, "final", 12, ocr=ocr)
+    """
+
+    def __init__(self, workers: Optional[int] = None, langs: Sequence[str] = OCR_LANGS, scale: float = OCR_SCALE):
+        cpus = os.cpu_count() or 1
+        self.workers = max(1, workers or max(1, cpus // 2))
+        self.scale = scale
+        threads = max(1, cpus // self.workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(tuple(langs), threads),
+        )
+
+    def readtext_batch(self, frames: Sequence[np.ndarray]) -> List[Optional[List[OCRBox]]]:
+        """把一批帧平均分给各工作进程，结果按输入顺序返回"""
+        frames = list(frames)
+        if not frames:
+            return []
+        chunk = math.ceil(len(frames) / self.workers)
+        futures = [
+            self._executor.submit(_worker_batch, frames[i:i + chunk], self.scale)
+            for i in range(0, len(frames), chunk)
+        ]
+        out: List[Optional[List[OCRBox]]] = []
+        for fut in futures:
+            try:
+                out.extend(fut.result())
+            except Exception:
+                # 工作进程崩溃时这一块全部记为识别失败，不拖垮整次 QA
+                n = min(chunk, len(frames) - len(out))
+                out.extend([None] * n)
+        return out
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "OCRPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+
+def open_ocr(workers: Optional[int] = None, expected_frames: Optional[int] = None):
+    """workers=1 时进程内识别，否则启动进程池；easyocr 不可用时抛出 ImportError
+
+    未指定 workers 时按预计帧数定进程数：每 FRAMES_PER_WORKER 帧一个进程，
+    几集的采样帧加起来不到这个数就直接进程内识别，不再为十几帧起一池进程。
+    """
+    import easyocr  # type: ignore  # noqa: F401
+
+    if workers is None and expected_frames is not None:
+        cpus = os.cpu_count() or 1
+        workers = max(1, min(cpus // 2, math.ceil(expected_frames / FRAMES_PER_WORKER)))
+    if workers == 1:
+        return LocalOCR()
+    return OCRPool(workers=workers)
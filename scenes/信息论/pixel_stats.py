@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from video_frames import iter_frames, probe_video
+
+
+# 逐帧统计的分辨率：安全区边距按比例算，180 像素高足够
+STATS_HEIGHT = 180
+
+# 字幕安全区（title-safe）：四边各 5%
+TITLE_SAFE = 0.05
+
+# 阈值（8 位亮度 / 像素差）
+BLACK_LUMA = 8.0
+# 黑场还要求几乎没有墨迹（占比低于此值）：纯黑底上的标题卡平均亮度同样很低，不能只看平均亮度
+BLACK_INK = 1e-4
+FROZEN_DELTA = 0.15
+INK_DELTA = 24
+FLICKER_LUMA = 12.0
+
+# 颜色量化：每通道 4 位 → 4096 个桶
+_QBITS = 4
+_QBINS = 1 << (3 * _QBITS)
+
+
+
+@dataclass
+class PixelStats:
+    """逐帧统计（长度均为帧数）与全片主色"""
+    fps: float
+    width: int
+    height: int
+    luma: np.ndarray
+    delta: np.ndarray
+    ink_safe: np.ndarray
+    ink_unsafe: np.ndarray
+    background: np.ndarray
+    color_hist: np.ndarray = field(repr=False)
+
+    @property
+    def frames(self) -> int:
+        return len(self.luma)
+
+    def dominant_colors(self, k: int = 5) -> List[Dict[str, Any]]:
+        """非背景像素中占比最高的 k 个颜色（量化桶中心，#RRGGBB）"""
+        total = float(self.color_hist.sum())
+        if total <= 0:
+            return []
+        top = np.argsort(self.color_hist)[::-1][:k]
+        return [
+            {"color": _bin_to_hex(int(i)), "share": round(float(self.color_hist[i]) / total, 4)}
+            for i in top if self.color_hist[i] > 0
+        ]
+
+
+
+def _bin_to_hex(i: int) -> str:
+    step = 1 << (8 - _QBITS)
+    b, g, r = (i >> (2 * _QBITS)) & 0xF, (i >> _QBITS) & 0xF, i & 0xF
+    return "#{:02X}{:02X}{:02X}".format(*(v * step + step // 2 for v in (r, g, b)))
+
+
+
+def _color_bins(pixels: np.ndarray) -> np.ndarray:
+    """BGR 像素（任意前导形状）→ 量化颜色桶号"""
+    q = (pixels >> (8 - _QBITS)).astype(np.int32)
+    return (q[..., 0] << (2 * _QBITS)) | (q[..., 1] << _QBITS) | q[..., 2]
+
+
+
+def _safe_mask(h: int, w: int, margin: float) -> np.ndarray:
+    mask = np.zeros((h, w), dtype=bool)
+    my, mx = int(round(h * margin)), int(round(w * margin))
+    mask[my:h - my, mx:w - mx] = True
+    return mask
+
+
+
+def _batched(frames: Iterable[Tuple[int, np.ndarray]], size: int) -> Iterable[np.ndarray]:
+    batch: List[np.ndarray] = []
+    for _, frame in frames:
+        batch.append(frame)
+        if len(batch) == size:
+            yield np.stack(batch)
+            batch = []
+    if batch:
+        yield np.stack(batch)
+
+
+
+def collect_pixel_stats(video_path: Path, height: int = STATS_HEIGHT, margin: float = TITLE_SAFE,
+                        backend: Optional[str] = None, batch_size: int = 64) -> PixelStats:
+    """低分辨率顺序解码每一帧，按批向量化计算逐帧统计
+
+    背景色取每帧出现最多的量化颜色，亮度与之相差超过 INK_DELTA 的像素算作"墨迹"。
+    """
+    backend = backend or ("ffmpeg" if shutil.which("ffmpeg") else "opencv")
+    info = probe_video(video_path)
+
+    luma: List[np.ndarray] = []
+    delta: List[np.ndarray] = []
+    ink_safe: List[np.ndarray] = []
+    ink_unsafe: List[np.ndarray] = []
+    background: List[np.ndarray] = []
+    color_hist = np.zeros(_QBINS, dtype=np.int64)
+    safe = None
+    prev_gray = None
+
+    for batch in _batched(iter_frames(video_path, height=height, backend=backend), batch_size):
+        n, h, w, _ = batch.shape
+        if safe is None:
+            safe = _safe_mask(h, w, margin)
+            unsafe = ~safe
+            n_safe, n_unsafe = max(int(safe.sum()), 1), max(int(unsafe.sum()), 1)
+
+        # 亮度与帧间差都在 uint8 上由 OpenCV 计算，避免整批转成浮点
+        gray = np.stack([cv2.cvtColor(f, cv2.COLOR_BGR2GRAY) for f in batch])
+        luma.append(gray.reshape(n, -1).mean(axis=1))
+        prev = gray[0] if prev_gray is None else prev_gray
+        shifted = np.concatenate([prev[None], gray[:-1]])
+        delta.append(np.array([cv2.absdiff(a, b).mean() for a, b in zip(gray, shifted)]))
+        prev_gray = gray[-1]
+
+        # 每帧众数颜色作背景：隔 4 像素抽样，帧号偏移后一次 bincount 得到 (n, 4096) 直方图
+        offsets = (np.arange(n, dtype=np.int64) * _QBINS)[:, None, None]
+        hist = np.bincount((_color_bins(batch[:, ::4, ::4]) + offsets).ravel(),
+                           minlength=n * _QBINS).reshape(n, _QBINS)
+        bg_bin = hist.argmax(axis=1)
+        bg = np.stack([(bg_bin >> (2 * _QBITS)) & 0xF, (bg_bin >> _QBITS) & 0xF, bg_bin & 0xF], axis=1)
+        bg = bg * (1 << (8 - _QBITS)) + (1 << (7 - _QBITS))
+        background.append(bg)
+
+        # 墨迹按亮度判断（逐通道比较慢 5 倍，讲解画面里与背景同亮度的彩色元素很少）
+        bg_luma = (bg[:, 2] * 0.299 + bg[:, 1] * 0.587 + bg[:, 0] * 0.114).astype(np.int16)
+        ink = np.abs(gray.astype(np.int16) - bg_luma[:, None, None]) > INK_DELTA
+        ink_safe.append(ink[:, safe].sum(axis=1) / n_safe)
+        ink_unsafe.append(ink[:, unsafe].sum(axis=1) / n_unsafe)
+
+        color_hist += np.bincount(_color_bins(batch[ink]), minlength=_QBINS)
+
+    if not luma:
+        raise ValueError(f"no frames decoded from {video_path}")
+    return PixelStats(
+        fps=info.fps,
+        width=info.width,
+        height=info.height,
+        luma=np.concatenate(luma),
+        delta=np.concatenate(delta),
+        ink_safe=np.concatenate(ink_safe),
+        ink_unsafe=np.concatenate(ink_unsafe),
+        background=np.concatenate(background),
+        color_hist=color_hist,
+    )
+
+
+
+def spans(mask: np.ndarray, fps: float, min_sec: float) -> List[Tuple[float, float]]:
+    """mask 中连续为真且不短于 min_sec 的区间，单位秒"""
+    m = np.concatenate([[False], mask.astype(bool), [False]])
+    edges = np.flatnonzero(np.diff(m.astype(np.int8)))
+    out = []
+    for start, end in zip(edges[::2], edges[1::2]):
+        if (end - start) / fps >= min_sec:
+            out.append((round(start / fps, 2), round(end / fps, 2)))
+    return out
+
+
+
+def flicker_spans(luma: np.ndarray, fps: float, threshold: float = FLICKER_LUMA,
+                  window_sec: float = 0.5, min_reversals: int = 3) -> List[Tuple[float, float]]:
+    """亮度来回跳变：窗口内方向相反的大幅跳变次数达到 min_reversals"""
+    d = np.diff(luma)
+    nz = np.flatnonzero(np.abs(d) > threshold)
+    win = max(1, int(round(window_sec * fps)))
+    reversal = np.zeros(len(luma), dtype=bool)
+    if len(nz) > 1:
+        # 相邻两次大跳变方向相反、且相距不超过窗口，记一次反转
+        sign = np.sign(d[nz])
+        hit = (sign[1:] != sign[:-1]) & (np.diff(nz) <= win)
+        reversal[nz[1:][hit] + 1] = True
+    counts = np.convolve(reversal.astype(np.int32), np.ones(win, dtype=np.int32), mode="same")
+    return spans(counts >= min_reversals, fps, 0.0)
+
+
+
+def analyze_pixel_stats(stats: PixelStats, black_min_sec: float = 0.5, frozen_min_sec: float = 10.0,
+                        unsafe_ink: float = 0.01, unsafe_min_sec: float = 0.5,
+                        edge_sec: float = 0.3) -> Dict[str, Any]:
+    """由逐帧统计得出问题区间；片头片尾 edge_sec 内的黑场 / 静帧（淡入淡出）不算"""
+    fps = stats.fps or 1.0
+    n = stats.frames
+    body = np.ones(n, dtype=bool)
+    edge = int(round(edge_sec * fps))
+    if edge:
+        body[:edge] = False
+        body[max(0, n - edge):] = False
+
+    blank = (stats.ink_safe + stats.ink_unsafe) < BLACK_INK
+    black = spans((stats.luma < BLACK_LUMA) & blank & body, fps, black_min_sec)
+    frozen = spans((stats.delta < FROZEN_DELTA) & body, fps, frozen_min_sec)
+    flicker = flicker_spans(stats.luma, fps)
+    unsafe = spans(stats.ink_unsafe > unsafe_ink, fps, unsafe_min_sec)
+    return {
+        "frames": int(n),
+        "fps": round(float(fps), 2),
+        "luma_mean": round(float(stats.luma.mean()), 2),
+        "delta_p95": round(float(np.percentile(stats.delta, 95)), 3),
+        "ink_safe_mean": round(float(stats.ink_safe.mean()), 4),
+        "ink_unsafe_max": round(float(stats.ink_unsafe.max()), 4),
+        "black_spans": black,
+        "frozen_spans": frozen,
+        "flicker_spans": flicker,
+        "unsafe_ink_spans": unsafe,
+        "dominant_colors": stats.dominant_colors(),
+    }
+
+
+
+def save_pixel_stats(stats: PixelStats, path: Path) -> Path:
+    """逐帧数组存成 .npz，便于事后画曲线或与上一版对比"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        path, fps=stats.fps, luma=stats.luma.astype(np.float32), delta=stats.delta.astype(np.float32),
+        ink_safe=stats.ink_safe.astype(np.float32), ink_unsafe=stats.ink_unsafe.astype(np.float32),
+        background=stats.background.astype(np.uint8), color_hist=stats.color_hist,
+    )
+    return path
+
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="逐帧像素统计：黑场、静帧、闪烁、安全区外墨迹、主色")
+    parser.add_argument("video")
+    parser.add_argument("--height", type=int, default=STATS_HEIGHT)
+    parser.add_argument("--npz", default=None, help="also save per-frame arrays")
+    args = parser.parse_args()
+
+    stats = collect_pixel_stats(Path(args.video), height=args.height)
+    if args.npz:
+        save_pixel_stats(stats, Path(args.npz))
+    print(json.dumps(analyze_pixel_stats(stats), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
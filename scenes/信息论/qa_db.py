@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+
+DEFAULT_DB_PATH = Path("qa_reports") / "qa_results.sqlite"
+DEFAULT_REPORT_DIR = Path("qa_reports")
+
+# ocr_layout 的 details 里逐条样本的键 → ocr_samples.kind
+SAMPLE_KINDS = {"out_of_bounds_samples": "out_of_bounds", "overlap_samples": "overlap"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ep INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    script TEXT NOT NULL,
+    video TEXT NOT NULL,
+    ok INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_ep_stage ON runs (ep, stage, id);
+
+CREATE TABLE IF NOT EXISTS checks (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    ok INTEGER NOT NULL,
+    details TEXT NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS errors (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    check_name TEXT NOT NULL,
+    level TEXT NOT NULL CHECK (level IN ('error', 'warning')),
+    position INTEGER NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS errors_run ON errors (run_id, check_name);
+
+CREATE TABLE IF NOT EXISTS ocr_samples (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    check_name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    frame INTEGER,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ocr_samples_run ON ocr_samples (run_id, kind);
+
+-- 每个 (集, 阶段) 最近一次运行，与 JSON 报告里保存的那份一致
+CREATE VIEW IF NOT EXISTS latest_runs AS
+    SELECT * FROM runs WHERE id IN (SELECT MAX(id) FROM runs GROUP BY ep, stage);
+"""
+
+
+
+class QADatabase:
+    """QA 结果库（SQLite 单文件）：runs / checks / errors / ocr_samples
+
+    每次写入一个报告是一个事务（BEGIN IMMEDIATE），WAL 模式下多个 QA 进程
+    同时写入会排队而不是互相覆盖；读操作不阻塞写。
+    """
+
+    def __init__(self, path: Path = DEFAULT_DB_PATH, timeout: float = 60.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None：事务由下面的 BEGIN / COMMIT 显式控制
+        self._conn = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "QADatabase":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ------------------------------------------------------------------
+    # 写入
+    # ------------------------------------------------------------------
+    def record(self, report: Dict[str, Any], created_at: Optional[float] = None) -> int:
+        """写入 run_qa 的一份报告，返回 run id"""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cur = conn.execute(
+                "INSERT INTO runs (ep, stage, script, video, ok, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (int(report["ep"]), report["stage"], report.get("script", ""), report.get("video", ""),
+                 int(bool(report["ok"])), created_at if created_at is not None else time.time()),
+            )
+            run_id = cur.lastrowid
+            for position, (name, res) in enumerate(report.get("checks", {}).items()):
+                conn.execute(
+                    "INSERT INTO checks VALUES (?, ?, ?, ?, ?)",
+                    (run_id, position, name, int(bool(res["ok"])),
+                     json.dumps(res.get("details", {}), ensure_ascii=False)),
+                )
+                conn.executemany(
+                    "INSERT INTO errors VALUES (?, ?, ?, ?, ?)",
+                    [(run_id, name, "error", i, m) for i, m in enumerate(res.get("errors", []))]
+                    + [(run_id, name, "warning", i, m) for i, m in enumerate(res.get("warnings", []))],
+                )
+                conn.executemany(
+                    "INSERT INTO ocr_samples VALUES (?, ?, ?, ?, ?)",
+                    list(_ocr_sample_rows(run_id, name, res.get("details", {}))),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return run_id
+
+    def import_json(self, path: Path) -> int:
+        """把旧的 epNN_report.json（按阶段分键）导入库中，返回导入的报告数"""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        mtime = Path(path).stat().st_mtime
+        count = 0
+        for report in data.values():
+            self.record(report, created_at=mtime)
+            count += 1
+        return count
+
+    def adopt_legacy_json(self, ep: int, out_dir: Path = DEFAULT_REPORT_DIR) -> int:
+        """库里还没有这一集时先导入已有的 JSON，避免第一次导出把其他阶段的旧结果丢掉"""
+        path = Path(out_dir) / f"ep{int(ep):02d}_report.json"
+        if not path.exists() or self.query("SELECT 1 FROM runs WHERE ep = ? LIMIT 1", (int(ep),)):
+            return 0
+        try:
+            return self.import_json(path)
+        except (ValueError, KeyError, AttributeError):
+            return 0
+
+    # ------------------------------------------------------------------
+    # 读取
+    # ------------------------------------------------------------------
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        self._conn.row_factory = sqlite3.Row
+        try:
+            return self._conn.execute(sql, params).fetchall()
+        finally:
+            self._conn.row_factory = None
+
+    def report(self, run_id: int) -> Dict[str, Any]:
+        """按 run id 还原成 run_qa 返回的报告结构"""
+        run = self.query("SELECT * FROM runs WHERE id = ?", (run_id,))[0]
+        messages: Dict[tuple, List[str]] = {}
+        for r in self.query(
+            "SELECT check_name, level, message FROM errors WHERE run_id = ? ORDER BY check_name, level, position",
+            (run_id,),
+        ):
+            messages.setdefault((r["check_name"], r["level"]), []).append(r["message"])
+
+        checks: Dict[str, Any] = {}
+        for r in self.query("SELECT * FROM checks WHERE run_id = ? ORDER BY position", (run_id,)):
+            checks[r["name"]] = {
+                "ok": bool(r["ok"]),
+                "errors": messages.get((r["name"], "error"), []),
+                "warnings": messages.get((r["name"], "warning"), []),
+                "details": json.loads(r["details"]),
+            }
+        return {
+            "ep": run["ep"],
+            "stage": run["stage"],
+            "script": run["script"],
+            "video": run["video"],
+            "ok": bool(run["ok"]),
+            "errors": [e for c in checks.values() for e in c["errors"]],
+            "warnings": [w for c in checks.values() for w in c["warnings"]],
+            "checks": checks,
+        }
+
+    def latest_reports(self, ep: int) -> Dict[str, Dict[str, Any]]:
+        """某一集各阶段最近一次的报告，键为阶段名（即 epNN_report.json 的内容）"""
+        rows = self.query("SELECT id, stage FROM latest_runs WHERE ep = ? ORDER BY id", (int(ep),))
+        return {r["stage"]: self.report(r["id"]) for r in rows}
+
+    def episodes(self) -> List[int]:
+        return [r["ep"] for r in self.query("SELECT DISTINCT ep FROM runs ORDER BY ep")]
+
+    # ------------------------------------------------------------------
+    # 兼容导出
+    # ------------------------------------------------------------------
+    def export_json(self, ep: int, out_dir: Path = DEFAULT_REPORT_DIR) -> Path:
+        """从库里生成 epNN_report.json；先写临时文件再原子替换，并发导出也不会写出半个文件"""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / f"ep{int(ep):02d}_report.json"
+        payload = json.dumps(self.latest_reports(ep), ensure_ascii=False, indent=2)
+        fd, tmp = tempfile.mkstemp(dir=str(out_dir), prefix=out_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, out_path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return out_path
+
+
+
+def _ocr_sample_rows(run_id: int, check_name: str, details: Dict[str, Any]) -> Iterable[tuple]:
+    for key, kind in SAMPLE_KINDS.items():
+        for sample in details.get(key, []) or []:
+            frame = sample.get("frame")
+            yield (run_id, check_name, kind, None if frame is None else int(frame),
+                   json.dumps(sample, ensure_ascii=False))
+
+
+
+# ----------------------------------------------------------------------
+# 查询命令行
+# ----------------------------------------------------------------------
+def _latest_filter(args) -> tuple:
+    where, params = [], []
+    if args.ep:
+        where.append(f"r.ep IN ({','.join('?' * len(args.ep))})")
+        params += args.ep
+    if args.stage:
+        where.append("r.stage = ?")
+        params.append(args.stage)
+    table = "runs" if getattr(args, "history", False) else "latest_runs"
+    return table, (" AND " + " AND ".join(where)) if where else "", params
+
+
+def _cmd_runs(db: QADatabase, args) -> None:
+    table, where, params = _latest_filter(args)
+    if args.failed:
+        where += " AND r.ok = 0"
+    rows = db.query(
+        f"SELECT r.*, "
+        f" (SELECT COUNT(*) FROM errors e WHERE e.run_id = r.id AND e.level = 'error') AS n_errors,"
+        f" (SELECT COUNT(*) FROM errors e WHERE e.run_id = r.id AND e.level = 'warning') AS n_warnings"
+        f" FROM {table} r WHERE 1 = 1{where} ORDER BY r.ep, r.stage, r.id",
+        params,
+    )
+    for r in rows:
+        stamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(r["created_at"]))
+        print(f"EP{r['ep']:02d} {r['stage']:8s} {'ok  ' if r['ok'] else 'FAIL'} "
+              f"{r['n_errors']:3d} errors {r['n_warnings']:3d} warnings  {stamp}  run {r['id']}")
+
+
+def _cmd_errors(db: QADatabase, args) -> None:
+    table, where, params = _latest_filter(args)
+    if args.check:
+        where += " AND e.check_name = ?"
+        params.append(args.check)
+    if args.like:
+        where += " AND e.message LIKE ?"
+        params.append(f"%{args.like}%")
+    level = "warning" if args.warnings else "error"
+    rows = db.query(
+        f"SELECT r.ep, r.stage, e.check_name, e.message FROM {table} r JOIN errors e ON e.run_id = r.id"
+        f" WHERE e.level = ?{where} ORDER BY r.ep, r.stage, e.check_name, e.position",
+        [level] + params,
+    )
+    for r in rows:
+        print(f"EP{r['ep']:02d} {r['stage']:8s} {r['check_name']:12s} {r['message']}")
+
+
+def _cmd_ocr(db: QADatabase, args) -> None:
+    table, where, params = _latest_filter(args)
+    if args.kind:
+        where += " AND s.kind = ?"
+        params.append(args.kind)
+    rows = db.query(
+        f"SELECT r.ep, r.stage, s.kind, COUNT(*) AS n, GROUP_CONCAT(s.frame) AS frames"
+        f" FROM {table} r JOIN ocr_samples s ON s.run_id = r.id WHERE 1 = 1{where}"
+        f" GROUP BY r.id, s.kind ORDER BY r.ep, r.stage, s.kind",
+        params,
+    )
+    for r in rows:
+        frames = sorted({int(f) for f in (r["frames"] or "").split(",") if f})
+        print(f"EP{r['ep']:02d} {r['stage']:8s} {r['kind']:13s} {r['n']:3d} samples  frames {frames[:10]}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="信息论 QA 结果库查询")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH))
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    def add_filters(p):
+        p.add_argument("--ep", type=int, nargs="+")
+        p.add_argument("--stage", choices=["preview", "final", "sampled"])
+        p.add_argument("--history", action="store_true", help="all runs instead of the latest per stage")
+
+    p = sub.add_parser("runs", help="latest run per episode and stage")
+    add_filters(p)
+    p.add_argument("--failed", action="store_true")
+
+    p = sub.add_parser("errors", help="error (or warning) messages")
+    add_filters(p)
+    p.add_argument("--check", help="static / rhythm_proxy / duration / layout / ocr_layout")
+    p.add_argument("--like", help="substring of the message")
+    p.add_argument("--warnings", action="store_true")
+
+    p = sub.add_parser("ocr", help="text layout samples, e.g. `ocr --stage final --kind overlap`")
+    add_filters(p)
+    p.add_argument("--kind", choices=sorted(SAMPLE_KINDS.values()))
+
+    p = sub.add_parser("sql", help="run a raw SQL query (read-only)")
+    p.add_argument("statement")
+
+    p = sub.add_parser("export", help="write epNN_report.json files from the database")
+    p.add_argument("--ep", type=int, nargs="+")
+    p.add_argument("--out-dir", default=str(DEFAULT_REPORT_DIR))
+
+    p = sub.add_parser("import", help="load existing epNN_report.json files into the database")
+    p.add_argument("files", nargs="+")
+
+    args = parser.parse_args()
+    with QADatabase(Path(args.db)) as db:
+        if args.cmd == "runs":
+            _cmd_runs(db, args)
+        elif args.cmd == "errors":
+            _cmd_errors(db, args)
+        elif args.cmd == "ocr":
+            _cmd_ocr(db, args)
+        elif args.cmd == "sql":
+            db._conn.execute("PRAGMA query_only = ON")
+            for row in db.query(args.statement):
+                print("\t".join(str(v) for v in tuple(row)))
+        elif args.cmd == "export":
+            for ep in args.ep or db.episodes():
+                print(f"[QA-DB] {db.export_json(ep, Path(args.out_dir))}")
+        elif args.cmd == "import":
+            for f in args.files:
+                print(f"[QA-DB] {f}: {db.import_json(Path(f))} reports")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
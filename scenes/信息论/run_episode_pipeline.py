@@ -5,51 +5,78 @@ import subprocess
 import sys
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
 
-def run_cmd(cmd: list[str]) -> None:
+
+def run_cmd(cmd: list[str], cwd: Path | None = None) -> None:
     print("[PIPELINE]", " ".join(cmd))
-    proc = subprocess.run(cmd)
+    proc = subprocess.run(cmd, cwd=cwd)
     if proc.returncode != 0:
         raise SystemExit(proc.returncode)
 
 
 
-def run_episode(ep: int, do_preview: bool, do_final: bool) -> None:
+def _episode_files(ep: int) -> tuple[str, str]:
     ep2 = f"{ep:02d}"
     script = f"information_theory_ep{ep2}.py"
-    klass = f"InformationTheoryEP{ep2}"
-
     if not Path(script).exists():
         raise FileNotFoundError(f"missing script: {script}")
+    return script, f"InformationTheoryEP{ep2}"
+
 
+
+def run_episodes(eps: list[int], do_preview: bool, do_final: bool, do_sampled: bool = False,
+                 gate: bool = True) -> None:
+    """逐集渲染，每个阶段的 QA 对所有集只调用一次 it_qa，OCR 模型整批只加载一次"""
+    files = {ep: _episode_files(ep) for ep in eps}
     py = sys.executable
+    ep_args = [str(ep) for ep in eps]
+
+    if gate and (do_preview or do_final):
+        # 渲染前闸门：试运行时间线（不光栅化），时长不在 60-75s 就不浪费一次渲染
+        for script, klass in files.values():
+            run_cmd([py, "-m", "scenes.templates.timeline", str(Path(script).resolve()), "--scene", klass,
+                     "--min", "60", "--max", "75"], cwd=REPO_ROOT)
+
+    if do_sampled:
+        # 快速布局质检：只渲染采样帧，不编码预览视频
+        run_cmd([py, "it_qa.py", "--ep", *ep_args, "--stage", "sampled", "--sample-frames", "8"])
 
     if do_preview:
-        run_cmd([py, "-m", "manim", script, klass, "-ql"])
-        run_cmd([py, "it_qa.py", "--ep", str(ep), "--stage", "preview", "--sample-frames", "8"])
+        for script, klass in files.values():
+            run_cmd([py, "-m", "manim", script, klass, "-ql"])
+        run_cmd([py, "it_qa.py", "--ep", *ep_args, "--stage", "preview", "--sample-frames", "8"])
 
     if do_final:
-        run_cmd([py, "-m", "manim", script, klass, "-qh", "--fps", "60", "-r", "1920,1080"])
-        run_cmd([py, "it_qa.py", "--ep", str(ep), "--stage", "final", "--sample-frames", "12"])
+        for script, klass in files.values():
+            run_cmd([py, "-m", "manim", script, klass, "-qh", "--fps", "60", "-r", "1920,1080"])
+        run_cmd([py, "it_qa.py", "--ep", *ep_args, "--stage", "final", "--sample-frames", "12"])
 
-    print(f"[PIPELINE] EP{ep2} completed")
+    for ep in eps:
+        print(f"[PIPELINE] EP{ep:02d} completed")
 
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="信息论单集生产管线")
-    parser.add_argument("--ep", type=int, required=True)
+    parser.add_argument("--ep", type=int, nargs="+", required=True,
+                        help="episode number(s); QA runs once per stage for all of them")
     parser.add_argument("--preview", action="store_true", help="run preview stage")
     parser.add_argument("--final", action="store_true", help="run final stage")
+    parser.add_argument("--sampled", action="store_true",
+                        help="sampled-frame QA only: rasterise the QA frames without encoding a preview")
+    parser.add_argument("--no-gate", action="store_true",
+                        help="skip the dry-run duration check before rendering")
     args = parser.parse_args()
 
     do_preview = args.preview
     do_final = args.final
-    if not do_preview and not do_final:
+    if not do_preview and not do_final and not args.sampled:
         do_preview = True
         do_final = True
 
-    run_episode(args.ep, do_preview=do_preview, do_final=do_final)
+    run_episodes(args.ep, do_preview=do_preview, do_final=do_final, do_sampled=args.sampled,
+                 gate=not args.no_gate)
     return 0
 
 
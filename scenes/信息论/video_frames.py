@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+@dataclass
+class VideoInfo:
+    fps: float
+    frames: int
+    width: int
+    height: int
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.fps if self.fps else 0.0
+
+
+
+def probe_video(video_path: Path) -> VideoInfo:
+    cap = cv2.VideoCapture(str(video_path))
+    info = VideoInfo(
+        fps=float(cap.get(cv2.CAP_PROP_FPS) or 0),
+        frames=int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0),
+        width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 0),
+        height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0),
+    )
+    cap.release()
+    return info
+
+
+
+def scaled_size(info: VideoInfo, height: Optional[int]) -> Tuple[int, int]:
+    """按目标高度等比缩放，宽高取偶数（ffmpeg 的 yuv 缩放要求）"""
+    if not height or height >= info.height:
+        return info.width, info.height
+    width = int(round(info.width * height / info.height / 2)) * 2
+    return max(width, 2), int(height) // 2 * 2
+
+
+
+def iter_frames(video_path: Path,
+                indices: Optional[Iterable[int]] = None,
+                step: int = 1,
+                height: Optional[int] = None,
+                backend: str = "opencv") -> Iterator[Tuple[int, np.ndarray]]:
+    """顺序解码一遍视频，按帧号产出 (帧号, BGR 帧)
+
+    indices 为要取的帧号（任意顺序、可重复）；为 None 时每 step 帧取一帧。
+    不做随机 seek：H.264 上 seek 会回到关键帧重新解码，且定位偶尔不准。
+    height 给定时缩小到该高度；backend="ffmpeg" 时由 ffmpeg 在解码端缩放，
+    只把小帧通过管道传过来，适合长视频的逐帧统计。
+    生成器逐帧产出，内存占用与视频长度无关。
+    """
+    wanted = None if indices is None else sorted({int(i) for i in indices})
+    if wanted is not None and not wanted:
+        return iter(())
+    if backend == "ffmpeg":
+        return _iter_ffmpeg(Path(video_path), wanted, step, height)
+    if backend != "opencv":
+        raise ValueError(f"unknown backend: {backend}")
+    return _iter_opencv(Path(video_path), wanted, step, height)
+
+
+
+def _iter_opencv(video_path: Path, wanted: Optional[Sequence[int]], step: int,
+                 height: Optional[int]) -> Iterator[Tuple[int, np.ndarray]]:
+    cap = cv2.VideoCapture(str(video_path))
+    if not cap.isOpened():
+        raise FileNotFoundError(f"cannot open video: {video_path}")
+    size = scaled_size(probe_video(video_path), height) if height else None
+    last = wanted[-1] if wanted is not None else None
+    pos = 0
+    k = 0
+    try:
+        while last is None or pos <= last:
+            # grab 只解码不转换颜色，不需要的帧开销最小
+            if not cap.grab():
+                break
+            take = (wanted[k] == pos) if wanted is not None else (pos % step == 0)
+            if take:
+                ok, frame = cap.retrieve()
+                if ok:
+                    if size is not None:
+                        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                    yield pos, frame
+                if wanted is not None:
+                    k += 1
+            pos += 1
+    finally:
+        cap.release()
+
+
+
+def _iter_ffmpeg(video_path: Path, wanted: Optional[Sequence[int]], step: int,
+                 height: Optional[int]) -> Iterator[Tuple[int, np.ndarray]]:
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise FileNotFoundError("ffmpeg not found on PATH")
+    info = probe_video(video_path)
+    w, h = scaled_size(info, height)
+
+    if wanted is not None:
+        # select 在 ffmpeg 内部丢帧，管道里只有需要的帧
+        expr = "+".join(f"eq(n\\,{i})" for i in wanted)
+        numbers: Iterator[int] = iter(wanted)
+    else:
+        expr = f"not(mod(n\\,{step}))"
+        numbers = iter(range(0, 1 << 62, step))
+    filters = f"select='{expr}',scale={w}:{h}:flags=area"
+    cmd = [
+        ffmpeg, "-v", "error", "-i", str(video_path),
+        "-vf", filters, "-vsync", "0",
+        "-f", "rawvideo", "-pix_fmt", "bgr24", "-",
+    ]
+    frame_bytes = w * h * 3
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=frame_bytes * 4)
+    try:
+        for idx in numbers:
+            buf = proc.stdout.read(frame_bytes)
+            if len(buf) < frame_bytes:
+                break
+            yield idx, np.frombuffer(buf, dtype=np.uint8).reshape(h, w, 3)
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.terminate()
+        proc.wait()
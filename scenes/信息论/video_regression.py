@@ -0,0 +1,508 @@
+from __future__ import annotations
+
+import argparse
+import json
+import queue
+import shutil
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from video_frames import iter_frames, probe_video
+
+
+DEFAULT_BASELINE_DIR = Path("qa_baselines")
+DEFAULT_OUT_DIR = Path("qa_reports") / "regression"
+
+# 比较用的分辨率与采样率：1080p 的正文（约 30 px 字高）缩到 180 行后仍有 5 px，
+# 改一个字会落进 SSIM 窗口；8 分钟的片子每路约 280 MB 灰度帧
+ANALYSIS_HEIGHT = 180
+ANALYSIS_FPS = 10.0
+
+# SSIM 窗口与常数（8 位灰度）
+SSIM_WIN = 7
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+# 局部判定：SSIM 图按 SSIM_BLOCK×SSIM_BLOCK 分块取最差一块；绝对差先做 DIFF_BLUR×DIFF_BLUR 均值模糊再取最大
+SSIM_BLOCK = 16
+DIFF_BLUR = 5
+
+
+
+@dataclass
+class ChangedRange:
+    """内容变化的区间（基线时间）；candidate_time 为最差一帧在新渲染里的时刻
+
+    min_ssim / max_diff 是局部量：最差一块的 SSIM、模糊后绝对差的峰值（见 frame_scores）。
+    """
+    start: float
+    end: float
+    min_ssim: float
+    max_diff: float
+    worst_time: float
+    candidate_time: float = 0.0
+    thumbnail: str = ""
+
+
+
+@dataclass
+class Span:
+    start: float
+    end: float
+
+
+
+@dataclass
+class RegressionResult:
+    baseline: str
+    candidate: str
+    fps: float
+    offset_sec: float
+    duration_delta_sec: float
+    frames_compared: int
+    ssim_mean: float
+    changed: List[ChangedRange] = field(default_factory=list)
+    # 新渲染里多出来的片段（新渲染时间）/ 基线里被删掉的片段（基线时间）
+    inserted: List[Span] = field(default_factory=list)
+    removed: List[Span] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.changed or self.inserted or self.removed)
+
+
+
+def _decode_gray(video_path: Path, times: np.ndarray, height: int, backend: str) -> np.ndarray:
+    """顺序解码，只取给定时刻的帧，缩小成灰度，返回 (N, h, w) uint8"""
+    info = probe_video(video_path)
+    indices = np.minimum(np.round(times * info.fps).astype(int), max(info.frames - 1, 0))
+    frames: Dict[int, np.ndarray] = {}
+    for idx, frame in iter_frames(video_path, indices=indices.tolist(), height=height, backend=backend):
+        frames[idx] = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    if not frames:
+        raise ValueError(f"no frames decoded from {video_path}")
+    # 解码端提前结束（帧数元数据偏大）时用最后一帧补齐
+    last = frames[max(frames)]
+    return np.stack([frames.get(int(i), last) for i in indices])
+
+
+
+def _decode_both(baseline: Path, candidate: Path, fps: float, height: int,
+                 backend: str) -> Tuple[np.ndarray, np.ndarray]:
+    """两个视频各开一个线程解码（ffmpeg / OpenCV 解码时都会释放 GIL）"""
+    out: Dict[str, Any] = {}
+    errors: "queue.Queue[BaseException]" = queue.Queue()
+
+    def work(key: str, path: Path) -> None:
+        try:
+            info = probe_video(path)
+            times = np.arange(0.0, info.duration, 1.0 / fps)
+            out[key] = _decode_gray(path, times, height, backend)
+        except BaseException as exc:  # 交给主线程抛出
+            errors.put(exc)
+
+    threads = [threading.Thread(target=work, args=(k, p)) for k, p in (("a", baseline), ("b", candidate))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if not errors.empty():
+        raise errors.get()
+    a, b = out["a"], out["b"]
+    # 宽高比不同（换了分辨率）时缩到同一尺寸再比较
+    if a.shape[1:] != b.shape[1:]:
+        b = np.stack([cv2.resize(f, (a.shape[2], a.shape[1]), interpolation=cv2.INTER_AREA) for f in b])
+    return a, b
+
+
+
+def _signatures(x: np.ndarray) -> np.ndarray:
+    """每帧缩成 16×9 灰度签名 (N, 144)"""
+    return np.stack([cv2.resize(f, (16, 9), interpolation=cv2.INTER_AREA) for f in x]).reshape(len(x), -1) \
+        .astype(np.float32)
+
+
+
+@dataclass
+class Alignment:
+    """逐帧对应关系：pairs 为 (基线帧, 新帧)，按基线时间排序；removed / inserted 为没有对应帧的帧号"""
+    pairs_a: np.ndarray
+    pairs_b: np.ndarray
+    removed: np.ndarray
+    inserted: np.ndarray
+
+
+
+def align_frames(a: np.ndarray, b: np.ndarray, max_shift: int, gap_cost: float = 8.0) -> Alignment:
+    """分段对齐：在 16×9 签名上做带状单调对齐（编辑距离式 DP）
+
+    每一步要么两边各走一帧（代价 = 签名平均差），要么只在一边走一帧（代价 gap_cost，
+    即插入 / 删除）。某一段变长、变短时，前后未改动的部分各自对上，中间多出 / 少掉的帧单独报告，
+    而不是用一个全局偏移把整片错开。
+    两个对得上的帧之间同时有删除和插入时视为"原地改动"：按顺序一一配对，交给 SSIM 判断，剩下的才算插入 / 删除。
+    max_shift：允许的局部错位（帧），两片时长差会自动加上。
+    """
+    ta, tb = _signatures(a), _signatures(b)
+    n, m = len(ta), len(tb)
+    w = int(max_shift) + abs(m - n)
+    width = 2 * w + 1
+    k = np.arange(width)
+    gap_ramp = gap_cost * k
+
+    # 第 i 行只存 j ∈ [i - w, i + w]，列号 j = i + k - w
+    back = np.zeros((n + 1, width), dtype=np.int8)  # 0 对角，1 删除（基线多一帧），2 插入（新渲染多一帧）
+    j0 = k - w
+    prev = np.where((j0 >= 0) & (j0 <= m), np.maximum(j0, 0) * gap_cost, np.inf)
+    back[0] = 2
+    for i in range(1, n + 1):
+        j = i + k - w
+        valid = (j >= 0) & (j <= m)
+        diag = np.full(width, np.inf)
+        ok = valid & (j >= 1)
+        diag[ok] = prev[ok] + np.abs(tb[j[ok] - 1] - ta[i - 1]).mean(axis=1)
+        up = np.full(width, np.inf)
+        up[:-1] = prev[1:] + gap_cost
+        best = np.minimum(diag, up)
+        ptr = np.where(diag <= up, 0, 1).astype(np.int8)
+        best[~valid] = np.inf
+        # 同一行内的连续插入：row[k] = min_{k' <= k} best[k'] + gap·(k - k')
+        row = np.minimum.accumulate(best - gap_ramp) + gap_ramp
+        left = row < best
+        ptr[left] = 2
+        row[~valid] = np.inf
+        back[i] = ptr
+        prev = row
+
+    # 回溯
+    i, j = n, m
+    pa: List[int] = []
+    pb: List[int] = []
+    removed: List[int] = []
+    inserted: List[int] = []
+    run_a: List[int] = []
+    run_b: List[int] = []
+
+    def flush() -> None:
+        # 两个对得上的帧之间的一段：按时间顺序一一配对成"原地改动"，多出来的尾巴才算插入 / 删除
+        r_a, r_b = sorted(run_a), sorted(run_b)
+        common = min(len(r_a), len(r_b))
+        pa.extend(r_a[:common])
+        pb.extend(r_b[:common])
+        removed.extend(r_a[common:])
+        inserted.extend(r_b[common:])
+        run_a.clear()
+        run_b.clear()
+
+    while i > 0 or j > 0:
+        op = back[i, j - i + w] if i > 0 else 2
+        if op == 0:
+            i, j = i - 1, j - 1
+            # 只有真正对上的帧才切断一段改动；代价高的对角步本身也算进这段改动
+            if np.abs(tb[j] - ta[i]).mean() < gap_cost:
+                flush()
+                pa.append(i)
+                pb.append(j)
+            else:
+                run_a.append(i)
+                run_b.append(j)
+        elif op == 1:
+            i -= 1
+            run_a.append(i)
+        else:
+            j -= 1
+            run_b.append(j)
+    flush()
+
+    order_a = np.argsort(pa, kind="stable")
+    return Alignment(
+        pairs_a=np.asarray(pa, dtype=int)[order_a],
+        pairs_b=np.asarray(pb, dtype=int)[order_a],
+        removed=np.sort(np.asarray(removed, dtype=int)),
+        inserted=np.sort(np.asarray(inserted, dtype=int)),
+    )
+
+
+
+def _box_mean(x: np.ndarray, k: int) -> np.ndarray:
+    """(N, H, W) 上 k×k 窗口均值（积分图，只保留完整窗口）"""
+    c = np.cumsum(np.cumsum(x, axis=1), axis=2)
+    c = np.pad(c, ((0, 0), (1, 0), (1, 0)))
+    s = c[:, k:, k:] - c[:, :-k, k:] - c[:, k:, :-k] + c[:, :-k, :-k]
+    return s / float(k * k)
+
+
+
+def ssim_map(a: np.ndarray, b: np.ndarray, win: int = SSIM_WIN) -> np.ndarray:
+    """SSIM 图，a / b 为 (N, H, W) 灰度，返回 (N, H - win + 1, W - win + 1)"""
+    a = a.astype(np.float32)
+    b = b.astype(np.float32)
+    mu_a, mu_b = _box_mean(a, win), _box_mean(b, win)
+    var_a = _box_mean(a * a, win) - mu_a ** 2
+    var_b = _box_mean(b * b, win) - mu_b ** 2
+    cov = _box_mean(a * b, win) - mu_a * mu_b
+    num = (2 * mu_a * mu_b + SSIM_C1) * (2 * cov + SSIM_C2)
+    den = (mu_a ** 2 + mu_b ** 2 + SSIM_C1) * (var_a + var_b + SSIM_C2)
+    return num / den
+
+
+
+def ssim_batch(a: np.ndarray, b: np.ndarray, win: int = SSIM_WIN) -> np.ndarray:
+    """逐帧 SSIM（全帧平均），返回 (N,)"""
+    return ssim_map(a, b, win).mean(axis=(1, 2))
+
+
+
+def _block_min(x: np.ndarray, block: int) -> np.ndarray:
+    """(N, H, W) 切成 block×block 的块，返回每帧块均值的最小值 (N,)"""
+    n, h, w = x.shape
+    hb, wb = max(h // block, 1), max(w // block, 1)
+    bh, bw = h // hb, w // wb
+    x = x[:, :hb * bh, :wb * bw].reshape(n, hb, bh, wb, bw)
+    return x.mean(axis=(2, 4)).min(axis=(1, 2))
+
+
+
+def frame_scores(a: np.ndarray, b: np.ndarray, batch: int = 32) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """逐帧 (全帧平均 SSIM, 最差一块的 SSIM, 模糊后绝对差的最大值/255)，分批计算控制内存
+
+    判定用后两个局部量：面板里改了一行字只影响画面的百分之一，全帧平均几乎不动，
+    但落在那几块上的 SSIM 会明显下降；绝对差先做 DIFF_BLUR 均值模糊，压掉编码噪声的孤立像素。
+    """
+    ssim = np.empty(len(a))
+    local = np.empty(len(a))
+    diff = np.empty(len(a))
+    for i in range(0, len(a), batch):
+        sa, sb = a[i:i + batch], b[i:i + batch]
+        smap = ssim_map(sa, sb)
+        ssim[i:i + batch] = smap.mean(axis=(1, 2))
+        local[i:i + batch] = _block_min(smap, SSIM_BLOCK)
+        ad = np.abs(sa.astype(np.float32) - sb.astype(np.float32))
+        diff[i:i + batch] = _box_mean(ad, DIFF_BLUR).max(axis=(1, 2)) / 255.0
+    return ssim, local, diff
+
+
+
+def changed_ranges(flags: np.ndarray, fps: float, merge_gap: float = 0.5,
+                   min_length: float = 0.0) -> List[Tuple[int, int]]:
+    """把逐帧标记合并成区间 [start, end)（帧号），间隔小于 merge_gap 秒的区间合并"""
+    idx = np.flatnonzero(flags)
+    if len(idx) == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(idx) > max(1, int(round(merge_gap * fps)))) + 1
+    ranges = []
+    for group in np.split(idx, breaks):
+        start, end = int(group[0]), int(group[-1]) + 1
+        if (end - start) / fps >= min_length:
+            ranges.append((start, end))
+    return ranges
+
+
+
+def compare_videos(baseline: Path, candidate: Path, out_dir: Optional[Path] = None,
+                   fps: float = ANALYSIS_FPS, height: int = ANALYSIS_HEIGHT,
+                   ssim_th: float = 0.8, diff_th: float = 0.06, max_offset_sec: float = 10.0,
+                   backend: Optional[str] = None, thumb_height: int = 270) -> RegressionResult:
+    """新渲染与基线逐帧比较，返回变化的时间段；out_dir 给定时为每段写一张对比缩略图
+
+    先用 align_frames 分段对齐（某一段变长 / 变短不会让后面全部错位），再逐对比较：
+    帧被判为变化：最差一块的 SSIM < ssim_th，或模糊后的绝对差最大值 > diff_th（见 frame_scores）；
+    多出 / 少掉的片段分别记为 inserted / removed。
+    max_offset_sec：允许的局部错位，两片的时长差另外自动加上。
+    """
+    baseline, candidate = Path(baseline), Path(candidate)
+    backend = backend or ("ffmpeg" if shutil.which("ffmpeg") else "opencv")
+    a, b = _decode_both(baseline, candidate, fps, height, backend)
+
+    align = align_frames(a, b, int(round(max_offset_sec * fps)))
+    ssim, local, diff = frame_scores(a[align.pairs_a], b[align.pairs_b])
+    drift = (align.pairs_b[-1] - align.pairs_a[-1]) if len(align.pairs_a) else len(b) - len(a)
+
+    result = RegressionResult(
+        baseline=str(baseline),
+        candidate=str(candidate),
+        fps=fps,
+        offset_sec=round(float(drift) / fps, 3),
+        duration_delta_sec=round((len(b) - len(a)) / fps, 3),
+        frames_compared=int(len(ssim)),
+        ssim_mean=round(float(ssim.mean()), 4) if len(ssim) else 1.0,
+    )
+
+    # 区间按对齐后的配对序号合并，再换算回基线时间
+    for start, end in changed_ranges((local < ssim_th) | (diff > diff_th), fps):
+        worst = start + int(np.argmin(local[start:end]))
+        result.changed.append(ChangedRange(
+            start=round(align.pairs_a[start] / fps, 2),
+            end=round((align.pairs_a[end - 1] + 1) / fps, 2),
+            min_ssim=round(float(local[start:end].min()), 4),
+            max_diff=round(float(diff[start:end].max()), 4),
+            worst_time=round(align.pairs_a[worst] / fps, 2),
+            candidate_time=round(align.pairs_b[worst] / fps, 2),
+        ))
+    for frames, total, out in ((align.inserted, len(b), result.inserted), (align.removed, len(a), result.removed)):
+        flags = np.zeros(total, dtype=bool)
+        flags[frames] = True
+        out.extend(Span(round(s0 / fps, 2), round(s1 / fps, 2)) for s0, s1 in changed_ranges(flags, fps, merge_gap=0))
+
+    if out_dir is not None and result.changed:
+        _write_thumbnails(result, Path(out_dir), backend, thumb_height)
+    return result
+
+
+
+def _write_thumbnails(result: RegressionResult, out_dir: Path, backend: str, height: int) -> None:
+    """每段取最差的一帧：基线 | 新渲染 | 差异热图"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    times = np.array([r.worst_time for r in result.changed])
+    base = _decode_color(Path(result.baseline), times, height, backend)
+    cand = _decode_color(Path(result.candidate), np.array([r.candidate_time for r in result.changed]),
+                         height, backend)
+    for r, fa, fb in zip(result.changed, base, cand):
+        if fb.shape != fa.shape:
+            fb = cv2.resize(fb, (fa.shape[1], fa.shape[0]), interpolation=cv2.INTER_AREA)
+        diff = cv2.absdiff(fa, fb).max(axis=2)
+        heat = cv2.applyColorMap(np.clip(diff.astype(np.int32) * 4, 0, 255).astype(np.uint8), cv2.COLORMAP_JET)
+        sheet = np.hstack([fa, fb, heat])
+        path = out_dir / f"diff_{r.start:07.2f}-{r.end:07.2f}.png"
+        ok, buf = cv2.imencode(".png", sheet)
+        if ok:
+            # imencode + 写字节：路径含中文时 cv2.imwrite 在部分平台会失败
+            path.write_bytes(buf.tobytes())
+            r.thumbnail = str(path)
+
+
+
+def _decode_color(video_path: Path, times: np.ndarray, height: int, backend: str) -> List[np.ndarray]:
+    info = probe_video(video_path)
+    indices = np.clip(np.round(times * info.fps).astype(int), 0, max(info.frames - 1, 0))
+    frames = dict(iter_frames(video_path, indices=indices.tolist(), height=height, backend=backend))
+    blank = np.zeros((height, int(height * info.width / max(info.height, 1)), 3), np.uint8)
+    return [frames.get(int(i), blank) for i in indices]
+
+
+
+def _synthetic_clip(path: Path, seconds: float, edited, fps: float = 10.0) -> None:
+    """1080p 合成片段：面板 + 标题 + 三行正文 + 运动的圆；edited(t) 为真时第二行正文改一个数"""
+    w, h = 1920, 1080
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, (w, h))
+    for i in range(int(seconds * fps)):
+        t = i / fps
+        f = np.full((h, w, 3), (30, 20, 15), np.uint8)
+        cv2.rectangle(f, (200, 200), (1100, 900), (70, 60, 50), -1)
+        cv2.putText(f, "Entropy of a source", (240, 300), cv2.FONT_HERSHEY_SIMPLEX, 2.0, (255, 255, 255), 4,
+                    cv2.LINE_AA)
+        lines = ["H(X) = -sum p log p", "p = 0.25 gives 1 bit" if edited(t) else "p = 0.5 gives 1 bit",
+                 "uniform is maximal"]
+        for k, line in enumerate(lines):
+            cv2.putText(f, line, (240, 420 + 80 * k), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (220, 220, 220), 2,
+                        cv2.LINE_AA)
+        cv2.circle(f, (int(1400 + 300 * np.sin(t)), 540), 80, (0, 200, 255), -1, cv2.LINE_AA)
+        writer.write(f)
+    writer.release()
+
+
+
+def self_check() -> int:
+    """面板里一行正文改一个数（约占画面 1%）必须被报出，同一片自比必须无变化"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base, cand = Path(tmp) / "base.mp4", Path(tmp) / "cand.mp4"
+        _synthetic_clip(base, 12.0, lambda t: False)
+        _synthetic_clip(cand, 12.0, lambda t: 4.0 <= t < 8.0)
+        same = compare_videos(base, base, backend="opencv")
+        edit = compare_videos(base, cand, backend="opencv")
+
+    problems = []
+    if not same.ok:
+        problems.append(f"identical clips reported changes: {same.changed}")
+    spans = [(r.start, r.end) for r in edit.changed]
+    if edit.inserted or edit.removed or len(spans) != 1 or abs(spans[0][0] - 4.0) > 0.2 \
+            or abs(spans[0][1] - 8.0) > 0.2:
+        problems.append(f"text edit at 4.0-8.0s not reported as one changed range: changed={spans}, "
+                        f"inserted={edit.inserted}, removed={edit.removed}")
+    for p in problems:
+        print(f"[REGRESS] self-check FAILED: {p}")
+    if not problems:
+        print(f"[REGRESS] self-check ok: text edit flagged at {spans[0][0]:.1f}-{spans[0][1]:.1f}s "
+              f"(block ssim {edit.changed[0].min_ssim:.3f}, whole-frame ssim mean {edit.ssim_mean:.4f})")
+    return 1 if problems else 0
+
+
+
+def baseline_path(ep: int, stage: str, baseline_dir: Path = DEFAULT_BASELINE_DIR) -> Path:
+    return Path(baseline_dir) / f"ep{ep:02d}_{stage}.mp4"
+
+
+
+def main() -> int:
+    from it_qa import _find_video
+
+    parser = argparse.ArgumentParser(description="成片视觉回归：与基线逐帧比较（低分辨率流式解码）")
+    parser.add_argument("--ep", type=int, nargs="+", help="compare rendered episodes against qa_baselines/")
+    parser.add_argument("--stage", choices=["preview", "final"], default="preview")
+    parser.add_argument("--baseline", help="baseline video (instead of --ep)")
+    parser.add_argument("--candidate", help="new video (instead of --ep)")
+    parser.add_argument("--update", action="store_true", help="store the current render as the new baseline")
+    parser.add_argument("--ssim", type=float, default=0.8,
+                        help="frames whose worst 16x16 block SSIM is below this count as changed")
+    parser.add_argument("--diff", type=float, default=0.06,
+                        help="frames whose blurred abs diff peaks above this (0-1) count as changed")
+    parser.add_argument("--fps", type=float, default=ANALYSIS_FPS)
+    parser.add_argument("--height", type=int, default=ANALYSIS_HEIGHT)
+    parser.add_argument("--out", default=str(DEFAULT_OUT_DIR))
+    parser.add_argument("--self-check", action="store_true",
+                        help="render a synthetic clip with a one-line text edit and verify it is flagged")
+    args = parser.parse_args()
+
+    if args.self_check:
+        return self_check()
+
+    pairs: List[Tuple[str, Path, Path]] = []
+    if args.ep:
+        for ep in args.ep:
+            video = _find_video(ep, args.stage)
+            if video is None:
+                raise FileNotFoundError(f"video not found for ep{ep:02d} stage={args.stage}")
+            base = baseline_path(ep, args.stage)
+            if args.update or not base.exists():
+                base.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(video, base)
+                print(f"[REGRESS] EP{ep:02d} baseline stored: {base}")
+                continue
+            pairs.append((f"ep{ep:02d}_{args.stage}", base, video))
+    elif args.baseline and args.candidate:
+        pairs.append((Path(args.candidate).stem, Path(args.baseline), Path(args.candidate)))
+    else:
+        parser.error("pass --ep or both --baseline and --candidate")
+
+    all_ok = True
+    for name, base, cand in pairs:
+        out_dir = Path(args.out) / name
+        res = compare_videos(base, cand, out_dir=out_dir, fps=args.fps, height=args.height,
+                             ssim_th=args.ssim, diff_th=args.diff)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        report = dict(asdict(res), ok=res.ok)
+        (out_dir / "regression.json").write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+        all_ok = all_ok and res.ok
+        summary = (f"{len(res.changed)} changed, {len(res.inserted)} inserted, {len(res.removed)} removed ranges"
+                   if not res.ok else "unchanged")
+        print(f"[REGRESS] {name}: {summary} "
+              f"(ssim mean {res.ssim_mean:.4f}, offset at end {res.offset_sec:+.2f}s, "
+              f"duration {res.duration_delta_sec:+.2f}s)")
+        for r in res.changed:
+            print(f"  - changed  {r.start:7.2f}s .. {r.end:7.2f}s  min ssim {r.min_ssim:.3f}  {r.thumbnail}")
+        for r in res.inserted:
+            print(f"  + inserted {r.start:7.2f}s .. {r.end:7.2f}s  (new render)")
+        for r in res.removed:
+            print(f"  - removed  {r.start:7.2f}s .. {r.end:7.2f}s  (baseline)")
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
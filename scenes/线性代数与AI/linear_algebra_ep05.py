@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scenes.templates.neural_network import NeuralNetworkGraph
 
 # --- 配色方案 (已补全 LA_GREEN) ---
 LA_TEAL = "#2DD4BF"      # 权重 / 正向
@@ -169,47 +174,32 @@ class LinearAlgebraEP05(Scene):
         
         # 1. 左侧：简单的神经网络图 (2输入 -> 3隐藏 -> 2输出)
         layers = [2, 3, 2]
-        network = VGroup()
-        
-        # 节点坐标计算
         node_radius = 0.2
         layer_gap = 1.5
-        
-        # 存储节点位置以便连线
-        layer_coords = []
-        
+
+        # 节点坐标（每层自上而下）
+        positions = []
         for i, num_nodes in enumerate(layers):
-            layer_nodes = []
             x = (i - 1) * layer_gap
             y_start = (num_nodes - 1) * 0.5
-            
-            for j in range(num_nodes):
-                y = y_start - j
-                pos = LEFT_ZONE + np.array([x, y, 0])
-                
-                # 颜色区分
-                col = LA_PINK if i==0 else (LA_TEAL if i==1 else LA_YELLOW)
-                node = Circle(radius=node_radius, color=col, fill_opacity=0.5).move_to(pos)
-                network.add(node)
-                layer_nodes.append(node)
-            layer_coords.append(layer_nodes)
-            
-        # 连线
-        lines = VGroup()
-        for i in range(len(layers) - 1):
-            curr_layer = layer_coords[i]
-            next_layer = layer_coords[i+1]
-            for n1 in curr_layer:
-                for n2 in next_layer:
-                    line = Line(n1.get_right(), n2.get_left(), color=LA_GRAY, stroke_width=1, stroke_opacity=0.5)
-                    lines.add(line)
-        
-        # 先画线后画点，保证层次
-        network_grp = VGroup(lines, network)
+            positions.append([LEFT_ZONE + np.array([x, y_start - j, 0]) for j in range(num_nodes)])
+
+        # 边在下、节点在上；颜色区分各层
+        network = NeuralNetworkGraph(
+            positions=positions,
+            node_radius=node_radius,
+            node_colors=[LA_PINK, LA_TEAL, LA_YELLOW],
+            node_fill_opacity=0.5,
+            edge_color=LA_GRAY,
+            edge_width=1,
+            edge_opacity=0.5,
+            edge_buff=node_radius,
+        )
+        lines = network.edges
         # 整体下移一点
-        network_grp.shift(DOWN * 0.5)
-        
-        self.play(Create(network_grp), run_time=2)
+        network.shift(DOWN * 0.5)
+
+        self.play(Create(network), run_time=2)
         
         # 2. 右侧：矩阵公式推导
         
@@ -241,8 +231,8 @@ class LinearAlgebraEP05(Scene):
         
         # 3. 强调：每一层都是一次空间变换
         # 高亮中间的线
-        self.play(lines.animate.set_color(LA_TEAL).set_opacity(1), run_time=0.5)
-        self.play(lines.animate.set_color(LA_GRAY).set_opacity(0.5), run_time=0.5)
+        self.play(lines.animate.set_stroke(LA_TEAL, opacity=1), run_time=0.5)
+        self.play(lines.animate.set_stroke(LA_GRAY, opacity=0.5), run_time=0.5)
         
         self.wait(2)
         self.play(FadeOut(Group(*self.mobjects)))
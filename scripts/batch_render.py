@@ -188,6 +188,28 @@ class BatchRenderer:
         
         print(f"\n详细报告已保存至: {report_path}")
     
+    def check_layout(self):
+        """渲染前在跳过模式下检查所有场景的文字重叠与安全区，返回是否全部通过"""
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+        from scenes.templates.layout_check import validate_scene
+
+        all_ok = True
+        for scene in self.config['scenes']:
+            try:
+                report = validate_scene(scene["file"], scene["class"])
+            except Exception as e:
+                print(f"❌ 布局检查失败: {scene['name']} ({e})")
+                all_ok = False
+                continue
+            if report["ok"]:
+                print(f"✅ 布局通过: {scene['name']}")
+            else:
+                all_ok = False
+                print(f"⚠️ 布局问题: {scene['name']} 重叠 {report['overlaps']} 处, 越界 {report['safe_area']} 处")
+                for issue in report["issues"][:5]:
+                    print(f"    {issue['first_time']:.1f}s [{issue['section']}] {issue['type']}: {issue['a']} {issue.get('b', '')}")
+        return all_ok
+
     def add_scene(self, file_path, class_name, name, quality=None):
         """添加新场景到配置"""
         if quality is None:
@@ -230,6 +252,11 @@ def main():
         "--name", "-n",
         help="场景名称"
     )
+    parser.add_argument(
+        "--check-layout",
+        action="store_true",
+        help="渲染前先做布局检查，有问题则不渲染"
+    )
     parser.add_argument(
         "--config",
         default="render_config.json",
@@ -252,6 +279,8 @@ def main():
             args.quality
         )
     else:
+        if args.check_layout and not renderer.check_layout():
+            sys.exit(1)
         renderer.render_all(args.quality)
 
 if __name__ == "__main__":
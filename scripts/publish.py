@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+"""
+多平台发布转码
+母版只解码一次：一个 ffmpeg 进程里用 split 把画面分给各平台的缩放 / 帧率 / 竖屏裁切或加边，
+各自编码输出；多集并行，最后核对每个输出的时长。
+
+平台列表取自 config.yml 的 publishing.platforms，各平台参数见 PLATFORM_PRESETS。
+
+    python scripts/publish.py media/videos/ep01/1080p60/EP01.mp4 media/videos/ep02/1080p60/EP02.mp4
+    python scripts/publish.py "media/videos/**/1080p60/*.mp4" --platforms douyin --jobs 2
+"""
+
+import argparse
+import glob
+import json
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CONFIG_FILE = REPO_ROOT / "config.yml"
+
+PLATFORM_PRESETS = {
+    "youtube": {
+        "width": 1920, "height": 1080, "fps": 60,
+        "video_bitrate": "12M", "maxrate": "16M", "bufsize": "24M",
+        "audio_bitrate": "192k",
+    },
+    "bilibili": {
+        "width": 1920, "height": 1080, "fps": 60,
+        "video_bitrate": "6M", "maxrate": "8M", "bufsize": "12M",
+        "audio_bitrate": "192k",
+    },
+    "douyin": {
+        # 竖屏 9:16；fit="pad" 保留完整画面上下加边，fit="crop" 裁掉两侧铺满
+        "width": 1080, "height": 1920, "fps": 30, "fit": "pad",
+        "video_bitrate": "8M", "maxrate": "10M", "bufsize": "16M",
+        "audio_bitrate": "128k",
+    },
+}
+
+# 输出时长与母版允许的偏差（秒）
+DURATION_TOLERANCE = 0.15
+
+
+def load_publishing_config(path=CONFIG_FILE):
+    """读取 publishing.platforms 和背景色；没装 PyYAML 时按本文件的简单结构逐行解析"""
+    text = Path(path).read_text(encoding="utf-8") if Path(path).exists() else ""
+    try:
+        import yaml  # type: ignore
+
+        data = yaml.safe_load(text) or {}
+        platforms = (data.get("publishing") or {}).get("platforms") or []
+        background = ((data.get("project") or {}).get("color_scheme") or {}).get("background")
+        return {"platforms": list(platforms), "background": background}
+    except ImportError:
+        pass
+
+    platforms, background = [], None
+    section, in_platforms = None, False
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not line.startswith(" "):
+            section, in_platforms = line.rstrip(":").strip(), False
+            continue
+        stripped = line.strip()
+        if section == "publishing" and stripped == "platforms:":
+            in_platforms = True
+        elif in_platforms and stripped.startswith("- "):
+            platforms.append(stripped[2:].strip().strip("\"'"))
+        elif stripped.startswith("background:"):
+            background = stripped.split(":", 1)[1].strip().strip("\"'")
+    return {"platforms": platforms, "background": background}
+
+
+def has_audio(master):
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe is None:
+        return True
+    out = subprocess.run(
+        [ffprobe, "-v", "error", "-select_streams", "a", "-show_entries", "stream=index", "-of", "csv=p=0",
+         str(master)],
+        capture_output=True, text=True,
+    )
+    return bool(out.stdout.strip())
+
+
+def probe_duration(path):
+    """容器时长（秒）：优先 ffprobe，没有时用 OpenCV 的帧数 / 帧率"""
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe is not None:
+        out = subprocess.run(
+            [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)],
+            capture_output=True, text=True,
+        )
+        try:
+            return float(out.stdout.strip())
+        except ValueError:
+            return None
+    try:
+        import cv2
+    except ImportError:
+        return None
+    cap = cv2.VideoCapture(str(path))
+    fps = cap.get(cv2.CAP_PROP_FPS) or 0
+    frames = cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0
+    cap.release()
+    return frames / fps if fps else None
+
+
+def _video_chain(preset, background):
+    w, h, fps = preset["width"], preset["height"], preset["fps"]
+    if preset.get("fit") == "crop":
+        geometry = f"scale={w}:{h}:force_original_aspect_ratio=increase:flags=lanczos,crop={w}:{h}"
+    else:
+        color = (background or "#000000").replace("#", "0x")
+        geometry = (f"scale={w}:{h}:force_original_aspect_ratio=decrease:flags=lanczos,"
+                    f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2:color={color}")
+    return f"{geometry},fps={fps},format=yuv420p"
+
+
+def build_command(master, outputs, background=None, audio=True):
+    """outputs: [(平台名, 预设, 输出路径)]；返回单个 ffmpeg 命令"""
+    n = len(outputs)
+    chains = [f"[0:v]split={n}" + "".join(f"[v{i}]" for i in range(n))]
+    for i, (_, preset, _) in enumerate(outputs):
+        chains.append(f"[v{i}]{_video_chain(preset, background)}[o{i}]")
+    if audio:
+        chains.append(f"[0:a]asplit={n}" + "".join(f"[a{i}]" for i in range(n)))
+
+    cmd = [shutil.which("ffmpeg") or "ffmpeg", "-y", "-v", "error", "-i", str(master),
+           "-filter_complex", ";".join(chains)]
+    for i, (_, preset, out_path) in enumerate(outputs):
+        cmd += [
+            "-map", f"[o{i}]",
+            "-c:v", "libx264", "-preset", "slow", "-profile:v", "high",
+            "-b:v", preset["video_bitrate"], "-maxrate", preset["maxrate"], "-bufsize", preset["bufsize"],
+            "-g", str(preset["fps"] * 2),
+        ]
+        if audio:
+            cmd += ["-map", f"[a{i}]", "-c:a", "aac", "-b:a", preset["audio_bitrate"], "-ar", "48000"]
+        cmd += ["-movflags", "+faststart", str(out_path)]
+    return cmd
+
+
+def publish_master(master, out_dir, platforms, background=None, dry_run=False):
+    master = Path(master)
+    outputs = []
+    for name in platforms:
+        out_path = Path(out_dir) / name / f"{master.stem}.mp4"
+        if not dry_run:
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+        outputs.append((name, PLATFORM_PRESETS[name], out_path))
+
+    cmd = build_command(master, outputs, background=background, audio=has_audio(master))
+    result = {"master": str(master), "outputs": {}, "ok": True}
+    if dry_run:
+        print(" ".join(cmd))
+        return result
+
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        result.update(ok=False, error=proc.stderr.strip()[-2000:])
+        return result
+
+    # 核对时长：每个平台输出都应与母版一致（帧率转换只允许一两帧的偏差）
+    master_duration = probe_duration(master)
+    for name, preset, out_path in outputs:
+        duration = probe_duration(out_path)
+        ok = (master_duration is not None and duration is not None
+              and abs(duration - master_duration) <= max(DURATION_TOLERANCE, 2.0 / preset["fps"]))
+        result["outputs"][name] = {
+            "file": str(out_path),
+            "duration": None if duration is None else round(duration, 3),
+            "master_duration": None if master_duration is None else round(master_duration, 3),
+            "ok": ok,
+        }
+        result["ok"] = result["ok"] and ok
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="母版一次解码，转出各平台发布版本")
+    parser.add_argument("masters", nargs="+", help="master videos or glob patterns")
+    parser.add_argument("--platforms", nargs="+", default=None,
+                        help="default: publishing.platforms in config.yml")
+    parser.add_argument("--out", default="output/publish")
+    parser.add_argument("--jobs", type=int, default=2, help="episodes transcoded in parallel")
+    parser.add_argument("--report", default=None, help="write results to this JSON file")
+    parser.add_argument("--dry-run", action="store_true", help="print the ffmpeg commands only")
+    args = parser.parse_args()
+
+    config = load_publishing_config()
+    platforms = args.platforms or config["platforms"] or list(PLATFORM_PRESETS)
+    unknown = [p for p in platforms if p not in PLATFORM_PRESETS]
+    if unknown:
+        parser.error(f"no preset for platform(s): {unknown}")
+
+    masters = []
+    for pattern in args.masters:
+        masters += sorted(glob.glob(pattern, recursive=True)) or [pattern]
+    if not args.dry_run and shutil.which("ffmpeg") is None:
+        print("ffmpeg not found on PATH")
+        return 1
+
+    def job(master):
+        return publish_master(master, args.out, platforms, background=config["background"],
+                              dry_run=args.dry_run)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(job, masters))
+
+    failed = 0
+    for r in results:
+        if args.dry_run:
+            continue
+        status = "✅" if r["ok"] else "❌"
+        print(f"{status} {r['master']}")
+        if r.get("error"):
+            print(f"    {r['error']}")
+        for name, o in r["outputs"].items():
+            print(f"    {name:9s} {o['duration']}s (master {o['master_duration']}s) {'ok' if o['ok'] else 'MISMATCH'}")
+        failed += not r["ok"]
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,10 @@
 from manim import *
 import numpy as np
 
+from scenes.templates.lod import lod_count
+from scenes.templates.neural_network import NeuralNetworkGraph, SignalPulses
+from scenes.templates.phyllotaxis import PhyllotaxisHead
+
 # ==================== 第1集：水母的钟形收缩 ====================
 class Episode01_JellyfishBell(Scene):
     """第1集：水母的钟形收缩 - 流体力学的数学之美"""
@@ -68,7 +72,7 @@ class Episode01_JellyfishBell(Scene):
         
         # 创建涡环粒子
         particles = VGroup()
-        for i in range(200):
+        for i in range(lod_count(200, minimum=50)):
             angle = np.random.uniform(0, 2*PI)
             r = np.random.uniform(1.5, 2.5)
             particle = Dot(
@@ -150,20 +154,14 @@ class Episode02_CellDivision(Scene):
         self.play(FadeIn(golden_text))
         
         # 创建螺旋排列
-        spiral_dots = VGroup()
-        for i in range(50):
-            angle = i * golden_angle * DEGREES
-            r = 0.1 * np.sqrt(i)
-            dot = Dot(
-                point=[r*np.cos(angle), r*np.sin(angle), 0],
-                radius=0.05,
-                color=interpolate_color(GREEN_E, YELLOW_E, i/50)
-            )
-            spiral_dots.add(dot)
+        spiral_dots = PhyllotaxisHead(
+            50, angle=golden_angle * DEGREES, scale=0.1, radius=0.05,
+            colors=[GREEN_E, YELLOW_E], color_bins=50
+        )
         
         self.play(
             FadeOut(cells),
-            *[Create(dot) for dot in spiral_dots],
+            Create(spiral_dots),
             run_time=5
         )
         
@@ -783,44 +781,30 @@ class Episode08_NeuralNetwork(Scene):
         self.clear()
         self.add(neuron_formula, network_text)
         
-        layers = []
         layer_sizes = [3, 5, 4, 2]
-        
-        for l, size in enumerate(layer_sizes):
-            layer = VGroup()
-            for i in range(size):
-                y_pos = (i - size/2) * 0.8
-                x_pos = (l - len(layer_sizes)/2) * 2
-                
-                n = Circle(radius=0.2, color=PURPLE_C, fill_opacity=0.5)
-                n.move_to([x_pos, y_pos, 0])
-                layer.add(n)
-            layers.append(layer)
-        
-        # 连接
-        connections = VGroup()
-        for l in range(len(layers) - 1):
-            for n1 in layers[l]:
-                for n2 in layers[l + 1]:
-                    line = Line(
-                        n1.get_center(),
-                        n2.get_center(),
-                        color=BLUE_C,
-                        stroke_opacity=0.3
-                    )
-                    connections.add(line)
-        
-        self.play(
-            *[Create(layer) for layer in layers],
-            Create(connections),
-            run_time=5
+        positions = [
+            [[(l - len(layer_sizes)/2) * 2, (i - size/2) * 0.8, 0] for i in range(size)]
+            for l, size in enumerate(layer_sizes)
+        ]
+        network = NeuralNetworkGraph(
+            positions=positions,
+            node_radius=0.2,
+            node_colors=PURPLE_C,
+            node_fill_opacity=0.5,
+            edge_color=BLUE_C,
+            edge_opacity=0.3,
+            pulse_color=YELLOW_C,
         )
         
-        # 前向传播动画
+        self.play(Create(network), run_time=5)
+        
+        # 前向传播动画：本层闪光，同时信号沿连接跑向下一层
         for _ in range(2):
-            for l in range(len(layers)):
+            for l in range(len(layer_sizes)):
+                pulses = [SignalPulses(network, layer=l)] if l < len(layer_sizes) - 1 else []
                 self.play(
-                    *[Flash(n, color=YELLOW_C) for n in layers[l]],
+                    *[Flash(p, color=YELLOW_C) for p in network.layer_positions(l)],
+                    *pulses,
                     run_time=0.5
                 )
         